@@ -0,0 +1,52 @@
+#! /usr/bin/env python3
+"""
+Builds optional mypyc-compiled versions of the model's hot modules.
+
+The compiled extensions are placed next to their sources, so Python picks them
+up automatically on import. Removing them (with --clean) falls back to the
+pure Python sources, which is how the GUI runs from a plain checkout.
+
+Usage:
+    python3 build_compiled.py          # build extensions in place
+    python3 build_compiled.py --clean  # remove extensions and build artifacts
+"""
+
+import glob
+import os
+import shutil
+import sys
+
+COMPILED_MODULES = ["model/card.py", "model/deck.py", "model/hand.py"]
+
+
+def build() -> None:
+    from mypyc.build import mypycify
+    from setuptools import setup
+
+    setup(
+        name="poker_model_compiled",
+        ext_modules=mypycify(COMPILED_MODULES, opt_level="3"),
+        script_args=["build_ext", "--inplace"],
+    )
+
+
+def clean() -> None:
+    patterns = ["model/*.so", "model/*.pyd", "*__mypyc*.so", "*__mypyc*.pyd"]
+    for pattern in patterns:
+        for path in glob.glob(pattern):
+            os.remove(path)
+            print(f"removed {path}")
+    shutil.rmtree("build", ignore_errors=True)
+
+
+def main() -> None:
+    # Extensions must be built relative to the project root so the import paths line up.
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    if "--clean" in sys.argv[1:]:
+        clean()
+    else:
+        build()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import importlib.machinery
+import importlib.util
+
+# Modules that build_compiled.py can compile with mypyc.
+COMPILABLE_MODULES = ("model.card", "model.deck", "model.hand")
+
+
+def backend() -> str:
+    """
+    Reports whether the hot model modules were loaded from compiled extensions.
+
+    Returns "compiled" when every compilable module resolves to an extension
+    module, "python" when none do, and "mixed" otherwise.
+    """
+    compiled = 0
+    for name in COMPILABLE_MODULES:
+        spec = importlib.util.find_spec(name)
+        if spec is not None and isinstance(spec.loader, importlib.machinery.ExtensionFileLoader):
+            compiled += 1
+    if compiled == len(COMPILABLE_MODULES):
+        return "compiled"
+    return "python" if compiled == 0 else "mixed"
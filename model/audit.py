@@ -0,0 +1,300 @@
+import math
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, Sequence
+from .deck import Deck
+from .rng import SecureRandom
+
+DECK_SIZE = 52
+CHUNK = 50_000
+DEFAULT_ALPHA = 0.001
+
+
+class DealAudit:
+    """
+    Fixed-memory frequency counts over a stream of deals.
+
+    Every deal is the cards dealt from a fresh deck, by card id in deal order.
+    Memory does not grow with the number of deals, and two audits of the same
+    deal size merge by adding their counts, so chunks audited in separate
+    processes combine exactly.
+
+    Attributes:
+        cards (int): Cards in every deal
+        deals (int): Deals counted
+        card_counts (array): Times each card id (index 0 unused) was dealt
+        position_counts (array): cards x 52, times card id - 1 was dealt at each position
+        pair_counts (array): 52 x 52, times the lower id - 1 (row) and higher id - 1
+        (column) were dealt together; only the upper triangle is used
+        within (list[int]): Sums n, x, y, xx, yy, xy of consecutive card ids in a deal
+        between (list[int]): The same sums for the last card of a deal and the
+        first card of the next
+        _last (int): Last card id of the previous deal, 0 before the first
+    """
+
+    def __init__(self, cards: int = 5) -> None:
+        if not 2 <= cards <= DECK_SIZE:
+            raise ValueError("Deals must have between 2 and 52 cards")
+        self.cards = cards
+        self.deals = 0
+        self.card_counts = array("Q", bytes(8 * (DECK_SIZE + 1)))
+        self.position_counts = array("Q", bytes(8 * cards * DECK_SIZE))
+        self.pair_counts = array("Q", bytes(8 * DECK_SIZE * DECK_SIZE))
+        self.within = [0] * 6
+        self.between = [0] * 6
+        self._last = 0
+
+    def add(self, ids: Sequence[int]) -> None:
+        """Counts one deal, given as card ids (1-52) in deal order."""
+        if len(ids) != self.cards:
+            raise ValueError(f"Expected a deal of {self.cards} cards")
+        card_counts = self.card_counts
+        position_counts = self.position_counts
+        pair_counts = self.pair_counts
+        for position, card_id in enumerate(ids):
+            card_counts[card_id] += 1
+            position_counts[position * DECK_SIZE + card_id - 1] += 1
+        ordered = sorted(ids)
+        for i, low in enumerate(ordered):
+            row = (low - 1) * DECK_SIZE - 1
+            for high in ordered[i + 1 :]:
+                pair_counts[row + high] += 1
+        _accumulate(self.within, ids)
+        if self._last:
+            _accumulate(self.between, (self._last, ids[0]))
+        self._last = ids[-1]
+        self.deals += 1
+
+    def merge(self, other: "DealAudit") -> None:
+        """Adds another audit's counts to this one."""
+        if other.cards != self.cards:
+            raise ValueError("Can only merge audits of the same deal size")
+        for mine, theirs in ((self.card_counts, other.card_counts), (self.position_counts, other.position_counts), (self.pair_counts, other.pair_counts)):
+            for i, count in enumerate(theirs):
+                if count:
+                    mine[i] += count
+        for i in range(6):
+            self.within[i] += other.within[i]
+            self.between[i] += other.between[i]
+        self.deals += other.deals
+
+    def report(self, alpha: float = DEFAULT_ALPHA) -> dict[str, Any]:
+        """
+        Runs the uniformity tests on the counts so far.
+
+        Returns:
+            dict: Deal count and, per test, its statistic, degrees of freedom
+            (chi-square tests), p-value and whether it passes at alpha
+        """
+        deals = self.deals
+        tests: dict[str, dict[str, Any]] = {}
+        # Each deal holds cards/52 of every card on average. Cards are dealt
+        # without replacement, so the plain statistic averages 52 - cards,
+        # not 51; the finite population correction restores chi-square(51).
+        tests["cards"] = _chi_square(self.card_counts[1:], deals * self.cards / DECK_SIZE)
+        if self.cards < DECK_SIZE:
+            tests["cards"]["statistic"] *= (DECK_SIZE - 1) / (DECK_SIZE - self.cards)
+            tests["cards"]["p_value"] = chi2_sf(tests["cards"]["statistic"], DECK_SIZE - 1)
+        # Every position holds each card with probability 1/52; one test per position, summed.
+        statistic = sum(_chi_square(self.position_counts[p * DECK_SIZE : (p + 1) * DECK_SIZE], deals / DECK_SIZE)["statistic"] for p in range(self.cards))
+        df = self.cards * (DECK_SIZE - 1)
+        tests["positions"] = {"statistic": statistic, "df": df, "p_value": chi2_sf(statistic, df)}
+        # Every unordered pair of cards is dealt together equally often.
+        tests["pairs"] = _pair_test(self.pair_counts, deals, self.cards)
+        # Cards drawn without replacement correlate at -1/51; separate deals not at all.
+        tests["serial_within"] = _correlation_test(self.within, -1 / (DECK_SIZE - 1))
+        tests["serial_between"] = _correlation_test(self.between, 0.0)
+        for test in tests.values():
+            test["passed"] = test["p_value"] >= alpha
+        return {"deals": deals, "cards": self.cards, "alpha": alpha, "passed": all(test["passed"] for test in tests.values()), "tests": tests}
+
+
+def _accumulate(sums: list[int], ids: Sequence[int]) -> None:
+    for x, y in zip(ids, ids[1:]):
+        sums[0] += 1
+        sums[1] += x
+        sums[2] += y
+        sums[3] += x * x
+        sums[4] += y * y
+        sums[5] += x * y
+
+
+def _chi_square(counts: Sequence[int], expected: float) -> dict[str, Any]:
+    if expected <= 0:
+        return {"statistic": 0.0, "df": len(counts) - 1, "p_value": 1.0}
+    statistic = sum((count - expected) ** 2 for count in counts) / expected
+    df = len(counts) - 1
+    return {"statistic": statistic, "df": df, "p_value": chi2_sf(statistic, df)}
+
+
+def _pair_spread(cards: int) -> float:
+    """
+    Returns the squared length of one deal's pair indicators once the card
+    and constant parts are removed, the same for every deal of cards cards.
+    """
+    n = DECK_SIZE
+    offset = cards * (cards - 1) / ((n - 1) * (n - 2))
+    row = (cards - 1) / (n - 2)
+    return math.comb(cards, 2) * (1 - 2 * row + offset) ** 2 + cards * (n - cards) * (offset - row) ** 2 + math.comb(n - cards, 2) * offset**2
+
+
+def _pair_test(pair_counts: Sequence[int], deals: int, cards: int) -> dict[str, Any]:
+    """
+    Tests pair counts for what the card test cannot see.
+
+    A card's pair counts add up to cards - 1 times its own count, so a
+    Pearson statistic over the pairs would also carry the card counts'
+    variation, and cards dealt together are not independent cells. The
+    counts are double centered instead, removing each card's share, which
+    leaves 1326 - 52 degrees of freedom. Under a fair dealer every deal adds
+    the same _pair_spread() spread evenly over them, so scaling by it gives
+    a chi-square statistic.
+    """
+    n = DECK_SIZE
+    df = math.comb(n, 2) - n
+    spread = _pair_spread(cards)
+    if not deals or spread <= 0:
+        return {"statistic": 0.0, "df": df, "p_value": 1.0}
+    rows = [0] * n
+    for low in range(n):
+        for high in range(low + 1, n):
+            count = pair_counts[low * n + high]
+            rows[low] += count
+            rows[high] += count
+    offset = sum(rows) / ((n - 1) * (n - 2))
+    squares = 0.0
+    for low in range(n):
+        base = offset - rows[low] / (n - 2)
+        for high in range(low + 1, n):
+            squares += (pair_counts[low * n + high] + base - rows[high] / (n - 2)) ** 2
+    statistic = squares * df / (deals * spread)
+    return {"statistic": statistic, "df": df, "p_value": chi2_sf(statistic, df)}
+
+
+def _correlation_test(sums: list[int], expected: float) -> dict[str, Any]:
+    n, sx, sy, sxx, syy, sxy = sums
+    if n < 3:
+        return {"statistic": 0.0, "correlation": 0.0, "p_value": 1.0}
+    covariance = n * sxy - sx * sy
+    spread = (n * sxx - sx * sx) * (n * syy - sy * sy)
+    r = covariance / math.sqrt(spread) if spread > 0 else 0.0
+    # Fisher's z transform is close to normal with standard error 1 / sqrt(n - 3).
+    z = (math.atanh(max(min(r, 0.999999), -0.999999)) - math.atanh(expected)) * math.sqrt(n - 3)
+    return {"statistic": z, "correlation": r, "p_value": math.erfc(abs(z) / math.sqrt(2))}
+
+
+def chi2_sf(statistic: float, df: int) -> float:
+    """Returns the probability that a chi-square variable with df degrees of freedom exceeds statistic."""
+    if statistic <= 0:
+        return 1.0
+    return _gamma_q(df / 2, statistic / 2)
+
+
+def _gamma_q(a: float, x: float) -> float:
+    # Regularized upper incomplete gamma function Q(a, x).
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        # Series for P(a, x), then Q = 1 - P.
+        term = total = 1 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1 - total * math.exp(log_prefix))
+    # Continued fraction for Q(a, x), evaluated with the modified Lentz method.
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10_000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def audit_chunk(deals: int, cards: int, seed: int, secure: bool = False) -> DealAudit:
+    """
+    Deals deals hands of cards from a fresh Deck each time and counts them.
+
+    Args:
+        seed (int): Seeds the deck's generator; ignored when secure
+        secure (bool): Deal from SecureRandom instead of random.Random
+    """
+    deck = Deck(SecureRandom() if secure else random.Random(seed))
+    audit = DealAudit(cards)
+    for _ in range(deals):
+        deck.reset_deck()
+        # A card's bit length is its id: bit (id - 1) is its only set bit.
+        audit.add([card.bit.bit_length() for card in deck.random_deal(cards)])
+    return audit
+
+
+def _chunks(deals: int, seed: int | None) -> Iterator[tuple[int, int]]:
+    rng = random.Random(seed)
+    for start in range(0, deals, CHUNK):
+        yield min(CHUNK, deals - start), rng.getrandbits(64)
+
+
+def run(deals: int, cards: int = 5, processes: int = 1, seed: int | None = None, secure: bool = False) -> DealAudit:
+    """
+    Audits deals deals in chunks of CHUNK, merging each chunk's counts as it
+    finishes, so memory stays fixed however many deals are audited.
+    """
+    total = DealAudit(cards)
+    chunks = list(_chunks(deals, seed))
+    sizes = [size for size, _ in chunks]
+    seeds = [chunk_seed for _, chunk_seed in chunks]
+    if processes <= 1:
+        for size, chunk_seed in chunks:
+            total.merge(audit_chunk(size, cards, chunk_seed, secure))
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            for part in executor.map(audit_chunk, sizes, [cards] * len(chunks), seeds, [secure] * len(chunks)):
+                total.merge(part)
+    return total
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lines = [f"Dealer audit: {report['deals']:,} deals of {report['cards']} cards, alpha {report['alpha']}"]
+    for name, test in report["tests"].items():
+        detail = f"chi2 {test['statistic']:.1f} on {test['df']} df" if "df" in test else f"r {test['correlation']:+.5f}, z {test['statistic']:+.2f}"
+        lines.append(f"  {name:<15}{detail:<32}p = {test['p_value']:.4f}  {'PASS' if test['passed'] else 'FAIL'}")
+    lines.append("Result: " + ("PASS" if report["passed"] else "FAIL"))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Audit Deck.random_deal for uniformity.")
+    parser.add_argument("--deals", type=int, default=1_000_000)
+    parser.add_argument("--cards", type=int, default=5, help="cards per deal")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--secure", action="store_true", help="audit the SecureRandom dealing mode")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    parser.add_argument("--output", help="also write the report as JSON")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    result = run(args.deals, args.cards, args.processes, args.seed, args.secure).report(args.alpha)
+    print(format_report(result))
+    print(f"{time.perf_counter() - start:.0f} s")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    raise SystemExit(0 if result["passed"] else 1)
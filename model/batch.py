@@ -0,0 +1,248 @@
+import random
+import sys
+from array import array
+from itertools import combinations, combinations_with_replacement
+from math import prod
+from typing import Sequence
+from .bitboard import SUIT_BITS, SUIT_MASK
+from .canonical import canonical
+from .draw import HAND_SIZE, RANKS, hand_value
+from .draw_table import table
+
+DECK_SIZE = 52
+_KEY_BYTES = 8
+_TO_ID = bytes((position + 1) & 0xFF for position in range(256))
+
+# Per card id (1-52; index 0 unused): a prime per rank, so a hand's product
+# identifies its rank multiset, and a one-hot suit bit, so ANDing a hand's
+# suit bits is non-zero only for a flush.
+_ID_PRIME = [0] + [(2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)[bit % 13] for bit in range(DECK_SIZE)]
+_ID_SUIT = [0] + [1 << bit // 13 for bit in range(DECK_SIZE)]
+_ID_RANK_BIT = [0] + [1 << bit % 13 for bit in range(DECK_SIZE)]
+_ID_SUIT_INDEX = [0] + [bit // 13 for bit in range(DECK_SIZE)]
+
+
+def pack(value: tuple[int, ...]) -> int:
+    """
+    Packs a Hand value tuple into an int that orders the same way: four bits
+    per entry, the category highest, with -1 (unused) stored as 0.
+    """
+    packed = 0
+    for entry in value:
+        packed = packed << 4 | max(entry, 0)
+    return packed
+
+
+def unpack(score: int) -> tuple[int, int, int, int, int, int]:
+    """Returns the Hand value tuple a packed score was made from."""
+    entries = [score >> shift & 0xF for shift in range(20, -1, -4)]
+    return tuple(entry or -1 for entry in entries)  # type: ignore
+
+
+def _build_product_scores() -> dict[int, int]:
+    # Maps the prime product of every non-flush rank multiset to its packed value.
+    primes = _ID_PRIME[1:14]
+    table = {}
+    for ranks in combinations_with_replacement(range(13), HAND_SIZE):
+        if max(ranks.count(rank) for rank in ranks) > 4:
+            continue
+        ranks_desc = tuple(RANKS[rank] for rank in reversed(ranks))
+        table[prod(primes[rank] for rank in ranks)] = pack(hand_value(ranks_desc, False))
+    return table
+
+
+def _build_flush_scores() -> dict[int, int]:
+    # Maps the rank mask of every five-distinct-rank hand to its packed value as a flush.
+    table = {}
+    for ranks in combinations(range(13), HAND_SIZE):
+        ranks_desc = tuple(RANKS[rank] for rank in reversed(ranks))
+        table[sum(1 << rank for rank in ranks)] = pack(hand_value(ranks_desc, True))
+    return table
+
+
+_PRODUCT_SCORES = _build_product_scores()
+_FLUSH_SCORES = _build_flush_scores()
+
+
+def score(ids: Sequence[int]) -> int:
+    """
+    Returns the packed value (see pack()) of five cards given as card ids;
+    a greater score is a stronger hand, exactly as with Hand.
+    """
+    a, b, c, d, e = ids
+    if _ID_SUIT[a] & _ID_SUIT[b] & _ID_SUIT[c] & _ID_SUIT[d] & _ID_SUIT[e]:
+        return _FLUSH_SCORES[_ID_RANK_BIT[a] | _ID_RANK_BIT[b] | _ID_RANK_BIT[c] | _ID_RANK_BIT[d] | _ID_RANK_BIT[e]]
+    return _PRODUCT_SCORES[_ID_PRIME[a] * _ID_PRIME[b] * _ID_PRIME[c] * _ID_PRIME[d] * _ID_PRIME[e]]
+
+
+class Deals:
+    """
+    Many independently shuffled decks, dealt to the same number of players.
+
+    Each row of decks is one game's deck in deal order: the first
+    players * hand_size ids are the hands, hand by hand, and the rest is the
+    stub that further cards come from.
+
+    Attributes:
+        games (int): Number of games (rows)
+        players (int): Hands dealt in each game
+        hand_size (int): Cards in each hand
+        decks (array): games x 52 card ids (1-52), row-major
+    """
+
+    def __init__(self, games: int, players: int, hand_size: int, decks: array) -> None:
+        if len(decks) != games * DECK_SIZE:
+            raise ValueError("Expected a full deck per game")
+        self.games = games
+        self.players = players
+        self.hand_size = hand_size
+        self.decks = decks
+
+    def hand(self, game: int, player: int) -> array:
+        """Returns one player's card ids in one game."""
+        start = game * DECK_SIZE + player * self.hand_size
+        return self.decks[start : start + self.hand_size]
+
+    def stub(self, game: int) -> array:
+        """Returns one game's undealt card ids in deal order."""
+        start = game * DECK_SIZE
+        return self.decks[start + self.players * self.hand_size : start + DECK_SIZE]
+
+
+def deal(games: int, players: int, hand_size: int = HAND_SIZE, seed: int | None = None) -> Deals:
+    """
+    Shuffles and deals games decks at once.
+
+    Each deck is an argsort of 52 random 64-bit keys drawn in one block from
+    a generator seeded with seed, so the same seed always gives the same deals.
+    Ties between keys (probability about 2**-43 per deck) keep id order.
+
+    Raises:
+        ValueError: If the counts are negative or the hands need more than 52 cards
+    """
+    if games < 0 or players < 1 or hand_size < 1:
+        raise ValueError("Need a non-negative number of games and at least one player and card")
+    if players * hand_size > DECK_SIZE:
+        raise ValueError(f"Cannot deal {players} hands of {hand_size} from one deck")
+    rng = random.Random(seed)
+    keys = array("Q", rng.randbytes(games * DECK_SIZE * _KEY_BYTES))
+    if sys.byteorder == "big":
+        keys.byteswap()
+    order = array("B")
+    positions = range(DECK_SIZE)
+    for game in range(games):
+        row = keys[game * DECK_SIZE : (game + 1) * DECK_SIZE]
+        order.extend(sorted(positions, key=row.__getitem__))
+    # Positions are 0-51; card ids are 1-52.
+    return Deals(games, players, hand_size, array("B", order.tobytes().translate(_TO_ID)))
+
+
+def scores(deals: Deals) -> array:
+    """Returns the packed score of every hand, games x players, row-major."""
+    if deals.hand_size != HAND_SIZE:
+        raise ValueError("Showdowns need 5 card hands")
+    decks = deals.decks
+    out = array("L")
+    dealt = deals.players * HAND_SIZE
+    for start in range(0, len(decks), DECK_SIZE):
+        for first in range(start, start + dealt, HAND_SIZE):
+            out.append(score(decks[first : first + HAND_SIZE]))
+    return out
+
+
+def showdown(deals: Deals) -> list[tuple[int, ...]]:
+    """Returns the winning seats of every game; more than one seat means a split pot."""
+    players = deals.players
+    all_scores = scores(deals)
+    winners = []
+    for start in range(0, len(all_scores), players):
+        row = all_scores[start : start + players]
+        best = max(row)
+        winners.append(tuple(seat for seat in range(players) if row[seat] == best))
+    return winners
+
+
+def hold_positions(ids: Sequence[int], policy: dict[int, int]) -> list[int]:
+    """
+    Returns the positions in a five-card hand that policy keeps.
+
+    Args:
+        ids (Sequence[int]): The hand's card ids
+        policy (dict[int, int]): Maps suit-canonical hand key to a hold mask
+        over the hand in canonical order (suits largest first, then rank), the
+        format of the draw table; hands missing from it keep every card
+    """
+    board = 0
+    for card_id in ids:
+        board |= 1 << (card_id - 1)
+    mask = policy.get(canonical(board))
+    if mask is None:
+        return list(range(len(ids)))
+    # Same order as draw_table.canonical(): suits by descending rank mask (ties
+    # in suit order), then ranks ascending; ids already ascend by rank in a suit.
+    suit_masks = [-(board >> SUIT_BITS * suit & SUIT_MASK) for suit in range(4)]
+    suit_position = [0] * 4
+    for position, suit in enumerate(sorted(range(4), key=suit_masks.__getitem__)):
+        suit_position[suit] = position
+    sort_keys = [suit_position[_ID_SUIT_INDEX[card_id]] << 6 | card_id for card_id in ids]
+    order = sorted(range(len(ids)), key=sort_keys.__getitem__)
+    return sorted(order[i] for i in range(len(ids)) if mask >> i & 1)
+
+
+def draw(deals: Deals, policy: dict[int, int] | None = None) -> tuple[Deals, array]:
+    """
+    Plays the exchange of a five-card draw round in every game.
+
+    Seats exchange in order: each keeps the cards its hold mask selects and
+    takes replacements from the top of its game's stub.
+
+    Args:
+        deals (Deals): Games dealt with 5 card hands
+        policy (dict[int, int] | None): Hold masks by hand class, see
+        hold_positions(); defaults to the shipped draw table
+
+    Returns:
+        tuple: The games after the draw, as Deals whose rows hold the final
+        hands, then the discards, then what is left of the stub; and the
+        number of cards each hand exchanged, games x players
+
+    Raises:
+        ValueError: If the hands are not 5 cards or a stub runs out
+    """
+    if deals.hand_size != HAND_SIZE:
+        raise ValueError("Draw needs 5 card hands")
+    if policy is None:
+        policy = table()
+    decks = deals.decks
+    players = deals.players
+    dealt = players * HAND_SIZE
+    drawn = array("B")
+    exchanged = array("B")
+    for start in range(0, len(decks), DECK_SIZE):
+        row = decks[start : start + DECK_SIZE]
+        top = dealt
+        discards: list[int] = []
+        for first in range(0, dealt, HAND_SIZE):
+            hand = row[first : first + HAND_SIZE]
+            keep = hold_positions(hand, policy)
+            count = HAND_SIZE - len(keep)
+            if top + count > DECK_SIZE:
+                raise ValueError("Not enough cards left in the stub to draw")
+            drawn.extend([hand[i] for i in keep])
+            drawn.extend(row[top : top + count])
+            discards.extend(hand[i] for i in range(HAND_SIZE) if i not in keep)
+            exchanged.append(count)
+            top += count
+        drawn.extend(discards)
+        drawn.extend(row[top:])
+    return Deals(deals.games, players, HAND_SIZE, drawn), exchanged
+
+
+def win_shares(winners: list[tuple[int, ...]], players: int) -> list[float]:
+    """Returns each seat's share of the pots won, splitting tied pots equally."""
+    shares = [0.0] * players
+    for seats in winners:
+        for seat in seats:
+            shares[seat] += 1 / len(seats)
+    total = len(winners) or 1
+    return [share / total for share in shares]
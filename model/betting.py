@@ -0,0 +1,275 @@
+from array import array
+from typing import Any, Sequence
+
+
+class Betting:
+    """
+    Chip accounting and action order for the betting in one hand.
+
+    Stacks and contributions are kept in integer arrays indexed by seat.
+    Seats act clockwise starting left of the button (or left of the big
+    blind before the first street closes). Side pots for all-in players are
+    derived from the total each seat committed to the hand.
+
+    Attributes:
+        stacks (array): Chips each seat has behind
+        committed (array): Chips each seat put in the pot this hand
+        street (array): Chips each seat put in on the current street
+        folded (bytearray): 1 for seats that folded
+        button (int): Seat of the dealer button
+        current_bet (int): Amount each seat must have in on this street to stay in
+        min_raise (int): Smallest legal raise increment on this street
+        big_blind (int): Big blind posted this hand, 0 without blinds; every
+        street's minimum bet
+        to_act (int): Seat whose turn it is, -1 when the street is complete
+        _acted (bytearray): 1 for seats that acted since the last full raise
+    """
+
+    def __init__(self, stacks: Sequence[int], button: int = 0) -> None:
+        if len(stacks) < 2:
+            raise ValueError("Need at least 2 seats to bet")
+        self.stacks = array("q", stacks)
+        num_seats = len(self.stacks)
+        self.committed = array("q", bytes(8 * num_seats))
+        self.street = array("q", bytes(8 * num_seats))
+        self.folded = bytearray(num_seats)
+        self._acted = bytearray(num_seats)
+        self.button = button % num_seats
+        self.current_bet = 0
+        self.min_raise = 0
+        self.big_blind = 0
+        self.to_act = self._next_to_act(self.button)
+
+    @property
+    def num_seats(self) -> int:
+        return len(self.stacks)
+
+    @property
+    def pot(self) -> int:
+        return sum(self.committed)
+
+    def live_seats(self) -> list[int]:
+        return [seat for seat in range(self.num_seats) if not self.folded[seat]]
+
+    def is_all_in(self, seat: int) -> bool:
+        return not self.folded[seat] and self.stacks[seat] == 0 and self.committed[seat] > 0
+
+    def _can_act(self, seat: int) -> bool:
+        return not self.folded[seat] and self.stacks[seat] > 0
+
+    def _next_to_act(self, after: int) -> int:
+        """Returns the next seat after `after` that still has to act, or -1."""
+        if self.street_complete():
+            return -1
+        num_seats = self.num_seats
+        for step in range(1, num_seats + 1):
+            seat = (after + step) % num_seats
+            if self._can_act(seat) and (not self._acted[seat] or self.street[seat] < self.current_bet):
+                return seat
+        return -1
+
+    def street_complete(self) -> bool:
+        for seat in range(self.num_seats):
+            if self.folded[seat]:
+                continue
+            if self.stacks[seat] > 0 and (not self._acted[seat] or self.street[seat] < self.current_bet):
+                return False
+        return True
+
+    def can_raise(self, seat: int) -> bool:
+        """
+        False for a seat that acted and then faced only an all-in short of a
+        full raise: betting is not reopened, so it may only call or fold.
+        """
+        return self._can_act(seat) and not self._acted[seat]
+
+    def hand_over(self) -> bool:
+        """True once at most one seat is left that has not folded."""
+        return len(self.live_seats()) <= 1
+
+    def _commit(self, seat: int, amount: int) -> int:
+        amount = min(amount, self.stacks[seat])
+        self.stacks[seat] -= amount
+        self.street[seat] += amount
+        self.committed[seat] += amount
+        return amount
+
+    def _check_turn(self, seat: int) -> None:
+        if seat != self.to_act:
+            raise ValueError(f"It is not seat {seat}'s turn to act")
+
+    def _finish_action(self, seat: int) -> None:
+        self._acted[seat] = 1
+        self.to_act = -1 if self.hand_over() else self._next_to_act(seat)
+
+    def post_antes(self, ante: int) -> None:
+        """Every seat puts in the ante; antes do not count toward the street's bet."""
+        for seat in range(self.num_seats):
+            paid = self._commit(seat, ante)
+            self.street[seat] -= paid
+
+    def post_blinds(self, small_blind: int, big_blind: int) -> None:
+        """Posts blinds left of the button; heads-up the button posts the small blind."""
+        num_seats = self.num_seats
+        small_seat = self.button if num_seats == 2 else (self.button + 1) % num_seats
+        big_seat = (small_seat + 1) % num_seats
+        self._commit(small_seat, small_blind)
+        self._commit(big_seat, big_blind)
+        self.current_bet = big_blind
+        self.min_raise = big_blind
+        self.big_blind = big_blind
+        self.to_act = self._next_to_act(big_seat)
+
+    def fold(self, seat: int) -> None:
+        self._check_turn(seat)
+        self.folded[seat] = 1
+        self._finish_action(seat)
+
+    def check(self, seat: int) -> None:
+        self._check_turn(seat)
+        if self.street[seat] < self.current_bet:
+            raise ValueError("Cannot check facing a bet")
+        self._finish_action(seat)
+
+    def call(self, seat: int) -> int:
+        """Matches the current bet (or goes all-in for less) and returns the chips added."""
+        self._check_turn(seat)
+        paid = self._commit(seat, self.current_bet - self.street[seat])
+        self._finish_action(seat)
+        return paid
+
+    def bet(self, seat: int, amount: int) -> None:
+        if self.current_bet > 0:
+            raise ValueError("Cannot bet when there is already a bet; raise instead")
+        self.raise_to(seat, amount)
+
+    def raise_to(self, seat: int, total: int) -> None:
+        """
+        Raises the street bet to `total`. A raise must be at least the previous
+        raise increment unless it puts the seat all-in. An all-in short of a
+        full raise does not let seats that already acted raise again.
+        """
+        self._check_turn(seat)
+        if not self.can_raise(seat):
+            raise ValueError("Betting was not reopened by a full raise; call or fold")
+        if total <= self.current_bet:
+            raise ValueError("A raise must be more than the current bet")
+        needed = total - self.street[seat]
+        if needed > self.stacks[seat]:
+            raise ValueError("Not enough chips for that raise")
+        increment = total - self.current_bet
+        all_in = needed == self.stacks[seat]
+        if increment < self.min_raise and not all_in:
+            raise ValueError(f"Minimum raise is to {self.current_bet + self.min_raise}")
+        self._commit(seat, needed)
+        if increment >= self.min_raise:
+            # A full raise reopens the action for everyone else.
+            self.min_raise = increment
+            for other in range(self.num_seats):
+                self._acted[other] = 0
+        self.current_bet = total
+        self._finish_action(seat)
+
+    def all_in(self, seat: int) -> None:
+        """Puts in the seat's whole stack, or just calls when it may not raise."""
+        total = self.street[seat] + self.stacks[seat]
+        if total > self.current_bet and self.can_raise(seat):
+            self.raise_to(seat, total)
+        else:
+            self.call(seat)
+
+    def next_street(self) -> None:
+        """Starts a new betting street; action starts left of the button and the minimum bet is the big blind."""
+        if not self.street_complete():
+            raise ValueError("Betting on this street is not finished")
+        for seat in range(self.num_seats):
+            self.street[seat] = 0
+            self._acted[seat] = 0
+        self.current_bet = 0
+        self.min_raise = self.big_blind
+        self.to_act = -1 if self.hand_over() else self._next_to_act(self.button)
+
+    def _layers(self) -> tuple[list[int], list[tuple[int, int]]]:
+        """
+        Splits the pot into layers by contribution level.
+
+        Returns the seats sorted by contribution, and a list of (amount, start)
+        pairs: each pot's eligible seats are the live seats in order[start:].
+        """
+        committed = self.committed
+        folded = self.folded
+        num_seats = self.num_seats
+        order = sorted(range(num_seats), key=committed.__getitem__)
+        layers: list[tuple[int, int]] = []
+        prev_level = 0
+        amount = 0
+        start = 0
+        for i, seat in enumerate(order):
+            level = committed[seat]
+            if level > prev_level:
+                amount += (level - prev_level) * (num_seats - i)
+                prev_level = level
+            # A live seat's eligibility ends at its own level, which closes a pot.
+            if not folded[seat] and (i + 1 == num_seats or committed[order[i + 1]] > level):
+                if amount:
+                    layers.append((amount, start))
+                    amount = 0
+                start = i + 1
+        if amount:
+            # Chips from folded seats above every live seat go to the last pot.
+            if layers:
+                last_amount, last_start = layers[-1]
+                layers[-1] = (last_amount + amount, last_start)
+            else:
+                layers.append((amount, 0))
+        return order, layers
+
+    def pots(self) -> list[tuple[int, list[int]]]:
+        """Returns (amount, eligible seats) for the main pot followed by each side pot."""
+        order, layers = self._layers()
+        return [(amount, sorted(seat for seat in order[start:] if not self.folded[seat])) for amount, start in layers]
+
+    def resolve(self, strengths: Sequence[Any]) -> array:
+        """
+        Awards every pot to the strongest eligible seats and credits their stacks.
+
+        Args:
+            strengths (Sequence): Comparable hand strength per seat, e.g. Hand
+            objects or evaluator ranks; higher is better. Entries for folded
+            seats are ignored.
+
+        Returns:
+            array: Chips won by each seat
+        """
+        num_seats = self.num_seats
+        payouts = array("q", bytes(8 * num_seats))
+        order, layers = self._layers()
+        if not layers:
+            return payouts
+
+        # Walk seats from the largest contribution down, tracking the best live
+        # hand in each suffix of `order`, so every pot finds its winners in O(1).
+        best_from: list[list[int]] = [[] for _ in range(num_seats + 1)]
+        best: list[int] = []
+        for i in range(num_seats - 1, -1, -1):
+            seat = order[i]
+            if not self.folded[seat]:
+                if not best or strengths[best[0]] < strengths[seat]:
+                    best = [seat]
+                elif strengths[best[0]] == strengths[seat]:
+                    best = best + [seat]
+            best_from[i] = best
+
+        for amount, start in layers:
+            winners = best_from[start]
+            if not winners:
+                continue
+            # Odd chips go to the winners closest to the left of the button.
+            winners = sorted(winners, key=lambda seat: (seat - self.button - 1) % num_seats)
+            share, odd_chips = divmod(amount, len(winners))
+            for i, seat in enumerate(winners):
+                payouts[seat] += share + (1 if i < odd_chips else 0)
+
+        for seat in range(num_seats):
+            self.stacks[seat] += payouts[seat]
+        return payouts
@@ -0,0 +1,76 @@
+from typing import Iterable
+from .card import Card
+
+# Cards are bits in a 52-bit board: bit (Deck.card_id(card) - 1), so each
+# suit owns 13 consecutive bits with the deuce lowest.
+SUIT_BITS = 13
+SUIT_MASK = (1 << SUIT_BITS) - 1
+BOARD_BITS = 4 * SUIT_BITS
+FULL_BOARD = (1 << BOARD_BITS) - 1
+
+# The deuce of every suit; shifted left by (rank - 2) it selects that rank's four cards.
+_RANK_COLUMN = 1 | 1 << SUIT_BITS | 1 << 2 * SUIT_BITS | 1 << 3 * SUIT_BITS
+
+
+def board(cards: Iterable[Card]) -> int:
+    """Returns the 52-bit board with a bit set for each card."""
+    mask = 0
+    for card in cards:
+        mask |= card.bit
+    return mask
+
+
+def _build_suit_bits() -> list[list[tuple[int, ...]]]:
+    # For each suit, maps every 13-bit mask to the board bit indexes it sets, lowest first.
+    tables = []
+    for suit in range(4):
+        table: list[tuple[int, ...]] = [()] * (1 << SUIT_BITS)
+        for mask in range(1, 1 << SUIT_BITS):
+            high = mask.bit_length() - 1
+            table[mask] = table[mask ^ 1 << high] + (suit * SUIT_BITS + high,)
+        tables.append(table)
+    return tables
+
+
+_SUIT_BIT_TABLES = _build_suit_bits()
+
+
+def bits(board: int) -> tuple[int, ...]:
+    """Returns the index of every set bit, lowest first, with four table lookups."""
+    clubs, diamonds, hearts, spades = _SUIT_BIT_TABLES
+    return (
+        clubs[board & SUIT_MASK]
+        + diamonds[board >> SUIT_BITS & SUIT_MASK]
+        + hearts[board >> 2 * SUIT_BITS & SUIT_MASK]
+        + spades[board >> 3 * SUIT_BITS & SUIT_MASK]
+    )
+
+
+def suit_mask(board: int, suit: int) -> int:
+    """Returns the 13-bit rank mask (bit rank - 2) of the cards in one suit, by Card.SUITS index."""
+    return board >> SUIT_BITS * suit & SUIT_MASK
+
+
+def rank_mask(board: int) -> int:
+    """Returns the 13-bit mask of ranks present in any suit."""
+    return (board | board >> SUIT_BITS | board >> 2 * SUIT_BITS | board >> 3 * SUIT_BITS) & SUIT_MASK
+
+
+def suit_counts(board: int) -> tuple[int, int, int, int]:
+    """Returns the number of cards in each suit, in Card.SUITS order."""
+    return (
+        (board & SUIT_MASK).bit_count(),
+        (board >> SUIT_BITS & SUIT_MASK).bit_count(),
+        (board >> 2 * SUIT_BITS & SUIT_MASK).bit_count(),
+        (board >> 3 * SUIT_BITS).bit_count(),
+    )
+
+
+def rank_count(board: int, rank: int) -> int:
+    """Returns how many cards of a rank (2-14) are on the board."""
+    return (board >> (rank - 2) & _RANK_COLUMN).bit_count()
+
+
+def rank_counts(board: int) -> list[int]:
+    """Returns a histogram indexed by rank, 2-14, like the one Hand builds; entries 0 and 1 are unused."""
+    return [0, 0] + [(board >> bit & _RANK_COLUMN).bit_count() for bit in range(SUIT_BITS)]
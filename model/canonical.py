@@ -0,0 +1,153 @@
+from typing import Iterable
+from .bitboard import BOARD_BITS, SUIT_BITS, SUIT_MASK, board
+from .card import Card
+
+
+def canonical(hand: int, dead: int = 0) -> int:
+    """
+    Maps a hand and its dead cards to a key shared by every suit relabelling.
+
+    Each suit is summarized by its hand ranks and dead ranks, and the suits
+    are sorted so the largest summary takes the highest suit's bits. The
+    result packs the canonical hand board in the low 52 bits and the canonical
+    dead board above it, so with no dead cards it is simply the canonical
+    hand board. Only integer operations are used: no lists or tuples are
+    built per call.
+
+    Args:
+        hand (int): Board of the cards held
+        dead (int): Board of cards known to be out of play, e.g. discards or
+        other players' up cards
+    """
+    a = (hand & SUIT_MASK) << SUIT_BITS | (dead & SUIT_MASK)
+    b = (hand >> SUIT_BITS & SUIT_MASK) << SUIT_BITS | (dead >> SUIT_BITS & SUIT_MASK)
+    c = (hand >> 2 * SUIT_BITS & SUIT_MASK) << SUIT_BITS | (dead >> 2 * SUIT_BITS & SUIT_MASK)
+    d = (hand >> 3 * SUIT_BITS) << SUIT_BITS | (dead >> 3 * SUIT_BITS)
+    # Sorting network for four values: a <= b <= c <= d afterwards.
+    if a > b:
+        a, b = b, a
+    if c > d:
+        c, d = d, c
+    if a > c:
+        a, c = c, a
+    if b > d:
+        b, d = d, b
+    if b > c:
+        b, c = c, b
+    canonical_hand = a >> SUIT_BITS | (b >> SUIT_BITS) << SUIT_BITS | (c >> SUIT_BITS) << 2 * SUIT_BITS | (d >> SUIT_BITS) << 3 * SUIT_BITS
+    if not dead:
+        return canonical_hand
+    canonical_dead = (a & SUIT_MASK) | (b & SUIT_MASK) << SUIT_BITS | (c & SUIT_MASK) << 2 * SUIT_BITS | (d & SUIT_MASK) << 3 * SUIT_BITS
+    return canonical_dead << BOARD_BITS | canonical_hand
+
+
+def canonical_cards(cards: Iterable[Card], dead: Iterable[Card] = ()) -> int:
+    return canonical(board(cards), board(dead))
+
+
+def suit_order(hand: int, dead: int = 0) -> list[int]:
+    """
+    Returns the suits in canonical order, largest summary first, as used for
+    the highest bits by canonical(). Suits with equal summaries keep their
+    Card.SUITS order.
+    """
+    summaries = [(hand >> SUIT_BITS * suit & SUIT_MASK) << SUIT_BITS | (dead >> SUIT_BITS * suit & SUIT_MASK) for suit in range(4)]
+    return sorted(range(4), key=lambda suit: -summaries[suit])
+
+
+def _suit_masks_by_size() -> list[list[int]]:
+    by_size: list[list[int]] = [[] for _ in range(SUIT_BITS + 1)]
+    for mask in range(1 << SUIT_BITS):
+        by_size[mask.bit_count()].append(mask)
+    return by_size
+
+
+class CanonicalIndex:
+    """
+    Dense numbering of the suit-canonical hands of a given size, optionally
+    with a given number of dead cards.
+
+    Lets tables keyed by hand use an array slot per canonical class instead of
+    one per hand, e.g. 134,459 slots instead of 2,598,960 for five cards.
+
+    Attributes:
+        num_cards (int): Cards in each hand
+        num_dead (int): Dead cards alongside each hand
+        _boards (list[int]): Canonical keys in index order (ascending), packed
+        as canonical() packs them
+        _index (dict[int, int]): Maps canonical key to its index
+    """
+
+    def __init__(self, num_cards: int, num_dead: int = 0) -> None:
+        if not 0 <= num_cards <= BOARD_BITS:
+            raise ValueError("Hands must have between 0 and 52 cards")
+        if not 0 <= num_dead <= BOARD_BITS - num_cards:
+            raise ValueError("Hand and dead cards must fit in one deck")
+        self.num_cards = num_cards
+        self.num_dead = num_dead
+        by_size = _suit_masks_by_size()
+        boards: list[int] = []
+
+        # Choose each suit's hand and dead masks from the highest suit down,
+        # never summarizing larger than the suit above, so each canonical key
+        # is produced exactly once. canonical() sorts suits by the same summary.
+        def fill(suit: int, hand_left: int, dead_left: int, limit: int, hand: int, dead: int) -> None:
+            if suit == 0:
+                # The lowest suit takes every card left.
+                if hand_left + dead_left > SUIT_BITS:
+                    return
+                for hand_mask in by_size[hand_left]:
+                    if hand_mask > limit >> SUIT_BITS:
+                        break
+                    if not dead_left:
+                        boards.append(dead << BOARD_BITS | hand | hand_mask)
+                        continue
+                    for dead_mask in by_size[dead_left]:
+                        if dead_mask & hand_mask:
+                            continue
+                        if (hand_mask << SUIT_BITS | dead_mask) > limit:
+                            break
+                        boards.append((dead | dead_mask) << BOARD_BITS | hand | hand_mask)
+                return
+            shift = SUIT_BITS * suit
+            hand_limit = limit >> SUIT_BITS
+            for hand_size in range(min(hand_left, SUIT_BITS) + 1):
+                for dead_size in range(min(dead_left, SUIT_BITS - hand_size) + 1):
+                    # The remaining suits must be able to hold what is left.
+                    if hand_left + dead_left - hand_size - dead_size > shift:
+                        continue
+                    for hand_mask in by_size[hand_size]:
+                        if hand_mask > hand_limit:
+                            break
+                        if not dead_size:
+                            fill(suit - 1, hand_left - hand_size, dead_left, hand_mask << SUIT_BITS, hand | hand_mask << shift, dead)
+                            continue
+                        for dead_mask in by_size[dead_size]:
+                            if dead_mask & hand_mask:
+                                continue
+                            summary = hand_mask << SUIT_BITS | dead_mask
+                            if summary > limit:
+                                break
+                            fill(suit - 1, hand_left - hand_size, dead_left - dead_size, summary, hand | hand_mask << shift, dead | dead_mask << shift)
+
+        fill(3, num_cards, num_dead, (1 << 2 * SUIT_BITS) - 1, 0, 0)
+        boards.sort()
+        self._boards = boards
+        self._index = {canonical_board: i for i, canonical_board in enumerate(boards)}
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+    def index(self, hand: int, dead: int = 0) -> int:
+        """Returns the index of the canonical class of a hand board and its dead cards."""
+        if hand.bit_count() != self.num_cards:
+            raise ValueError(f"Expected a {self.num_cards} card hand")
+        if dead.bit_count() != self.num_dead:
+            raise ValueError(f"Expected {self.num_dead} dead cards")
+        if hand & dead:
+            raise ValueError("Dead cards cannot be in the hand")
+        return self._index[canonical(hand, dead)]
+
+    def board(self, index: int) -> int:
+        """Returns the canonical key with the given index: the hand board, with the dead board above bit 52."""
+        return self._boards[index]
@@ -1,13 +1,18 @@
+from typing import ClassVar
+
+
 class Card:
     """
     Represents a standard playing card with a value and suit.
 
     Attributes:
         _rank (Rank): The card's value (2-10, Jack, Queen, King, Ace)
+        _rank_value (int): Numeric value of _rank, 2-14
+        _bit (int): The card's single bit in a 52-bit board
         _suit_value (Suit): The card's suit (Clubs, Diamonds, Hearts, Spades)
     """
 
-    RANK_DICT = {
+    RANK_DICT: ClassVar[dict[str, int]] = {
         "2": 2,
         "3": 3,
         "4": 4,
@@ -38,18 +43,31 @@ class Card:
     #     "Ace": 14,
     # }
 
-    SUIT_SET = {"♣", "♦", "♥", "♠"}
+    SUIT_SET: ClassVar[set[str]] = {"♣", "♦", "♥", "♠"}
     # SUIT_SET = {"C", "D", "H", "S"}
     # SUIT_SET = {"Clubs", "Diamonds", "Hearts", "Spades"}
+    # Fixed suit order so card ids are identical in every process.
+    SUITS: ClassVar[tuple[str, ...]] = ("♣", "♦", "♥", "♠")
 
     # def __init__(self, rank: Rank, suit: Suit):
     def __init__(self, rank: str, suit: str):
         self._rank = rank
         self._suit = suit
+        # Looked up once here because hand evaluation reads it for every card;
+        # 0 marks an invalid rank, which raises when the rank is read.
+        self._rank_value = self.RANK_DICT.get(rank, 0)
+        # Bit (Deck.card_id(card) - 1) of a 52-bit board, 0 for an invalid card.
+        self._bit = 1 << (self.SUITS.index(suit) * 13 + self._rank_value - 2) if self._rank_value and suit in self.SUITS else 0
 
     @property
     def rank(self) -> int:
-        return self.RANK_DICT[self._rank]
+        if not self._rank_value:
+            return self.RANK_DICT[self._rank]
+        return self._rank_value
+
+    @property
+    def bit(self) -> int:
+        return self._bit
 
     @property
     def rankstr(self) -> str:
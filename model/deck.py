@@ -1,53 +1,76 @@
 import random
+from .bitboard import FULL_BOARD, bits
 from .card import Card
 
+_CARD_IDS: dict[tuple[str, str], int] = {
+    (rank, suit): s * len(Card.RANK_DICT) + r + 1
+    for s, suit in enumerate(Card.SUITS)
+    for r, rank in enumerate(Card.RANK_DICT)
+}
+
 
 class Deck:
     """
     Represents a standard 52-card playing deck.
 
     Manages deck state including dealt cards and provides methods for dealing
-    cards randomly.
+    cards randomly. Each deck draws from its own generator rather than the
+    shared module-level one, so decks can deal from different threads.
 
     Attributes:
         _deck (dict[int, Card]): Maps card IDs to Card objects
-        _dealt (list[int]): List of IDs of cards that have been dealt
+        _dealt (int): Board of cards that have been dealt, bit (card ID - 1) per card
+        _rng (random.Random): Source of every shuffle, seedable for repeatable deals
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rng: random.Random | None = None) -> None:
         self._deck: dict[int, Card] = {}
-        self._dealt: list[int] = []
+        self._dealt = 0
+        self._rng = rng if rng is not None else random.Random()
         self._build_deck()
 
     def _build_deck(self) -> None:
         count = 1
-        for suit in Card.SUIT_SET:
+        for suit in Card.SUITS:
             for rank in Card.RANK_DICT:
                 new_card = Card(rank, suit)
                 self._deck[count] = new_card
                 count += 1
 
+    @staticmethod
+    def card_id(card: Card) -> int:
+        # Ids run 1-52, suit by suit in Card.SUITS order and rank by rank in Card.RANK_DICT order.
+        return _CARD_IDS[(card.rankstr, card.suit)]
+
+    def available(self) -> int:
+        """Returns the board of cards not yet dealt."""
+        return FULL_BOARD & ~self._dealt
+
+    def cards(self, board: int) -> list[Card]:
+        """Returns the deck's Card objects for a board, in card ID order."""
+        return [self._deck[bit + 1] for bit in bits(board)]
+
+    def remove(self, board: int) -> None:
+        """Takes cards out of play without dealing them, e.g. cards known to be dead."""
+        self._dealt |= board
+
     def random_deal(self, hand_size: int) -> list[Card]:
         hand = []
-        # Convert range to set and remove dealt cards via set subtraction.
-        available_cards = set(range(1, len(self._deck) + 1)) - set(self._dealt)
-        # Convert back to list for random.sample.
-        sample = random.sample(list(available_cards), hand_size)
+        # Sampling the available bits in ascending order picks the same cards as
+        # sampling the available card IDs would.
+        sample = self._rng.sample(bits(FULL_BOARD & ~self._dealt), hand_size)
 
-        for card_num in sample:
-            hand.append(self._deck[card_num])
-            self._dealt.append(card_num)
+        for bit in sample:
+            hand.append(self._deck[bit + 1])
+            self._dealt |= 1 << bit
 
         return hand
 
     def random_deal_one(self) -> Card:
-        # Convert range to set and remove dealt cards via set subtraction.
-        available_cards = set(range(1, len(self._deck) + 1)) - set(self._dealt)
-        # Convert back to list for random.sample.
-        sample = random.sample(list(available_cards), 1)
-        # random.sample return list. We access first/only element.
-        self._dealt.append(sample[0])
-        return self._deck[sample[0]]
+        # random.sample returns a list. We access first/only element.
+        bit = self._rng.sample(bits(FULL_BOARD & ~self._dealt), 1)[0]
+        self._dealt |= 1 << bit
+        return self._deck[bit + 1]
 
     def reset_deck(self) -> None:
-        self._dealt.clear()
+        self._dealt = 0
@@ -0,0 +1,213 @@
+from collections import Counter
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from math import comb, prod
+from .card import Card
+from .hand import Hand
+
+RANKS = tuple(range(2, 15))
+HAND_SIZE = 5
+MAX_DISCARDS = 3
+# A-2-3-4-5 is a five-high straight.
+WHEEL = (14, 5, 4, 3, 2)
+
+# (rank, suit) pairs; the suit is an index into Card.SUITS.
+CardKey = tuple[int, int]
+
+
+def hand_value(ranks: tuple[int, ...], flush: bool) -> tuple[int, int, int, int, int, int]:
+    """
+    Builds the same comparison tuple as Hand.best_hand() from card ranks alone.
+
+    Args:
+        ranks (tuple[int, ...]): The five card ranks in descending order
+        flush (bool): True if all five cards share a suit
+    """
+    counts = Counter(ranks)
+    # Group by count, then rank, so quads, trips and pairs come before kickers.
+    groups = sorted(counts.items(), key=lambda item: (item[1], item[0]), reverse=True)
+    shape = [count for _, count in groups]
+    straight = len(counts) == HAND_SIZE and ranks[0] - ranks[4] == 4
+    high = ranks[0]
+    if ranks == WHEEL:
+        straight = True
+        high = 5
+    if straight and flush:
+        if high == Card.RANK_DICT["A"]:
+            return (Hand.ROYAL_FLUSH, -1, -1, -1, -1, -1)
+        return (Hand.STRAIGHT_FLUSH, high, -1, -1, -1, -1)
+    if shape[0] == 4:
+        return (Hand.FOUR_OF_A_KIND, groups[0][0], groups[1][0], -1, -1, -1)
+    if shape == [3, 2]:
+        return (Hand.FULL_HOUSE, groups[0][0], groups[1][0], -1, -1, -1)
+    if flush:
+        return (Hand.FLUSH, *ranks)  # type: ignore
+    if straight:
+        return (Hand.STRAIGHT, high, -1, -1, -1, -1)
+    if shape[0] == 3:
+        return (Hand.THREE_OF_A_KIND, groups[0][0], groups[1][0], groups[2][0], -1, -1)
+    if shape[:2] == [2, 2]:
+        return (Hand.TWO_PAIR, groups[0][0], groups[1][0], groups[2][0], -1, -1)
+    if shape[0] == 2:
+        return (Hand.ONE_PAIR, groups[0][0], groups[1][0], groups[2][0], groups[3][0], -1)
+    return (Hand.HIGH_CARD, *ranks)  # type: ignore
+
+
+def _build_strengths() -> dict[tuple[int, ...], float]:
+    # Count how many of the 2,598,960 five-card hands share each hand value,
+    # working on rank multisets instead of enumerating every hand.
+    ways: Counter = Counter()
+    for ranks in combinations_with_replacement(RANKS[::-1], HAND_SIZE):
+        counts = Counter(ranks)
+        if max(counts.values()) > 4:
+            continue
+        total = prod(comb(4, count) for count in counts.values())
+        if len(counts) == HAND_SIZE:
+            ways[hand_value(ranks, True)] += 4
+            total -= 4
+        ways[hand_value(ranks, False)] += total
+
+    all_hands = comb(52, HAND_SIZE)
+    strengths = {}
+    below = 0
+    for value in sorted(ways):
+        strengths[value] = (below + ways[value] / 2) / all_hands
+        below += ways[value]
+    return strengths
+
+
+# Fraction of all five-card hands each hand value beats, counting ties as half.
+STRENGTHS = _build_strengths()
+
+
+def strength(cards: list[CardKey]) -> float:
+    """Returns the share of all five-card hands the given five cards beat."""
+    ranks = tuple(sorted((rank for rank, _ in cards), reverse=True))
+    return STRENGTHS[hand_value(ranks, len({suit for _, suit in cards}) == 1)]
+
+
+def card_key(card: str) -> CardKey:
+    """Parses a card string such as "10♥" into its (rank, suit index) pair."""
+    return (Card.RANK_DICT[card[:-1]], Card.SUITS.index(card[-1]))
+
+
+# A distinct prime per rank: the product of the primes identifies a rank multiset.
+_PRIMES = dict(zip(RANKS, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)))
+
+
+def _build_rank_strengths() -> dict[int, tuple[float, float]]:
+    # Maps each five-card rank multiset to (strength unsuited, strength as a flush);
+    # the flush strength is -1.0 when the ranks repeat and no flush is possible.
+    table = {}
+    for ranks in combinations_with_replacement(RANKS[::-1], HAND_SIZE):
+        if max(Counter(ranks).values()) > 4:
+            continue
+        flush = STRENGTHS[hand_value(ranks, True)] if len(set(ranks)) == HAND_SIZE else -1.0
+        table[prod(_PRIMES[rank] for rank in ranks)] = (STRENGTHS[hand_value(ranks, False)], flush)
+    return table
+
+
+def _build_draws() -> list[list[tuple[int, tuple[tuple[int, int], ...], int]]]:
+    # For each number of drawn cards: (prime product, (rank, count) pairs, rank bitmask)
+    # for every multiset of drawn ranks.
+    draws = []
+    for num_draws in range(HAND_SIZE + 1):
+        multisets = []
+        for drawn in combinations_with_replacement(RANKS, num_draws):
+            counts = Counter(drawn)
+            if counts and max(counts.values()) > 4:
+                continue
+            mask = 0
+            for rank in counts:
+                mask |= 1 << rank
+            multisets.append((prod(_PRIMES[rank] for rank in drawn), tuple(counts.items()), mask))
+        draws.append(multisets)
+    return draws
+
+
+_RANK_STRENGTHS = _build_rank_strengths()
+_DRAWS = _build_draws()
+
+
+def hold_value(hand: list[CardKey], hold: tuple[int, ...]) -> float:
+    """
+    Computes the exact expected strength after keeping some cards and drawing the rest.
+
+    Draws come from the 47 cards not in the hand. Instead of dealing every
+    draw, this walks the multisets of drawn ranks and counts how many draws
+    produce each, so discarding 3 cards costs a few hundred steps rather
+    than 16,215 hand evaluations.
+
+    Args:
+        hand (list[CardKey]): The five dealt cards
+        hold (tuple[int, ...]): Positions in hand of the cards to keep
+    """
+    num_draws = HAND_SIZE - len(hold)
+    if num_draws == 0:
+        return strength(hand)
+
+    remaining = [4] * (RANKS[-1] + 1)
+    dealt_ranks = [0] * len(Card.SUITS)
+    for rank, suit in hand:
+        remaining[rank] -= 1
+        dealt_ranks[suit] |= 1 << rank
+    held_prime = 1
+    held_suits = set()
+    for i in hold:
+        rank, suit = hand[i]
+        held_prime *= _PRIMES[rank]
+        held_suits.add(suit)
+    # A flush needs every held card in one suit and every drawn card in it too.
+    flush_suits: tuple[int, ...]
+    if not hold:
+        flush_suits = tuple(range(len(Card.SUITS)))
+    else:
+        flush_suits = tuple(held_suits) if len(held_suits) == 1 else ()
+
+    total = 0.0
+    for prime, counts, drawn_mask in _DRAWS[num_draws]:
+        ways = 1
+        for rank, count in counts:
+            ways *= comb(remaining[rank], count)
+        if not ways:
+            continue
+        unsuited, suited_strength = _RANK_STRENGTHS[held_prime * prime]
+        suited = 0
+        if suited_strength >= 0:
+            for suit in flush_suits:
+                if not drawn_mask & dealt_ranks[suit]:
+                    suited += 1
+            total += suited * suited_strength
+        total += (ways - suited) * unsuited
+    return total / comb(52 - HAND_SIZE, num_draws)
+
+
+def _holds(max_discards: int) -> list[tuple[int, ...]]:
+    # Standing pat first, so ties favour keeping more cards.
+    return [hold for size in range(HAND_SIZE, HAND_SIZE - max_discards - 1, -1) for hold in combinations(range(HAND_SIZE), size)]
+
+
+@lru_cache(maxsize=1 << 16)
+def _best_hold(hand: tuple[CardKey, ...], max_discards: int) -> tuple[tuple[int, ...], float]:
+    best: tuple[tuple[int, ...], float] = ((), -1.0)
+    for hold in _holds(max_discards):
+        value = hold_value(list(hand), hold)
+        if value > best[1]:
+            best = (hold, value)
+    return best
+
+
+def best_hold(hand: list[CardKey], max_discards: int = MAX_DISCARDS) -> tuple[tuple[int, ...], float]:
+    """
+    Finds the cards to keep that give the best expected strength after the draw.
+
+    Args:
+        hand (list[CardKey]): The five dealt cards
+        max_discards (int): Most cards the player may exchange
+
+    Returns:
+        tuple: Positions in hand to keep, and the expected strength of keeping them
+    """
+    if len(hand) != HAND_SIZE:
+        raise ValueError("Draw advice needs a 5 card hand")
+    return _best_hold(tuple(hand), max_discards)
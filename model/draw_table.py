@@ -0,0 +1,169 @@
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from .canonical import BOARD_BITS, SUIT_BITS, CanonicalIndex, suit_order
+from .canonical import canonical as canonical_board
+from .draw import HAND_SIZE, MAX_DISCARDS, RANKS, CardKey, best_hold
+
+# Layout: magic "PKDT", version, max discards, entry count, then a zlib
+# compressed array of little-endian uint64 entries sorted by key. Each entry
+# is (canonical key << 5) | hold mask, where bit i of the mask keeps the i-th
+# card in canonical order.
+MAGIC = b"PKDT"
+VERSION = 1
+_HEADER = struct.Struct("!4sBBI")
+_MASK_BITS = HAND_SIZE
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "draw_table.bin")
+
+# Canonical key -> hold mask, loaded on first use; None until then, {} if there is no table.
+_table: dict[int, int] | None = None
+_table_lock = threading.Lock()
+
+
+def _board(hand: list[CardKey]) -> int:
+    mask = 0
+    for rank, suit in hand:
+        mask |= 1 << (suit * SUIT_BITS + rank - RANKS[0])
+    return mask
+
+
+def canonical(hand: list[CardKey]) -> tuple[int, list[int]]:
+    """
+    Maps a hand to its suit-canonical key (see canonical.canonical()).
+
+    Returns:
+        tuple: The key, and the hand positions in canonical order (by sorted
+        suit, then rank)
+    """
+    hand_board = _board(hand)
+    position = {suit: i for i, suit in enumerate(suit_order(hand_board))}
+    order = sorted(range(len(hand)), key=lambda i: (position[hand[i][1]], hand[i][0]))
+    return canonical_board(hand_board), order
+
+
+def canonical_hands() -> list[list[CardKey]]:
+    """Returns one representative hand for every suit-canonical class, in key order."""
+    index = CanonicalIndex(HAND_SIZE)
+    return [
+        [(bit % SUIT_BITS + RANKS[0], bit // SUIT_BITS) for bit in range(BOARD_BITS) if index.board(i) >> bit & 1]
+        for i in range(len(index))
+    ]
+
+
+def _solve(hands: list[list[CardKey]]) -> list[int]:
+    entries = []
+    for hand in hands:
+        key, order = canonical(hand)
+        hold, _ = best_hold(hand, MAX_DISCARDS)
+        mask = 0
+        for i, position in enumerate(order):
+            if position in hold:
+                mask |= 1 << i
+        entries.append((key << _MASK_BITS) | mask)
+    return entries
+
+
+def build(processes: int = 1) -> array:
+    """
+    Solves the best hold for every suit-canonical five-card hand.
+
+    Returns:
+        array: The sorted table entries
+    """
+    hands = canonical_hands()
+    if processes <= 1:
+        entries = _solve(hands)
+    else:
+        chunk = -(-len(hands) // (processes * 8))
+        with ProcessPoolExecutor(processes) as executor:
+            parts = executor.map(_solve, [hands[i : i + chunk] for i in range(0, len(hands), chunk)])
+            entries = [entry for part in parts for entry in part]
+    return array("Q", sorted(entries))
+
+
+def dumps(entries: array) -> bytes:
+    body = array("Q", entries)
+    if sys.byteorder == "big":
+        body.byteswap()
+    return _HEADER.pack(MAGIC, VERSION, MAX_DISCARDS, len(body)) + zlib.compress(body.tobytes(), 9)
+
+
+def loads(data: bytes) -> dict[int, int]:
+    """
+    Reads a table produced by dumps() into a canonical key -> hold mask dict.
+
+    Raises:
+        ValueError: If the data is not a draw table or is damaged
+    """
+    try:
+        magic, version, max_discards, count = _HEADER.unpack_from(data)
+        body = array("Q", zlib.decompress(data[_HEADER.size :]))
+    except (struct.error, zlib.error, ValueError):
+        raise ValueError("Not a draw table") from None
+    if magic != MAGIC or version != VERSION or max_discards != MAX_DISCARDS or len(body) != count:
+        raise ValueError("Not a draw table")
+    if sys.byteorder == "big":
+        body.byteswap()
+    low = (1 << _MASK_BITS) - 1
+    return {entry >> _MASK_BITS: entry & low for entry in body}
+
+
+def save(entries: array, path: str = DEFAULT_PATH) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dumps(entries))
+    os.replace(tmp_path, path)
+
+
+def load(path: str = DEFAULT_PATH) -> dict[int, int]:
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def table() -> dict[int, int]:
+    """Returns the shipped table, loading it on first use; empty if it is missing or damaged."""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                try:
+                    _table = load()
+                except (OSError, ValueError):
+                    _table = {}
+    return _table
+
+
+def advise(hand: list[CardKey]) -> tuple[int, ...]:
+    """
+    Returns the positions in hand to keep for the best expected strength after
+    exchanging up to MAX_DISCARDS cards.
+
+    Uses the precomputed table when it is available and solves the hand
+    directly otherwise; both give a hold with the same expected strength.
+    """
+    if len(hand) != HAND_SIZE:
+        raise ValueError("Draw advice needs a 5 card hand")
+    key, order = canonical(hand)
+    mask = table().get(key)
+    if mask is None:
+        return best_hold(hand, MAX_DISCARDS)[0]
+    return tuple(sorted(order[i] for i in range(HAND_SIZE) if mask >> i & 1))
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build the 5-card draw hold table.")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    args = parser.parse_args()
+    start = time.perf_counter()
+    entries = build(args.processes)
+    save(entries, args.output)
+    print(f"Wrote {len(entries)} hands to {args.output} in {time.perf_counter() - start:.0f} s")
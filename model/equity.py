@@ -0,0 +1,268 @@
+import math
+import random
+from statistics import NormalDist
+from typing import Any, Iterable, Iterator
+from .batch import score
+from .bitboard import board
+from .card import Card
+from .hand import Hand
+
+HAND_SIZE = 5
+DECK_SIZE = 52
+METHODS = ("plain", "antithetic", "stratified", "quasi")
+# Blocks and hands scored needed before the interval is trusted enough to stop on.
+MIN_BLOCKS = 16
+MIN_HANDS = 2_000
+# Hands scored per plain or antithetic block, so every method pays the same bookkeeping.
+TRIALS_PER_BLOCK = 32
+# Completions of an unfinished hero hand per stratified block.
+HERO_COMPLETIONS = 4
+# Points per randomly shifted quasi-random block, and how many cards they place.
+QUASI_POINTS = 64
+QUASI_DIMS = 5
+DEFAULT_MAX_HANDS = 1_000_000
+
+
+def _primes(count: int) -> list[int]:
+    primes: list[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def _radical_inverse(index: int, base: int) -> float:
+    # Digits of index in base, mirrored around the radix point: the Halton coordinate.
+    inverse = 0.0
+    scale = 1.0 / base
+    while index:
+        index, digit = divmod(index, base)
+        inverse += digit * scale
+        scale /= base
+    return inverse
+
+
+def _pot_share(hero: int, scores: list[int], opponents: int) -> float:
+    """
+    Returns the hero's average pot share over every set of opponents hands
+    taken from scores: outright wins count 1 and a split with j others 1/(j+1).
+    """
+    below = equal = 0
+    for value in scores:
+        if value < hero:
+            below += 1
+        elif value == hero:
+            equal += 1
+    shares = math.comb(below, opponents) + sum(math.comb(equal, tied) * math.comb(below, opponents - tied) / (tied + 1) for tied in range(1, opponents + 1))
+    return shares / math.comb(len(scores), opponents)
+
+
+class _Sampler:
+    """
+    Runs showdown trials in blocks for equity().
+
+    Each method yields one (average pot share, hands scored) pair per block.
+    Every block's average is an unbiased estimate of the equity and blocks
+    are independent, so the spread of block averages gives the confidence
+    interval whatever the method.
+
+    Attributes:
+        known (list[int]): The hero's card ids
+        missing (int): Cards the hero still needs
+        opponents (int): Opposing hands
+        pool (list[int]): Card ids still unseen, in (rank, suit) order
+        rng (random.Random): Source of all randomness
+        _hero (int | None): The hero's score when the hand is complete
+    """
+
+    def __init__(self, known: list[int], opponents: int, pool: list[int], rng: random.Random) -> None:
+        self.known = known
+        self.missing = HAND_SIZE - len(known)
+        self.opponents = opponents
+        self.pool = pool
+        self.rng = rng
+        self._hero = None if self.missing else score(known)
+
+    @property
+    def needed(self) -> int:
+        return self.missing + self.opponents * HAND_SIZE
+
+    def _trial(self, cards: list[int]) -> tuple[float, int]:
+        # Completes the hero from the front of cards, then deals each opponent
+        # five; stops at the first opponent that beats the hero.
+        hero = self._hero if self._hero is not None else score(self.known + cards[: self.missing])
+        scored = 0 if self._hero is not None else 1
+        ties = 0
+        for start in range(self.missing, self.needed, HAND_SIZE):
+            value = score(cards[start : start + HAND_SIZE])
+            scored += 1
+            if value > hero:
+                return 0.0, scored
+            ties += value == hero
+        return 1.0 / (ties + 1), scored
+
+    def _block(self, deals: list[list[int]]) -> tuple[float, int]:
+        total = 0.0
+        scored = 0
+        for cards in deals:
+            share, hands = self._trial(cards)
+            total += share
+            scored += hands
+        return total / len(deals), scored
+
+    def plain(self) -> Iterator[tuple[float, int]]:
+        while True:
+            yield self._block([self.rng.sample(self.pool, self.needed) for _ in range(TRIALS_PER_BLOCK)])
+
+    def antithetic(self) -> Iterator[tuple[float, int]]:
+        # Pairs each deal with its rank mirror: the i-th lowest unseen card
+        # becomes the i-th highest. The mirror maps the unseen cards onto
+        # themselves, so the mirrored deal is just as likely; high cards
+        # dealt to the opponents turn into low ones.
+        count = len(self.pool)
+        mirror = {card_id: self.pool[count - 1 - i] for i, card_id in enumerate(self.pool)}
+        while True:
+            deals = []
+            for _ in range(TRIALS_PER_BLOCK // 2):
+                cards = self.rng.sample(self.pool, self.needed)
+                deals.append(cards)
+                deals.append([mirror[card_id] for card_id in cards])
+            yield self._block(deals)
+
+    def stratified(self) -> Iterator[tuple[float, int]]:
+        # Partitions the whole unseen deck at random: HERO_COMPLETIONS groups
+        # to finish the hero's hand (one group if it is complete), and the
+        # rest into as many five-card hands as fit. Each hand is scored once,
+        # and every pairing of a completion with a set of opponents from the
+        # partition counts as a trial, so every unseen card is used in each block.
+        pool = list(self.pool)
+        completions = 1
+        if self.missing:
+            completions = max(1, min(HERO_COMPLETIONS, (len(pool) - self.opponents * HAND_SIZE) // self.missing))
+        while True:
+            self.rng.shuffle(pool)
+            start = completions * self.missing
+            scores = [score(pool[i : i + HAND_SIZE]) for i in range(start, len(pool) - HAND_SIZE + 1, HAND_SIZE)]
+            if self._hero is not None:
+                heroes = [self._hero]
+            else:
+                heroes = [score(self.known + pool[i : i + self.missing]) for i in range(0, start, self.missing)]
+            share = math.fsum(_pot_share(hero, scores, self.opponents) for hero in heroes) / len(heroes)
+            yield share, len(scores) + (len(heroes) if self._hero is None else 0)
+
+    def quasi(self) -> Iterator[tuple[float, int]]:
+        # Places the first QUASI_DIMS cards (the hero's completion, then the
+        # first opponent) from Halton points: coordinate u picks the card at
+        # position floor(u * cards left) of the rank-ordered pool. Every block
+        # adds its own uniform random shift (mod 1), which keeps the block
+        # unbiased while its points stay evenly spread; later cards are random.
+        dims = min(self.needed, QUASI_DIMS)
+        bases = _primes(dims)
+        points = [[_radical_inverse(index, base) for base in bases] for index in range(1, QUASI_POINTS + 1)]
+        while True:
+            shift = [self.rng.random() for _ in bases]
+            deals = []
+            for point in points:
+                left = list(self.pool)
+                cards = [left.pop(int((coordinate + offset) % 1.0 * len(left))) for coordinate, offset in zip(point, shift)]
+                deals.append(cards + self.rng.sample(left, self.needed - dims))
+            yield self._block(deals)
+
+
+def _ids(cards: Hand | Iterable[Card]) -> list[int]:
+    mask = cards.board if isinstance(cards, Hand) else board(cards)
+    return [bit + 1 for bit in range(DECK_SIZE) if mask >> bit & 1]
+
+
+def equity(
+    hand: Hand | Iterable[Card],
+    opponents: int = 1,
+    dead: Iterable[Card] = (),
+    method: str = "stratified",
+    target: float | None = 0.005,
+    confidence: float = 0.95,
+    max_hands: int = DEFAULT_MAX_HANDS,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """
+    Estimates a hand's share of the pot at a five-card showdown against
+    opponents hands dealt from the unseen cards.
+
+    The hand may hold fewer than five cards, in which case it is completed
+    from the unseen cards too. Split pots count as a fraction. Blocks of
+    trials (see _Sampler) run until the confidence interval's half-width is
+    at most target, or max_hands hands have been scored.
+
+    Args:
+        hand (Hand | Iterable[Card]): The hero's cards, up to five
+        opponents (int): Number of opposing hands
+        dead (Iterable[Card]): Cards known to be out of play, e.g. folded or exposed
+        method (str): "plain" Monte Carlo, "antithetic" rank-mirrored pairs,
+        "stratified" random partitions of the unseen deck, or randomized
+        "quasi"-random Halton points
+        target (float | None): Half-width to stop at; None runs to max_hands
+        confidence (float): Coverage of the interval
+        max_hands (int): Most hands to score, the cost of an estimate
+        seed (int | None): Makes the estimate repeatable
+
+    Returns:
+        dict: equity and its stderr, the interval low-high, the hands scored
+        and blocks run, and the method
+
+    Raises:
+        ValueError: For an unknown method, too many cards in the hand, or not
+        enough unseen cards for every opponent
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown equity method {method!r}, expected one of {', '.join(METHODS)}")
+    known = _ids(hand)
+    if len(known) > HAND_SIZE:
+        raise ValueError("A hand holds at most 5 cards")
+    if opponents < 1:
+        raise ValueError("Need at least one opponent")
+    seen = set(known) | set(_ids(dead))
+    # Card ids sort by suit, then rank; the pool goes by rank, then suit.
+    pool = sorted((card_id for card_id in range(1, DECK_SIZE + 1) if card_id not in seen), key=lambda card_id: ((card_id - 1) % 13, card_id))
+    if HAND_SIZE - len(known) + opponents * HAND_SIZE > len(pool):
+        raise ValueError(f"Not enough unseen cards to deal {opponents} opponents")
+    sampler = _Sampler(known, opponents, pool, random.Random(seed))
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    # Welford's running mean and sum of squared deviations of the block averages.
+    blocks = hands = 0
+    mean = deviations = 0.0
+    stderr = math.inf
+    for value, scored in getattr(sampler, method)():
+        blocks += 1
+        hands += scored
+        delta = value - mean
+        mean += delta / blocks
+        deviations += delta * (value - mean)
+        if blocks >= 2:
+            stderr = math.sqrt(deviations / (blocks - 1) / blocks)
+        if target is not None and blocks >= MIN_BLOCKS and hands >= MIN_HANDS and z * stderr <= target:
+            break
+        if hands >= max_hands:
+            break
+    return {"equity": mean, "stderr": stderr, "low": mean - z * stderr, "high": mean + z * stderr, "hands": hands, "blocks": blocks, "method": method}
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from .draw import card_key
+
+    parser = argparse.ArgumentParser(description="Estimate a hand's showdown equity with each sampling method.")
+    parser.add_argument("cards", nargs="*", default=["J♠", "J♥", "9♦", "7♣", "2♠"], help='cards such as "10♥"')
+    parser.add_argument("--opponents", type=int, default=3)
+    parser.add_argument("--target", type=float, default=0.005, help="confidence interval half-width to stop at")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    names = {rank: name for name, rank in Card.RANK_DICT.items()}
+    hero = [Card(names[rank], Card.SUITS[suit]) for rank, suit in map(card_key, args.cards)]
+    for name in METHODS:
+        start = time.perf_counter()
+        result = equity(hero, args.opponents, method=name, target=args.target, seed=args.seed)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<11}{result['equity']:.4f} ± {result['high'] - result['equity']:.4f}  {result['hands']:>8,} hands scored  {elapsed * 1000:>6.0f} ms")
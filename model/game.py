@@ -1,6 +1,14 @@
+import random
+from typing import TYPE_CHECKING, Callable
+from .card import Card
 from .hand import Hand
 from .deck import Deck
 from .player import Player
+from .registry import PlayerRegistry
+from .profiling import profiled
+
+if TYPE_CHECKING:
+    from .strategy import Strategy
 
 
 class PokerGame:
@@ -13,16 +21,32 @@ class PokerGame:
     Attributes:
         _draw_game (bool): True if playing 5-card draw, False for 5-card stud
         _num_players (int): Number of players in the game
-        _deck (Deck): The game's deck of cards
+        _deck (Deck): The game's deck of cards, dealing from the generator
+        passed in (a fresh one by default)
+        _players (PlayerRegistry): Name index over the players in seat order
         _players_hands (dict[Player, Hand]): Maps players to their poker hands
         or None if cards have not been dealt
+        _exchanged (set[Player]): Players who have exchanged or stood pat this hand
+        _autosave (Callable[[PokerGame], None] | None): Called after every state
+        transition, e.g. to write a snapshot
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rng: random.Random | None = None) -> None:
         self._draw_game = False
-        self._deck: Deck = Deck()
+        # The deck owns its generator, so games on different threads never share one.
+        self._deck: Deck = Deck(rng)
+        self._players = PlayerRegistry()
         self._players_hands: dict[Player, Hand | None] = {}
+        self._exchanged: set[Player] = set()
         self._game_state = "setup"  # setup, ready, playing, reveal, finished
+        self._autosave: Callable[["PokerGame"], None] | None = None
+
+    def set_autosave(self, callback: Callable[["PokerGame"], None] | None) -> None:
+        self._autosave = callback
+
+    def _save(self) -> None:
+        if self._autosave is not None:
+            self._autosave(self)
 
     @property
     def state(self) -> str:
@@ -32,6 +56,7 @@ class PokerGame:
     def state(self, text: str) -> bool:
         if text in ["setup", "ready", "playing", "reveal", "drawreveal", "finished"]:
             self._game_state = text
+            self._save()
         else:
             raise ValueError("Trying to set invalid state")
 
@@ -40,32 +65,53 @@ class PokerGame:
 
     def set_game_of_draw(self, draw_game: bool) -> None:
         self._draw_game = draw_game
+        self._save()
 
     def add_player(self, name: str):
-        self._players_hands[Player(name)] = None
+        player = Player(name)
+        self._players.add(player)
+        self._players_hands[player] = None
+        self._save()
 
     def get_player(self, name: str) -> Player:
-        for player in self._players_hands.keys():
-            if player.name == name:
-                return player
-        raise ValueError(f"Player '{name}' not found in the game")
+        return self._players.get(name)
 
-    def remove_player(self, name: str):
-        # Find the Player object with this name
-        player_to_remove = None
-        for player in self._players_hands.keys():
-            if player.name == name:
-                player_to_remove = player
-                break
+    def has_player(self, name: str) -> bool:
+        return name in self._players
+
+    def player_names(self) -> tuple[str, ...]:
+        return self._players.names()
+
+    @property
+    def num_players(self) -> int:
+        return len(self._players)
+
+    def remove_player(self, name: str) -> bool:
+        player_to_remove = self._players.remove(name)
+        if player_to_remove is None:
+            return False
 
-        if player_to_remove:
-            del self._players_hands[player_to_remove]
+        del self._players_hands[player_to_remove]
+        self._exchanged.discard(player_to_remove)
+        self._save()
+        return True
 
+    @profiled("game.deal_cards")
     def deal_cards(self, hand_size: int) -> None:
         for player in self._players_hands:
             hand = self._deck.random_deal(hand_size)
             self._players_hands[player] = Hand(hand)
+        self._exchanged.clear()
+        self._save()
 
+    @staticmethod
+    def _straight_order(hand: Hand) -> list:
+        # Lowest card first; in a five-high straight (the wheel) the ace plays low.
+        if hand._hand_value[1] == 5:
+            return sorted(hand._cards, key=lambda x: x.rank % 14)
+        return sorted(hand._cards, key=lambda x: x.rank)
+
+    @profiled("game.show_hand")
     def show_hand(self, player: Player) -> list:
         hand = self._players_hands[player]
         hand_list = []
@@ -78,7 +124,7 @@ class PokerGame:
                         hand_list.append(str(card))
 
                 case Hand.STRAIGHT_FLUSH:
-                    sorted_cards = sorted(hand._cards, key=lambda x: x.rank)
+                    sorted_cards = self._straight_order(hand)
                     hand_list.append("Straight Flush")
                     for card in sorted_cards:
                         hand_list.append(str(card))
@@ -110,7 +156,7 @@ class PokerGame:
                         hand_list.append(str(card))
 
                 case Hand.STRAIGHT:
-                    sorted_cards = sorted(hand._cards, key=lambda x: x.rank)
+                    sorted_cards = self._straight_order(hand)
                     hand_list.append("Straight")
                     for card in sorted_cards:
                         hand_list.append(str(card))
@@ -157,6 +203,10 @@ class PokerGame:
 
         return hand_list
 
+    def has_exchanged(self, player: Player) -> bool:
+        return player in self._exchanged
+
+    @profiled("game.exchange_cards")
     def exchange_cards(self, player: Player, selected_cards: list) -> list:
         hand = self._players_hands[player]
 
@@ -170,14 +220,44 @@ class PokerGame:
 
         hand.update_best_hand()
         self._players_hands[player] = hand
+        # An empty exchange stands pat; either way the player has had their draw.
+        self._exchanged.add(player)
+        self._save()
 
         # return hand_list
         return self.show_hand(player)
 
-    def winners(self) -> list:
-        winners = []
-        winners_hands = []
-        losers_hands = []
+    def suggest_exchange(self, player: Player) -> list[str]:
+        """
+        Returns the cards to exchange for the best expected hand after the draw,
+        looked up in the precomputed draw table.
+        """
+        # The draw and equity modules build tables on import; load them on first use only.
+        from .draw_table import advise
+
+        hand = self._players_hands[player]
+        if hand is None:
+            return []
+        hold = advise([(card.rank, Card.SUITS.index(card.suit)) for card in hand._cards])
+        return [str(card) for i, card in enumerate(hand._cards) if i not in hold]
+
+    def hand_equity(self, player: Player, method: str = "stratified", target: float = 0.01) -> float:
+        """
+        Estimates the player's share of the pot at showdown against the other
+        seated players, whose cards are unknown to the player. See equity.equity().
+        """
+        hand = self._players_hands[player]
+        if hand is None:
+            return 0.0
+        if self.num_players < 2:
+            return 1.0
+        from .equity import equity
+
+        return equity(hand, self.num_players - 1, method=method, target=target)["equity"]
+
+    @profiled("game.winning_players")
+    def winning_players(self) -> list[Player]:
+        winners: list[Player] = []
         curr_winning_hand = None
 
         for player, hand in self._players_hands.items():
@@ -191,6 +271,14 @@ class PokerGame:
             elif hand == curr_winning_hand:
                 winners.append(player)
 
+        return winners
+
+    @profiled("game.winners")
+    def winners(self) -> list:
+        winners = self.winning_players()
+        winners_hands = []
+        losers_hands = []
+
         for player in self._players_hands.keys():
             if player in winners:
                 player_hand_list_of_str = [player.name] + ["with"] + self.show_hand(player)
@@ -203,11 +291,67 @@ class PokerGame:
 
         return [len(winners)] + winners_hands + losers_hands
 
+    def play_round(self, strategies: "Strategy | dict[str, Strategy]", hand_size: int = 5) -> list[Player]:
+        """
+        Plays a whole hand without a UI: deals, lets every player exchange in
+        5-card draw, and reveals.
+
+        Args:
+            strategies (Strategy | dict[str, Strategy]): One strategy for every
+            player, or a strategy per player name
+
+        Returns:
+            list[Player]: The winning players
+
+        Raises:
+            ValueError: If a strategy discards more than MAX_DISCARDS cards or
+            cards its player does not hold
+        """
+        from .draw import MAX_DISCARDS
+        from .strategy import Strategy
+
+        if self.num_players < 2:
+            raise ValueError("Need at least 2 players to start")
+        if self._game_state == "finished":
+            draw_game = self._draw_game
+            self.restart_game()
+            self.set_game_of_draw(draw_game)
+        if self._game_state != "ready":
+            raise ValueError("Game is not ready to start")
+
+        self.deal_cards(hand_size)
+        self.state = "playing"
+        if self._draw_game:
+            # Ask each strategy once for all of its players.
+            batches: dict[Strategy, list[Player]] = {}
+            for player in self._players_hands:
+                strategy = strategies if isinstance(strategies, Strategy) else strategies[player.name]
+                batches.setdefault(strategy, []).append(player)
+            exchanges: list[tuple[Player, list[str]]] = []
+            for strategy, players in batches.items():
+                hand_lists = [self.show_hand(player) for player in players]
+                for player, hand_list, cards in zip(players, hand_lists, strategy.choose_discards(hand_lists)):
+                    # Check every choice before exchanging any, so a bad strategy leaves the hands untouched.
+                    if len(cards) > MAX_DISCARDS:
+                        raise ValueError(f"Cannot exchange more than {MAX_DISCARDS} cards")
+                    if not set(cards) <= set(hand_list[1:]) or len(set(cards)) != len(cards):
+                        raise ValueError(f"{player.name} can only exchange cards in their hand")
+                    exchanges.append((player, cards))
+            for player, cards in exchanges:
+                if cards:
+                    self.exchange_cards(player, cards)
+        winners = self.winning_players()
+        self.state = "finished"
+        return winners
+
     def restart_game(self) -> None:
         self._draw_game = False
-        self._deck = Deck()
+        # Return every dealt card to the deck; the Card objects themselves are reused
+        self._deck.reset_deck()
         # Set all players' hands to None
         for player in self._players_hands:
             self._players_hands[player] = None
+        self._exchanged.clear()
         # Reset game to ready instead of setup since we keep existing players
         self._game_state = "ready"
+        self._save()
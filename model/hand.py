@@ -1,5 +1,9 @@
-from collections import Counter
+from typing import Final
+from .bitboard import board
 from .card import Card
+from .canonical import canonical
+from .hand_cache import active
+from .profiling import profiled
 
 
 class Hand:
@@ -11,32 +15,43 @@ class Hand:
 
     Attributes:
         _cards (list[Card]): List of 5 cards in the poker hand
+        _board (int): The same cards as a 52-bit board (see bitboard.py)
         _hand_value: Tuple containing hand type and relevant card values for comparison
     """
 
     # Define as class constants
-    ROYAL_FLUSH = 10
-    STRAIGHT_FLUSH = 9
-    FOUR_OF_A_KIND = 8
-    FULL_HOUSE = 7
-    FLUSH = 6
-    STRAIGHT = 5
-    THREE_OF_A_KIND = 4
-    TWO_PAIR = 3
-    ONE_PAIR = 2
-    HIGH_CARD = 1
+    ROYAL_FLUSH: Final = 10
+    STRAIGHT_FLUSH: Final = 9
+    FOUR_OF_A_KIND: Final = 8
+    FULL_HOUSE: Final = 7
+    FLUSH: Final = 6
+    STRAIGHT: Final = 5
+    THREE_OF_A_KIND: Final = 4
+    TWO_PAIR: Final = 3
+    ONE_PAIR: Final = 2
+    HIGH_CARD: Final = 1
 
     def __init__(self, cards: list[Card]) -> None:
         self._cards = cards
+        self._board = board(cards)
         self._hand_value = self.best_hand()
 
+    @property
+    def board(self) -> int:
+        return self._board
+
+    def __contains__(self, card: object) -> bool:
+        return isinstance(card, Card) and bool(card.bit & self._board)
+
     def add_card(self, card: Card) -> None:
         self._cards.append(card)
+        self._board |= card.bit
 
     def remove_card(self, rank: str, suit: str) -> bool:
         for card in self._cards:
             if card.rankstr == rank and card.suit == suit:
                 self._cards.remove(card)
+                self._board &= ~card.bit
                 return True
         return False
 
@@ -55,9 +70,9 @@ class Hand:
                 # If both hands are Straight Flush, compare the highest card.
                 case self.STRAIGHT_FLUSH:
                     return self._hand_value[1] == other._hand_value[1]
-                # If both hands are Four of a Kind, compare the four of a kind value.
+                # If both hands are Four of a Kind, compare the four of a kind value, then the kicker.
                 case self.FOUR_OF_A_KIND:
-                    return self._hand_value[1] == other._hand_value[1]
+                    return self._hand_value[1] == other._hand_value[1] and self._hand_value[2] == other._hand_value[2]
                 # If both hands are Full House, compare the three of a kind value, then pair value.
                 case self.FULL_HOUSE:
                     return self._hand_value[1] == other._hand_value[1] and self._hand_value[2] == other._hand_value[2]
@@ -105,7 +120,7 @@ class Hand:
             return False
 
     # Compare tuple returned by this Pokerhand's _hand_value to another Pokerhand.
-    def __lt__(self, other: "Hand") -> bool:
+    def __lt__(self, other: object) -> bool:
         # Determine if the two hands are equal in order of hands.
         if not isinstance(other, Hand):
             return NotImplemented
@@ -117,9 +132,16 @@ class Hand:
                 # If both hands are Straight Flush, compare the highest card.
                 case self.STRAIGHT_FLUSH:
                     return self._hand_value[1] < other._hand_value[1]
-                # If both hands are Four of a Kind, compare the four of a kind value.
+                # If both hands are Four of a Kind, compare the four of a kind value first,
+                # then the kicker.
                 case self.FOUR_OF_A_KIND:
-                    return self._hand_value[1] < other._hand_value[1]
+                    for i in range(1, 3):
+                        if self._hand_value[i] < other._hand_value[i]:  # type: ignore
+                            return True
+                        if self._hand_value[i] > other._hand_value[i]:  # type: ignore
+                            return False
+                    # If both hands are equal
+                    return False
                 # If both hands are Full House, compare the three of a kind value first,
                 # then the pair value.
                 case self.FULL_HOUSE:
@@ -187,163 +209,97 @@ class Hand:
         else:
             return self._hand_value[0] < other._hand_value[0]
 
-    def best_hand(self) -> tuple[int, int, int, int, int, int]:  # type:ignore
-        def check_high_card():
-            return max(value_list)
-
-        def check_one_pair() -> bool:
-            pair_count = 0
-            for val in values_to_counts.values():
-                if val == 2:
-                    pair_count += 1
-            return pair_count == 1
-
-        def check_two_pair() -> bool:
-            pair_count = 0
-            for val in values_to_counts.values():
-                if val == 2:
-                    pair_count += 1
-            return pair_count == 2
-
-        def check_three_kind() -> bool:
-            for val in values_to_counts.values():
-                if val == 3:
-                    return True
-            return False
-
-        def check_straight() -> bool:
-            for i in range(len(value_list) - 1):
-                if value_list[i] - value_list[i + 1] != 1:
-                    return False
-            return True
+    @profiled("hand.best_hand")
+    def best_hand(self) -> tuple[int, int, int, int, int, int]:
+        cache = active()
+        if cache is None:
+            return self._evaluate()
+        # Hand values ignore which suit is which, so suit-canonical boards share entries.
+        key = canonical(self._board)
+        value = cache.get(key)
+        if value is None:
+            value = self._evaluate()
+            cache.put(key, value)
+        return value
 
-        def check_flush() -> bool:
-            return len(suit_set) == 1
-
-        def check_full_house() -> bool:
-            return one_pair and three_kind
+    def _evaluate(self) -> tuple[int, int, int, int, int, int]:
+        # One pass builds the rank histogram, a 13-bit rank mask (bit rank - 2) and
+        # an OR of one bit per suit; a flush is a suit mask with a single bit set.
+        counts = [0] * 15
+        rank_mask = 0
+        suit_mask = 0
+        value_list = []
+        for card in self._cards:
+            rank = card.rank
+            value_list.append(rank)
+            counts[rank] += 1
+            rank_mask |= 1 << (rank - 2)
+            suit_mask |= _SUIT_BITS[card.suit]
 
-        def check_four_kind() -> bool:
-            for val in values_to_counts.values():
-                if val == 4:
-                    return True
-            return False
+        if rank_mask.bit_count() == 5:
+            # Five distinct ranks: straights and high cards come straight from the tables.
+            a, b, c, d, e = _RANKS_DESC[rank_mask]
+            high = _STRAIGHT_HIGH[rank_mask]
+            if suit_mask & (suit_mask - 1) == 0:
+                if high == 14:
+                    return (self.ROYAL_FLUSH, -1, -1, -1, -1, -1)
+                if high:
+                    return (self.STRAIGHT_FLUSH, high, -1, -1, -1, -1)
+                return (self.FLUSH, a, b, c, d, e)
+            if high:
+                return (self.STRAIGHT, high, -1, -1, -1, -1)
+            return (self.HIGH_CARD, a, b, c, d, e)
 
-        def check_straight_flush() -> bool:
-            return flush and straight
+        # Paired hands cannot be flushes or straights; group ranks by their counts.
+        value_list.sort(reverse=True)
+        quads = 0
+        trips = 0
+        high_pair = 0
+        low_pair = 0
+        kickers: list[int] = []
+        for rank in value_list:
+            count = counts[rank]
+            if count == 4:
+                quads = rank
+            elif count == 3:
+                trips = rank
+            elif count == 2:
+                if not high_pair:
+                    high_pair = rank
+                elif rank != high_pair:
+                    low_pair = rank
+            else:
+                kickers.append(rank)
+        if quads:
+            return (self.FOUR_OF_A_KIND, quads, kickers[0], -1, -1, -1)
+        if trips:
+            if high_pair:
+                return (self.FULL_HOUSE, trips, high_pair, -1, -1, -1)
+            return (self.THREE_OF_A_KIND, trips, kickers[0], kickers[1], -1, -1)
+        if low_pair:
+            return (self.TWO_PAIR, high_pair, low_pair, kickers[0], -1, -1)
+        return (self.ONE_PAIR, high_pair, kickers[0], kickers[1], kickers[2], -1)
 
-        def check_royal_flush() -> bool:
-            return straight_flush and high_card == Card.RANK_DICT["A"]
 
-        # A -1 in indexes 1-5 of the return tuple indicates value not used.
-        # Royal Flush does not need any index 1-5.
-        # Four of a Kind places its value at index 1, and the fifth card at index 2.
-        # Straigt Flush, Straight, and High Card place High Card at index 1.
-        # Full House places its Three of a Kind value at index 1, and the pair value at index 2.
-        # Flush places all five card values in descending order in indexes 1-5.
-        # Three of a Kind places its value at index 1, and the remaining card values in descending
-        # at index 2 and 3.
-        # Two Pair places its higher value at index 1, and second value at index 2.
-        # Pair places its value at index 1, and the other three value in descending order at
-        # indexes 2-4.
-        # and the remaining card in the third int value.
-        def result_tuple(
-            hand: int,
-        ) -> tuple[int, int, int, int, int, int]:  # type:ignore
-            match hand:
-                case self.ROYAL_FLUSH:
-                    return (self.ROYAL_FLUSH, -1, -1, -1, -1, -1)
-                case self.STRAIGHT_FLUSH:
-                    return (self.STRAIGHT_FLUSH, high_card, -1, -1, -1, -1)
-                case self.FOUR_OF_A_KIND:
-                    for val, cnt in values_to_counts.items():
-                        if cnt == 4:
-                            fok = val
-                    return (self.FOUR_OF_A_KIND, fok, -1, -1, -1, -1)  # type: ignore
-                case self.FULL_HOUSE:
-                    pair = 0
-                    tok = 0
-                    for val, cnt in values_to_counts.items():
-                        if cnt == 2:
-                            pair = val
-                        if cnt == 3:
-                            tok = val
-                    return (self.FULL_HOUSE, tok, pair, -1, -1, -1)
-                case self.FLUSH:
-                    a = value_list[0]
-                    b = value_list[1]
-                    c = value_list[2]
-                    d = value_list[3]
-                    e = value_list[4]
-                    return (self.FLUSH, a, b, c, d, e)
-                case self.STRAIGHT:
-                    return (self.STRAIGHT, high_card, -1, -1, -1, -1)
-                case self.THREE_OF_A_KIND:
-                    other_cards = []
-                    for val, cnt in values_to_counts.items():
-                        if cnt == 3:
-                            tok = val
-                        if cnt == 1:
-                            other_cards.append(val)
-                    higher = max(other_cards)
-                    lower = min(other_cards)
-                    return (self.THREE_OF_A_KIND, tok, higher, lower, -1, -1)  # type: ignore
-                case self.TWO_PAIR:
-                    pairs = []
-                    for val, cnt in values_to_counts.items():
-                        if cnt == 2:
-                            pairs.append(val)
-                        if cnt == 1:
-                            remaining = val
-                    higher = max(pairs)
-                    lower = min(pairs)
-                    return (self.TWO_PAIR, higher, lower, remaining, -1, -1)  # type: ignore
-                case self.ONE_PAIR:
-                    for val, cnt in values_to_counts.items():
-                        if cnt == 2:
-                            pair = val
-                    b = value_list[2]
-                    c = value_list[3]
-                    d = value_list[4]
-                    return (self.ONE_PAIR, pair, b, c, d, -1)  # type: ignore
-                case self.HIGH_CARD:
-                    a = value_list[0]
-                    b = value_list[1]
-                    c = value_list[2]
-                    d = value_list[3]
-                    e = value_list[4]
-                    return (self.HIGH_CARD, a, b, c, d, e)
+def _build_straight_high() -> list[int]:
+    # Maps every 13-bit rank mask to the high card of the straight it makes, or 0.
+    table = [0] * (1 << 13)
+    for high in range(6, 15):
+        table[0b11111 << (high - 6)] = high
+    # The wheel, A-2-3-4-5, plays the ace low: a five-high straight.
+    table[1 << 12 | 0b1111] = 5
+    return table
 
-        suit_set = {card.suit for card in self._cards}
-        value_list = [card.rank for card in self._cards]
-        value_list.sort(reverse=True)
-        values_to_counts = Counter(value_list)
 
-        high_card = check_high_card()  # High card holds actual card value.
-        one_pair = check_one_pair()
-        two_pair = check_two_pair()
-        three_kind = check_three_kind()
-        flush = check_flush()
-        straight = check_straight()
-        full_house = check_full_house()
-        four_kind = check_four_kind()
-        straight_flush = check_straight_flush()
-        royal_flush = check_royal_flush()
+def _build_ranks_desc() -> list[tuple[int, ...]]:
+    # Maps every 13-bit rank mask with five bits set to its ranks, highest first.
+    table: list[tuple[int, ...]] = [()] * (1 << 13)
+    for mask in range(1 << 13):
+        if mask.bit_count() == 5:
+            table[mask] = tuple(bit + 2 for bit in range(12, -1, -1) if mask >> bit & 1)
+    return table
 
-        hands = [
-            (royal_flush, self.ROYAL_FLUSH),
-            (straight_flush, self.STRAIGHT_FLUSH),
-            (four_kind, self.FOUR_OF_A_KIND),
-            (full_house, self.FULL_HOUSE),
-            (flush, self.FLUSH),
-            (straight, self.STRAIGHT),
-            (three_kind, self.THREE_OF_A_KIND),
-            (two_pair, self.TWO_PAIR),
-            (one_pair, self.ONE_PAIR),
-            (True, self.HIGH_CARD),  # Always true as fallback
-        ]
 
-        # The first is_hand that is True is the highest hand.
-        for is_hand, hand in hands:
-            if is_hand:
-                return result_tuple(hand)
+_STRAIGHT_HIGH: Final = _build_straight_high()
+_RANKS_DESC: Final = _build_ranks_desc()
+_SUIT_BITS: Final = {suit: 1 << i for i, suit in enumerate(Card.SUITS)}
@@ -0,0 +1,132 @@
+import os
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Any
+
+DEFAULT_SIZE = 1 << 16
+
+
+class LRUCache:
+    """
+    A bounded least-recently-used map from hand keys to hand values.
+
+    Every operation takes the cache's lock, so one cache can be shared by
+    threads. Processes never share a cache: a forked child starts with an
+    empty one (see _after_fork) and spawned processes build their own on import.
+
+    Attributes:
+        maxsize (int): Most entries kept before the least recently used is evicted
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that had to be evaluated
+        _entries (OrderedDict): Maps key to value, least recently used first
+        _lock (threading.Lock): Guards the entries and counters
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: int) -> Any:
+        """Returns the cached value for key, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: int, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+class _CacheState:
+    """
+    Holds the process-wide hand value cache, None while caching is off.
+
+    Attributes:
+        cache (LRUCache | None): The active cache
+    """
+
+    __slots__ = ("cache",)
+
+    def __init__(self) -> None:
+        size = os.environ.get("POKER_HAND_CACHE", "")
+        self.cache: LRUCache | None = None
+        if size in ("", "0"):
+            return
+        try:
+            maxsize = int(size)
+            if maxsize < 1:
+                raise ValueError
+        except ValueError:
+            # A bad setting must not stop the model importing; cache at the default size.
+            warnings.warn(f"POKER_HAND_CACHE={size!r} is not a positive integer; using {DEFAULT_SIZE}", RuntimeWarning)
+            maxsize = DEFAULT_SIZE
+        self.cache = LRUCache(maxsize)
+
+
+_state = _CacheState()
+
+
+def enable(maxsize: int = DEFAULT_SIZE) -> None:
+    """Turns the cache on with room for maxsize hands, replacing any existing cache."""
+    _state.cache = LRUCache(maxsize)
+
+
+def disable() -> None:
+    _state.cache = None
+
+
+def active() -> LRUCache | None:
+    return _state.cache
+
+
+def info() -> dict[str, int]:
+    """Returns hits, misses, size and maxsize of the active cache, all 0 when caching is off."""
+    cache = _state.cache
+    if cache is None:
+        return {"hits": 0, "misses": 0, "size": 0, "maxsize": 0}
+    return cache.info()
+
+
+def clear() -> None:
+    cache = _state.cache
+    if cache is not None:
+        cache.clear()
+
+
+def _after_fork() -> None:
+    # The parent's lock may have been held by another thread at fork time, so the
+    # child gets a fresh cache (and lock) of the same size rather than a copy.
+    cache = _state.cache
+    if cache is not None:
+        _state.cache = LRUCache(cache.maxsize)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
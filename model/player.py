@@ -2,10 +2,15 @@ class Player:
     """
     Represents a player in a card game.
 
+    Players hash and compare by identity, so two players with the same name
+    are still distinct dictionary keys.
+
     Attributes:
         _name (str): The player's name
     """
 
+    __slots__ = ("_name",)
+
     def __init__(self, name: str) -> None:
         self._name = name
 
@@ -0,0 +1,143 @@
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _ProfilerState:
+    """
+    Holds the global on/off switch for hot-path instrumentation.
+
+    Attributes:
+        enabled (bool): True while timing counters are being recorded
+    """
+
+    __slots__ = ("enabled",)
+
+    def __init__(self) -> None:
+        self.enabled = os.environ.get("POKER_PROFILE", "") not in ("", "0")
+
+
+_state = _ProfilerState()
+
+# Maps section name to a three element list: [call count, cumulative nanoseconds,
+# cumulative nanoseconds outside nested sections]. Lists are mutated in place so
+# wrappers can keep a direct reference to their counter.
+_counters: dict[str, list[int]] = {}
+# Guards counter updates, which would lose counts when threads run in parallel.
+_lock = threading.Lock()
+# Per-thread stack with the time spent in nested sections for each open section.
+_local = threading.local()
+
+
+def enable() -> None:
+    _state.enabled = True
+
+
+def disable() -> None:
+    _state.enabled = False
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def reset() -> None:
+    with _lock:
+        for counter in _counters.values():
+            counter[0] = 0
+            counter[1] = 0
+            counter[2] = 0
+
+
+def _open_sections() -> list[int]:
+    try:
+        return _local.stack
+    except AttributeError:
+        _local.stack = []
+        return _local.stack
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """
+    Decorator that records call count and cumulative wall time for a function.
+
+    Sections nest: exchange_cards calls the profiled Hand.best_hand, so its
+    total time includes the evaluation. Total times are inclusive and must not
+    be summed across sections. Self time leaves out nested sections run on the
+    same thread, so self times add up to the time spent in profiled code.
+
+    When profiling is disabled the wrapper only pays for a single attribute
+    check before calling through, so it is safe to leave on hot paths.
+
+    Args:
+        name (str): Section name the counters are reported under
+    """
+
+    def decorator(func: F) -> F:
+        counter = _counters.setdefault(name, [0, 0, 0])
+        perf_counter_ns = time.perf_counter_ns
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _state.enabled:
+                return func(*args, **kwargs)
+            sections = _open_sections()
+            sections.append(0)
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                nested = sections.pop()
+                if sections:
+                    sections[-1] += elapsed
+                with _lock:
+                    counter[0] += 1
+                    counter[1] += elapsed
+                    counter[2] += elapsed - nested
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def snapshot() -> dict[str, dict[str, int]]:
+    """
+    Returns a copy of all counters keyed by section name.
+
+    Each entry holds "calls", "total_ns" (inclusive of nested sections) and
+    "self_ns" (exclusive) for that section.
+    """
+    return {
+        name: {"calls": calls, "total_ns": total_ns, "self_ns": self_ns}
+        for name, (calls, total_ns, self_ns) in sorted(_counters.items())
+    }
+
+
+def to_prometheus(prefix: str = "poker") -> str:
+    """
+    Renders the current counters in the Prometheus text exposition format.
+
+    Args:
+        prefix (str): Metric name prefix
+    """
+    counters = snapshot()
+    lines = [
+        f"# HELP {prefix}_section_calls_total Number of calls to an instrumented section.",
+        f"# TYPE {prefix}_section_calls_total counter",
+    ]
+    for name, values in counters.items():
+        lines.append(f'{prefix}_section_calls_total{{section="{name}"}} {values["calls"]}')
+    lines.append(f"# HELP {prefix}_section_duration_nanoseconds_total Cumulative time spent in an instrumented section.")
+    lines.append(f"# TYPE {prefix}_section_duration_nanoseconds_total counter")
+    for name, values in counters.items():
+        lines.append(f'{prefix}_section_duration_nanoseconds_total{{section="{name}"}} {values["total_ns"]}')
+    lines.append(f"# HELP {prefix}_section_self_nanoseconds_total Cumulative time spent in a section outside nested sections.")
+    lines.append(f"# TYPE {prefix}_section_self_nanoseconds_total counter")
+    for name, values in counters.items():
+        lines.append(f'{prefix}_section_self_nanoseconds_total{{section="{name}"}} {values["self_ns"]}')
+    return "\n".join(lines) + "\n"
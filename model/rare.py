@@ -0,0 +1,204 @@
+import math
+import random
+from statistics import NormalDist
+from typing import Any, Callable, Sequence
+from .batch import hold_positions, score
+from .draw import HAND_SIZE
+from .draw_table import table
+from .hand import Hand
+
+DECK_SIZE = 52
+UNSEEN = DECK_SIZE - HAND_SIZE
+HANDS = math.comb(DECK_SIZE, HAND_SIZE)
+RARE_CATEGORIES = (Hand.ROYAL_FLUSH, Hand.STRAIGHT_FLUSH, Hand.FOUR_OF_A_KIND)
+# Share of proposals drawn uniformly, so no deal is ever given a huge weight.
+UNIFORM_SHARE = 0.1
+# How the rest of the proposals split between 1 to 5 cards of a target hand.
+OVERLAP_SHARES = (0.0, 0.1, 0.25, 0.25, 0.25, 0.15)
+
+Policy = Callable[[Sequence[int]], list[int]]
+
+
+def targets(category: int) -> list[int]:
+    """
+    Returns the board of every five-card hand in a rare category.
+
+    Raises:
+        ValueError: If the category is not one of RARE_CATEGORIES
+    """
+    if category == Hand.ROYAL_FLUSH:
+        return [sum(1 << (suit * 13 + rank) for rank in range(8, 13)) for suit in range(4)]
+    if category == Hand.STRAIGHT_FLUSH:
+        # Rank indexes of the wheel (A-2-3-4-5), then six-high to king-high.
+        runs = [(12, 0, 1, 2, 3)] + [tuple(range(low, low + 5)) for low in range(0, 8)]
+        return [sum(1 << (suit * 13 + rank) for rank in run) for suit in range(4) for run in runs]
+    if category == Hand.FOUR_OF_A_KIND:
+        boards: list[int] = []
+        for rank in range(13):
+            quads = sum(1 << (suit * 13 + rank) for suit in range(4))
+            boards.extend(quads | 1 << bit for bit in range(DECK_SIZE) if not quads >> bit & 1)
+        return boards
+    raise ValueError("Rare estimates support royal flushes, straight flushes and four of a kind")
+
+
+def table_hold(ids: Sequence[int]) -> list[int]:
+    """Returns the positions the draw table keeps, as PokerGame.suggest_exchange() advises."""
+    return hold_positions(ids, table())
+
+
+def rules_hold(ids: Sequence[int]) -> list[int]:
+    """Returns the positions RuleBasedStrategy keeps, see its DISCARDS."""
+    category = score(ids) >> 20
+    ranks = [(card_id - 1) % 13 for card_id in ids]
+    if category in (Hand.ONE_PAIR, Hand.TWO_PAIR, Hand.THREE_OF_A_KIND):
+        return [i for i, rank in enumerate(ranks) if ranks.count(rank) > 1]
+    if category == Hand.HIGH_CARD:
+        return sorted(sorted(range(len(ids)), key=lambda i: -ranks[i])[:2])
+    return list(range(len(ids)))
+
+
+def _ids(board: int) -> list[int]:
+    return [bit + 1 for bit in range(DECK_SIZE) if board >> bit & 1]
+
+
+def _overlaps(hand: int, kept: int, boards: list[int]) -> tuple[list[int], int]:
+    # Targets sharing 0-5 cards with the hand, and how many share exactly the kept cards.
+    counts = [0] * (HAND_SIZE + 1)
+    completions = 0
+    for target in boards:
+        shared = target & hand
+        counts[shared.bit_count()] += 1
+        if shared == kept:
+            completions += 1
+    return counts, completions
+
+
+def hit_probability(ids: Sequence[int], keep: Sequence[int], boards: list[int]) -> float:
+    """
+    Returns the exact probability that keeping the cards at positions keep and
+    drawing the rest makes one of the target boards.
+
+    The replacements are a uniformly random set of the 47 cards not in the
+    hand, however many seats draw before this one, so a target is made by
+    exactly one draw if it holds every kept card and no discarded one.
+    """
+    hand = kept = 0
+    for i, card_id in enumerate(ids):
+        hand |= 1 << (card_id - 1)
+        if i in keep:
+            kept |= 1 << (card_id - 1)
+    completions = _overlaps(hand, kept, boards)[1]
+    return completions / math.comb(UNSEEN, len(ids) - len(keep))
+
+
+def _proposal_density(counts: list[int], size: int) -> float:
+    # Probability of proposing one particular hand, given how many targets share j of its cards.
+    density = UNIFORM_SHARE / HANDS
+    for shared in range(1, HAND_SIZE + 1):
+        if counts[shared]:
+            density += (1 - UNIFORM_SHARE) * OVERLAP_SHARES[shared] * counts[shared] / (size * math.comb(HAND_SIZE, shared) * math.comb(UNSEEN, HAND_SIZE - shared))
+    return density
+
+
+def _propose(rng: random.Random, boards: list[int]) -> int:
+    if rng.random() < UNIFORM_SHARE:
+        return sum(1 << bit for bit in rng.sample(range(DECK_SIZE), HAND_SIZE))
+    shared = rng.choices(range(HAND_SIZE + 1), OVERLAP_SHARES)[0]
+    target = rng.choice(boards)
+    inside = [bit for bit in range(DECK_SIZE) if target >> bit & 1]
+    outside = [bit for bit in range(DECK_SIZE) if not target >> bit & 1]
+    return sum(1 << bit for bit in rng.sample(inside, shared) + rng.sample(outside, HAND_SIZE - shared))
+
+
+def _result(values: list[float], confidence: float) -> dict[str, Any]:
+    hands = len(values)
+    rate = math.fsum(values) / hands
+    variance = math.fsum((value - rate) ** 2 for value in values) / max(hands - 1, 1)
+    stderr = math.sqrt(variance / hands)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    # Plain Monte Carlo needs rate * (1 - rate) / stderr**2 hands for the same error.
+    effective = rate * (1 - rate) / stderr**2 if stderr else math.inf
+    return {"rate": rate, "stderr": stderr, "low": max(rate - z * stderr, 0.0), "high": rate + z * stderr, "confidence": confidence, "hands": hands, "effective_hands": effective}
+
+
+def estimate(category: int, hands: int, policy: Policy | None = None, seed: int | None = None, confidence: float = 0.95) -> dict[str, Any]:
+    """
+    Estimates how often a seat finishes a five-card draw hand in a rare category.
+
+    Two steps remove almost all of plain Monte Carlo's variance. The draw is
+    not sampled: given the deal and the cards kept, hit_probability() sums
+    every possible draw exactly. The deal is importance sampled: most
+    proposals start from 1 to 5 cards of a random target hand, the rest are
+    uniform, and each deal is weighted by its true probability over its
+    proposal probability, so the estimate stays unbiased.
+
+    Args:
+        category (int): One of RARE_CATEGORIES
+        hands (int): Deals to sample
+        policy (Policy | None): Maps a hand's card ids (ascending) to the
+        positions kept; defaults to the draw table, see table_hold()
+        confidence (float): Coverage of the returned interval
+
+    Returns:
+        dict: rate and its stderr, the normal confidence interval low-high,
+        hands sampled, and effective_hands, the plain Monte Carlo hands needed
+        for the same standard error
+    """
+    if hands < 2:
+        raise ValueError("Need at least 2 hands to estimate a rate")
+    boards = targets(category)
+    policy = policy or table_hold
+    rng = random.Random(seed)
+    values = []
+    for _ in range(hands):
+        hand = _propose(rng, boards)
+        ids = _ids(hand)
+        keep = policy(ids)
+        kept = sum(1 << (ids[i] - 1) for i in keep)
+        counts, completions = _overlaps(hand, kept, boards)
+        hit = completions / math.comb(UNSEEN, HAND_SIZE - len(keep))
+        values.append(hit / HANDS / _proposal_density(counts, len(boards)) if hit else 0.0)
+    return _result(values, confidence)
+
+
+def plain_estimate(category: int, hands: int, policy: Policy | None = None, seed: int | None = None, confidence: float = 0.95) -> dict[str, Any]:
+    """Estimates the same rate as estimate() by dealing and drawing every hand, for comparison."""
+    if hands < 2:
+        raise ValueError("Need at least 2 hands to estimate a rate")
+    policy = policy or table_hold
+    rng = random.Random(seed)
+    values = []
+    for _ in range(hands):
+        deck = rng.sample(range(1, DECK_SIZE + 1), 10)
+        ids = sorted(deck[:HAND_SIZE])
+        final = [ids[i] for i in policy(ids)]
+        final += deck[HAND_SIZE : 2 * HAND_SIZE - len(final)]
+        values.append(1.0 if score(final) >> 20 == category else 0.0)
+    return _result(values, confidence)
+
+
+CATEGORY_ARGS = {"royal": Hand.ROYAL_FLUSH, "straight-flush": Hand.STRAIGHT_FLUSH, "quads": Hand.FOUR_OF_A_KIND}
+POLICY_ARGS: dict[str, Policy] = {"table": table_hold, "rules": rules_hold}
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Estimate rare five-card draw hand rates.")
+    parser.add_argument("--category", choices=CATEGORY_ARGS, default="royal")
+    parser.add_argument("--policy", choices=POLICY_ARGS, default="table")
+    parser.add_argument("--hands", type=int, default=100_000)
+    parser.add_argument("--plain", type=int, default=0, help="also run plain Monte Carlo on this many hands")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    runs = [("importance", estimate, args.hands)] + ([("plain", plain_estimate, args.plain)] if args.plain else [])
+    for label, estimator, count in runs:
+        start = time.perf_counter()
+        result = estimator(CATEGORY_ARGS[args.category], count, POLICY_ARGS[args.policy], args.seed)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<11}{result['rate']:.4e} ± {result['high'] - result['rate']:.2e} (95%)"
+            f"  1 in {1 / result['rate'] if result['rate'] else math.inf:,.0f}"
+            f"  {count:,} hands in {elapsed:.1f} s, worth {result['effective_hands']:,.0f} plain hands"
+        )
@@ -0,0 +1,114 @@
+import sys
+from multiprocessing import shared_memory
+from typing import Sequence
+
+HAND_SIZE = 5
+MAX_SEATS = 32
+# Column item sizes: card ids are bytes, scores and winner masks 32-bit words.
+_WORD = 4
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _WORD) * _WORD
+
+
+class HandRecords:
+    """
+    Fixed-width results for many hands in one shared memory block.
+
+    Workers in other processes attach by name and write their hands in place,
+    so nothing is pickled on the way back; the creating process reads the
+    columns through memoryviews without copying. The block is laid out as
+    three columns, each indexed by game:
+
+        cards   games x players x 5 card ids (uint8)
+        scores  games x players packed hand values, see batch.pack() (uint32)
+        winners games winner masks, bit s set if seat s won or split (uint32)
+
+    Attributes:
+        games (int): Number of records
+        players (int): Seats in each record
+        cards (memoryview): Card id column
+        scores (memoryview): Packed hand value column
+        winners (memoryview): Winner mask column
+        _shm (SharedMemory): The block backing the columns
+        _owner (bool): True in the process that created, and must unlink, the block
+    """
+
+    def __init__(self, games: int, players: int, name: str | None = None) -> None:
+        if not 1 <= players <= MAX_SEATS:
+            raise ValueError(f"Records hold between 1 and {MAX_SEATS} seats")
+        if games < 0:
+            raise ValueError("Cannot record a negative number of games")
+        self.games = games
+        self.players = players
+        cards_size = games * players * HAND_SIZE
+        scores_at = _align(cards_size)
+        winners_at = scores_at + games * players * _WORD
+        size = winners_at + games * _WORD
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        else:
+            self._shm = _attach(name)  # type: ignore[arg-type]
+        buf = self._shm.buf
+        if buf is None:
+            raise ValueError(f"Shared memory block {self._shm.name} is closed")
+        self.cards = buf[:cards_size]
+        self.scores = buf[scores_at:winners_at].cast("I")
+        self.winners = buf[winners_at:size].cast("I")
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def write(self, game: int, hands: Sequence[Sequence[int]], scores: Sequence[int]) -> None:
+        """Stores one game's hands (card ids by seat) and scores, and marks the best scores as winners."""
+        row = game * self.players
+        start = row * HAND_SIZE
+        for seat, hand in enumerate(hands):
+            self.cards[start + seat * HAND_SIZE : start + (seat + 1) * HAND_SIZE] = bytes(hand)
+        best = max(scores)
+        mask = 0
+        for seat, score in enumerate(scores):
+            self.scores[row + seat] = score
+            if score == best:
+                mask |= 1 << seat
+        self.winners[game] = mask
+
+    def hand(self, game: int, seat: int) -> bytes:
+        start = (game * self.players + seat) * HAND_SIZE
+        return bytes(self.cards[start : start + HAND_SIZE])
+
+    def win_shares(self) -> list[float]:
+        """Returns each seat's share of the pots, split pots shared equally."""
+        won = [0.0] * self.players
+        for mask in self.winners:
+            share = 1 / mask.bit_count() if mask else 0.0
+            for seat in range(self.players):
+                if mask >> seat & 1:
+                    won[seat] += share
+        return [pots / (self.games or 1) for pots in won]
+
+    def close(self) -> None:
+        """Releases the views and this process's mapping, and frees the block if this process created it."""
+        for view in (self.cards, self.scores, self.winners):
+            view.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "HandRecords":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # Only the creator unlinks the block. Pool workers share the creator's
+    # resource tracker, where registering the name again is a no-op; 3.13+
+    # can skip tracking altogether.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    return shared_memory.SharedMemory(name=name)
@@ -0,0 +1,51 @@
+from typing import Iterator
+from .player import Player
+
+
+class PlayerRegistry:
+    """
+    Indexes the players at a table by name.
+
+    Players keep the order they joined in (their seat order), and lookup,
+    add and remove by name are all O(1).
+
+    Attributes:
+        _by_name (dict[str, Player]): Maps player names to players in seat order
+        _names (tuple[str, ...] | None): Cached seat-ordered names, rebuilt after changes
+    """
+
+    def __init__(self) -> None:
+        self._by_name: dict[str, Player] = {}
+        self._names: tuple[str, ...] | None = None
+
+    def add(self, player: Player) -> None:
+        if player.name in self._by_name:
+            raise ValueError(f"Player '{player.name}' already exists")
+        self._by_name[player.name] = player
+        self._names = None
+
+    def get(self, name: str) -> Player:
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise ValueError(f"Player '{name}' not found in the game") from None
+
+    def remove(self, name: str) -> Player | None:
+        player = self._by_name.pop(name, None)
+        if player is not None:
+            self._names = None
+        return player
+
+    def names(self) -> tuple[str, ...]:
+        if self._names is None:
+            self._names = tuple(self._by_name)
+        return self._names
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __iter__(self) -> Iterator[Player]:
+        return iter(self._by_name.values())
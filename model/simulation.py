@@ -0,0 +1,178 @@
+import os
+import random
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from .batch import pack
+from .deck import Deck
+from .game import PokerGame
+from .records import HandRecords
+from .strategy import RuleBasedStrategy
+
+MODES = ("auto", "threads", "processes")
+# Games per task. Fixed, so a seed gives the same results for any worker count or mode.
+CHUNK = 500
+
+
+def free_threaded() -> bool:
+    """True on an interpreter running without the GIL (a 3.13+ free-threaded build)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def resolve_mode(mode: str) -> str:
+    """
+    Picks the pool for a mode: "auto" means threads on free-threaded builds,
+    where they run in parallel without pickling, and processes otherwise.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown simulation mode {mode!r}, expected one of {', '.join(MODES)}")
+    if mode == "auto":
+        return "threads" if free_threaded() else "processes"
+    return mode
+
+
+def _table(players: int, seed: int, draw_game: bool) -> PokerGame:
+    game = PokerGame(random.Random(seed))
+    for seat in range(players):
+        game.add_player(str(seat))
+    game.state = "ready"
+    game.set_game_of_draw(draw_game)
+    return game
+
+
+def _tasks(games: int, seed: int | None) -> list[tuple[int, int, int]]:
+    # (first game, games, seed) per task of CHUNK games.
+    rng = random.Random(seed)
+    return [(start, min(CHUNK, games - start), rng.getrandbits(64)) for start in range(0, games, CHUNK)]
+
+
+def _executor(workers: int, pool: str) -> Executor:
+    return ThreadPoolExecutor(workers) if pool == "threads" else ProcessPoolExecutor(workers)
+
+
+def play_games(games: int, players: int, seed: int, draw_game: bool = False) -> list[float]:
+    """
+    Plays games hands at one table with the rule-based strategy.
+
+    Everything the games touch (game, deck, generator, strategy) is created
+    here, so calls on different threads share no mutable state.
+
+    Returns:
+        list[float]: Pots won by each seat, split pots shared equally
+    """
+    game = _table(players, seed, draw_game)
+    seats = {player: seat for seat, player in enumerate(game._players_hands)}
+    strategy = RuleBasedStrategy()
+    won = [0.0] * players
+    for _ in range(games):
+        winners = game.play_round(strategy)
+        for player in winners:
+            won[seats[player]] += 1 / len(winners)
+    return won
+
+
+def simulate(
+    games: int,
+    players: int,
+    workers: int | None = None,
+    mode: str = "auto",
+    seed: int | None = None,
+    draw_game: bool = False,
+) -> list[float]:
+    """
+    Plays many hands in parallel and reports how often each seat wins.
+
+    Games are split into tasks of CHUNK games, each with its own seed drawn
+    from seed, and run on a thread or process pool (see resolve_mode()).
+
+    Args:
+        games (int): Hands to play
+        players (int): Players at the table
+        workers (int | None): Pool size; the CPU count by default, 1 runs inline
+        mode (str): "auto", "threads" or "processes"
+        seed (int | None): Makes the results repeatable
+        draw_game (bool): Play 5-card draw instead of stud
+
+    Returns:
+        list[float]: Each seat's share of the pots
+    """
+    pool = resolve_mode(mode)
+    if players < 2:
+        raise ValueError("Need at least 2 players to simulate")
+    tasks = _tasks(games, seed)
+    args = ([count for _, count, _ in tasks], [players] * len(tasks), [seed for _, _, seed in tasks], [draw_game] * len(tasks))
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        results = list(map(play_games, *args))
+    else:
+        with _executor(workers, pool) as executor:
+            results = list(executor.map(play_games, *args))
+    won = [sum(seat) for seat in zip(*results)] if results else [0.0] * players
+    return [pots / (games or 1) for pots in won]
+
+
+def record_games(records: HandRecords | str, games: int, players: int, first: int, count: int, seed: int, draw_game: bool = False) -> int:
+    """
+    Plays count hands like play_games() and writes each one into records,
+    starting at record first.
+
+    Args:
+        records (HandRecords | str): The records, or in a worker process the
+        name of their shared memory block, which is attached for the call
+        games (int): Total records in the block
+
+    Returns:
+        int: Number of hands written
+    """
+    target = HandRecords(games, players, records) if isinstance(records, str) else records
+    try:
+        game = _table(players, seed, draw_game)
+        strategy = RuleBasedStrategy()
+        for index in range(first, first + count):
+            game.play_round(strategy)
+            hands = [hand for hand in game._players_hands.values() if hand is not None]
+            target.write(index, [[Deck.card_id(card) for card in hand._cards] for hand in hands], [pack(hand._hand_value) for hand in hands])
+    finally:
+        if target is not records:
+            target.close()
+    return count
+
+
+def simulate_records(
+    games: int,
+    players: int,
+    workers: int | None = None,
+    mode: str = "auto",
+    seed: int | None = None,
+    draw_game: bool = False,
+) -> HandRecords:
+    """
+    Plays hands like simulate(), but keeps every hand: card ids, packed hand
+    values and winners land in shared memory (see HandRecords) that workers
+    write in place and the caller reads without copying. Uses the same tasks
+    and seeds as simulate(), so the win shares match it exactly.
+
+    Returns:
+        HandRecords: The results; close() them when done to free the block
+    """
+    pool = resolve_mode(mode)
+    if players < 2:
+        raise ValueError("Need at least 2 players to simulate")
+    records = HandRecords(games, players)
+    try:
+        tasks = _tasks(games, seed)
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(tasks) <= 1:
+            for first, count, task_seed in tasks:
+                record_games(records, games, players, first, count, task_seed, draw_game)
+        else:
+            # Threads share the records object; processes attach to the block by name.
+            target: HandRecords | str = records if pool == "threads" else records.name
+            with _executor(workers, pool) as executor:
+                done = [executor.submit(record_games, target, games, players, first, count, task_seed, draw_game) for first, count, task_seed in tasks]
+                for future in done:
+                    future.result()
+    except BaseException:
+        records.close()
+        raise
+    return records
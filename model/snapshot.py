@@ -0,0 +1,132 @@
+import os
+import struct
+from typing import Callable
+from .bitboard import bits
+from .deck import Deck
+from .game import PokerGame
+from .hand import Hand
+
+# Layout (all counts are single bytes, cards are Deck card ids):
+#   magic "PKS", version, flags (bit 0: draw game), state index,
+#   dealt count + dealt card ids,
+#   player count, then per player: name length + utf-8 name,
+#   hand length (0xFF if no hand, bit 7 set once the player has exchanged
+#   or stood pat) + card ids.
+# Version 1 had no exchanged bit; its snapshots still load.
+MAGIC = b"PKS"
+VERSION = 2
+_HEADER = struct.Struct("!3sBBB")
+_NO_HAND = 0xFF
+_EXCHANGED = 0x80
+_FLAG_DRAW = 0x01
+
+STATES = ("setup", "ready", "playing", "reveal", "drawreveal", "finished")
+_STATE_INDEX = {state: index for index, state in enumerate(STATES)}
+
+
+def dumps(game: PokerGame) -> bytes:
+    """
+    Serializes a game's players, hands, dealt cards, exchanges and state to bytes.
+    """
+    flags = _FLAG_DRAW if game.get_game_of_draw() else 0
+    parts = [_HEADER.pack(MAGIC, VERSION, flags, _STATE_INDEX[game.state])]
+    dealt = [bit + 1 for bit in bits(game._deck._dealt)]
+    parts.append(bytes((len(dealt),)))
+    parts.append(bytes(dealt))
+    parts.append(bytes((len(game._players_hands),)))
+    for player, hand in game._players_hands.items():
+        name = player.name.encode("utf-8")
+        if len(name) > 0xFF:
+            raise ValueError(f"Player name too long to snapshot: {player.name!r}")
+        parts.append(bytes((len(name),)))
+        parts.append(name)
+        if hand is None:
+            parts.append(bytes((_NO_HAND,)))
+        else:
+            exchanged = _EXCHANGED if game.has_exchanged(player) else 0
+            parts.append(bytes((len(hand._cards) | exchanged,)))
+            parts.append(bytes(Deck.card_id(card) for card in hand._cards))
+    return b"".join(parts)
+
+
+def loads(data: bytes) -> PokerGame:
+    """
+    Rebuilds a PokerGame from bytes produced by dumps().
+
+    Raises:
+        ValueError: If the data is not a snapshot, is truncated or holds a
+        card id outside 1-52
+    """
+    try:
+        magic, version, flags, state_index = _HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("Not a game snapshot") from None
+    if magic != MAGIC or version not in (1, VERSION):
+        raise ValueError("Not a game snapshot")
+
+    try:
+        game = PokerGame()
+        deck = game._deck
+        pos = _HEADER.size
+        num_dealt = data[pos]
+        for card_id in data[pos + 1 : pos + 1 + num_dealt]:
+            if card_id not in deck._deck:
+                raise ValueError("Corrupt game snapshot")
+            deck._dealt |= 1 << (card_id - 1)
+        pos += 1 + num_dealt
+
+        num_players = data[pos]
+        pos += 1
+        for _ in range(num_players):
+            name_len = data[pos]
+            name = data[pos + 1 : pos + 1 + name_len].decode("utf-8")
+            pos += 1 + name_len
+            hand_len = data[pos]
+            pos += 1
+            hand = None
+            exchanged = False
+            if hand_len != _NO_HAND:
+                exchanged = bool(hand_len & _EXCHANGED)
+                hand_len &= ~_EXCHANGED
+                # Use the deck's own Card objects, exactly as a live deal would.
+                hand = Hand([deck._deck[card_id] for card_id in data[pos : pos + hand_len]])
+                pos += hand_len
+            game.add_player(name)
+            player = game.get_player(name)
+            game._players_hands[player] = hand
+            if exchanged:
+                game._exchanged.add(player)
+        if pos != len(data):
+            raise ValueError("Trailing bytes in game snapshot")
+
+        game.set_game_of_draw(bool(flags & _FLAG_DRAW))
+        game.state = STATES[state_index]
+    except (IndexError, KeyError, UnicodeDecodeError):
+        raise ValueError("Corrupt game snapshot") from None
+    return game
+
+
+def save(game: PokerGame, path: str) -> None:
+    """
+    Writes a snapshot atomically, so a crash mid-write never leaves a torn file.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dumps(game))
+    os.replace(tmp_path, path)
+
+
+def load(path: str) -> PokerGame:
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def autosave_to(path: str) -> Callable[[PokerGame], None]:
+    """
+    Returns a callback for PokerGame.set_autosave() that saves to path.
+    """
+
+    def autosave(game: PokerGame) -> None:
+        save(game, path)
+
+    return autosave
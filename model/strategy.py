@@ -0,0 +1,190 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Sequence
+from .betting import Betting
+from .draw import MAX_DISCARDS, card_key, strength
+from .draw_table import advise
+
+FOLD = "fold"
+CHECK = "check"
+CALL = "call"
+RAISE = "raise"
+ACTIONS = (FOLD, CHECK, CALL, RAISE)
+
+# (betting, seat, hand_list) for one betting decision; hand_list is a PokerGame.show_hand() result.
+BetSpot = tuple[Betting, int, list[str]]
+
+
+class Strategy(ABC):
+    """
+    Decides draw exchanges and betting actions for automated players.
+
+    Every decision method takes a batch, so simulations can ask for thousands
+    of decisions in one call and strategies can share work across them.
+    Hands are PokerGame.show_hand() results: the hand name followed by the
+    card strings.
+
+    Subclasses must implement choose_discards() and may override choose_actions().
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def choose_discards(self, hand_lists: Sequence[list[str]]) -> list[list[str]]:
+        """Returns the cards to exchange for each hand, at most MAX_DISCARDS each."""
+
+    def choose_actions(self, spots: Sequence[BetSpot]) -> list[str]:
+        """Returns one of ACTIONS for each spot. By default checks when possible and calls otherwise."""
+        return [CHECK if betting.street[seat] >= betting.current_bet else CALL for betting, seat, _ in spots]
+
+    def discards(self, hand_list: list[str]) -> list[str]:
+        return self.choose_discards([hand_list])[0]
+
+    def action(self, betting: Betting, seat: int, hand_list: list[str]) -> str:
+        return self.choose_actions([(betting, seat, hand_list)])[0]
+
+
+def apply_action(betting: Betting, seat: int, action: str) -> None:
+    """
+    Performs a strategy's action. Checks become calls when facing a bet, and
+    raises are half the pot over the current bet (at least a minimum raise),
+    capped at the seat's stack. Raises become calls when betting was not reopened.
+    """
+    facing = betting.street[seat] < betting.current_bet
+    if action == FOLD and facing:
+        betting.fold(seat)
+    elif action == RAISE:
+        stack_total = betting.street[seat] + betting.stacks[seat]
+        if stack_total <= betting.current_bet or not betting.can_raise(seat):
+            betting.call(seat)
+            return
+        increment = max(betting.min_raise, betting.pot // 2, 1)
+        betting.raise_to(seat, min(betting.current_bet + increment, stack_total))
+    elif facing:
+        betting.call(seat)
+    else:
+        betting.check(seat)
+
+
+def play_street(betting: Betting, strategies: Sequence[Strategy], hand_lists: Sequence[list[str]]) -> None:
+    """Asks each seat's strategy for actions until the current street is complete."""
+    while betting.to_act != -1:
+        seat = betting.to_act
+        apply_action(betting, seat, strategies[seat].action(betting, seat, hand_lists[seat]))
+
+
+class RandomStrategy(Strategy):
+    """
+    Exchanges a random set of up to MAX_DISCARDS cards and picks random actions.
+
+    Attributes:
+        _rng (random.Random): Source of every decision, seedable for repeatable runs
+    """
+
+    name = "random"
+
+    def __init__(self, seed: int | None = None) -> None:
+        self._rng = random.Random(seed)
+
+    def choose_discards(self, hand_lists: Sequence[list[str]]) -> list[list[str]]:
+        rng = self._rng
+        return [rng.sample(hand_list[1:], rng.randint(0, MAX_DISCARDS)) if hand_list else [] for hand_list in hand_lists]
+
+    def choose_actions(self, spots: Sequence[BetSpot]) -> list[str]:
+        return [self._rng.choice(ACTIONS) for _ in spots]
+
+
+class RuleBasedStrategy(Strategy):
+    """
+    Plays by hand category.
+
+    Draws to made hands: keeps straights and better, and every card that is
+    part of a pair, trips or quads, then discards the kickers. With nothing,
+    it keeps the two highest cards. Bets two pair or better, calls with a
+    pair and gives up otherwise.
+    """
+
+    name = "rules"
+
+    # Slices of a show_hand() result to discard; show_hand() lists grouped cards
+    # first and kickers last in descending rank.
+    DISCARDS = {
+        "One Pair": slice(3, 6),
+        "Two Pair": slice(5, 6),
+        "Three of a Kind": slice(4, 6),
+        "High Card": slice(3, 6),
+    }
+    RAISE_HANDS = {"Two Pair", "Three of a Kind", "Straight", "Flush", "Full House", "Four of a Kind", "Straight Flush", "Royal Flush"}
+
+    def choose_discards(self, hand_lists: Sequence[list[str]]) -> list[list[str]]:
+        discards = []
+        for hand_list in hand_lists:
+            cut = self.DISCARDS.get(hand_list[0]) if hand_list else None
+            discards.append(hand_list[cut] if cut else [])
+        return discards
+
+    def choose_actions(self, spots: Sequence[BetSpot]) -> list[str]:
+        actions = []
+        for betting, seat, hand_list in spots:
+            name = hand_list[0] if hand_list else ""
+            if name in self.RAISE_HANDS:
+                actions.append(RAISE)
+            elif name == "One Pair":
+                actions.append(CALL)
+            else:
+                actions.append(FOLD if betting.street[seat] < betting.current_bet else CHECK)
+        return actions
+
+
+class ExpectedValueStrategy(Strategy):
+    """
+    Plays to maximize expected hand strength, measured as the share of all
+    five-card hands a hand beats.
+
+    Exchanges come from the precomputed draw table (draw_table.advise()),
+    the exact best hold over every allowed discard set.
+    Betting compares the hand's strength against the thresholds.
+
+    Attributes:
+        raise_above (float): Raise with hands stronger than this
+        call_above (float): Call a bet with hands stronger than this
+    """
+
+    name = "ev"
+
+    def __init__(self, raise_above: float = 0.9, call_above: float = 0.6) -> None:
+        self.raise_above = raise_above
+        self.call_above = call_above
+
+    def choose_discards(self, hand_lists: Sequence[list[str]]) -> list[list[str]]:
+        solved: dict[tuple[str, ...], set[str]] = {}
+        discards = []
+        for hand_list in hand_lists:
+            cards = tuple(sorted(hand_list[1:]))
+            if cards not in solved:
+                if not cards:
+                    solved[cards] = set()
+                else:
+                    hold = advise([card_key(card) for card in cards])
+                    solved[cards] = {card for i, card in enumerate(cards) if i not in hold}
+            discards.append([card for card in hand_list[1:] if card in solved[cards]])
+        return discards
+
+    def choose_actions(self, spots: Sequence[BetSpot]) -> list[str]:
+        actions = []
+        for betting, seat, hand_list in spots:
+            value = strength([card_key(card) for card in hand_list[1:]]) if hand_list else 0.0
+            if value > self.raise_above:
+                actions.append(RAISE)
+            elif value > self.call_above:
+                actions.append(CALL)
+            else:
+                actions.append(FOLD if betting.street[seat] < betting.current_bet else CHECK)
+        return actions
+
+
+STRATEGIES: dict[str, type[Strategy]] = {
+    RandomStrategy.name: RandomStrategy,
+    RuleBasedStrategy.name: RuleBasedStrategy,
+    ExpectedValueStrategy.name: ExpectedValueStrategy,
+}
@@ -0,0 +1,263 @@
+import math
+import random
+from itertools import combinations
+from typing import Iterable, Iterator, Sequence
+from .batch import score
+from .card import Card
+
+HAND_SIZE = 5
+DECK_SIZE = 52
+DEFAULT_SAMPLES = 10_000
+# Most remaining deals enumerated exactly; more than this are sampled.
+EXACT_LIMIT = 10_000
+
+
+def _id(card: Card) -> int:
+    # Bit (id - 1) is the card's only set bit.
+    return card.bit.bit_length()
+
+
+class StudEquity:
+    """
+    Win probabilities for a stud table, updated card by card as it is dealt.
+
+    The table keeps a set of completions of everything not yet shown, with
+    every seat's score in each, and adjusts it as cards appear instead of
+    starting over:
+
+    - While the remaining deals are few enough (EXACT_LIMIT), the completions
+      are all of them, each a per-seat board of the cards still to come.
+      Revealing a card drops the completions where that seat was not going to
+      get it. Nothing is rescored.
+    - Otherwise the completions are samples, each a random ordering of the
+      unseen cards laid out as every seat's open slots followed by the rest.
+      Revealing card c to a seat swaps c into that seat's next slot in each
+      sample. The swap maps a uniform ordering to a uniform ordering given the
+      new card, so the samples stay an exact random sample. At most the two
+      seats whose slots changed are rescored, and samples that already dealt c
+      there are untouched. Once the remaining deals fit the limit, the table
+      switches to enumerating them.
+
+    Attributes:
+        seats (int): Seats dealt in
+        samples (int): Completions kept while sampling
+        exact (bool): True while the completions are every possible deal
+        _known (list[list[int]]): Card ids shown for each seat
+        _folded (set[int]): Seats out of the hand
+        _dead (set[int]): Card ids out of play and shown to nobody's hand
+        _rng (random.Random): Source of the samples
+        _completions (list): Per-seat boards of the cards to come (exact) or
+        bytearray orderings of the unseen cards (sampled)
+        _scores (list[list[int]]): Every seat's packed score in each completion
+        _slots (list[list[int]]): Positions of each seat's open slots in a
+        sampled ordering
+        _owner (list[int]): Seat owning each position of a sampled ordering, -1 past the slots
+        _totals (list[float]): Pots won by each seat summed over the completions
+    """
+
+    def __init__(
+        self,
+        seats: int,
+        known: Sequence[Sequence[Card]] = (),
+        dead: Iterable[Card] = (),
+        samples: int = DEFAULT_SAMPLES,
+        seed: int | None = None,
+    ) -> None:
+        if seats < 2:
+            raise ValueError("Need at least 2 seats")
+        if seats * HAND_SIZE > DECK_SIZE:
+            raise ValueError(f"Cannot deal {seats} stud hands from one deck")
+        if samples < 1:
+            raise ValueError("Need at least one sample")
+        self.seats = seats
+        self.samples = samples
+        self._known: list[list[int]] = [[_id(card) for card in hand] for hand in known] + [[] for _ in range(seats - len(known))]
+        if len(self._known) != seats or any(len(cards) > HAND_SIZE for cards in self._known):
+            raise ValueError("Known cards must fit the seats' hands")
+        self._folded: set[int] = set()
+        self._dead = {_id(card) for card in dead}
+        shown = [card_id for cards in self._known for card_id in cards] + list(self._dead)
+        if len(set(shown)) != len(shown):
+            raise ValueError("A card cannot be shown twice")
+        self._rng = random.Random(seed)
+        self.exact = False
+        self._completions: list = []
+        self._scores: list[list[int]] = []
+        self._slots: list[list[int]] = []
+        self._owner: list[int] = []
+        self._totals = [0.0] * seats
+        if self._space() <= EXACT_LIMIT:
+            self._enumerate()
+        else:
+            self._sample()
+
+    def _missing(self, seat: int) -> int:
+        return HAND_SIZE - len(self._known[seat])
+
+    def _pool(self) -> list[int]:
+        seen = self._dead.union(*self._known)
+        return [card_id for card_id in range(1, DECK_SIZE + 1) if card_id not in seen]
+
+    def _space(self) -> int:
+        # Ways to deal every seat's missing cards from the unseen ones.
+        left = len(self._pool())
+        ways = 1
+        for seat in range(self.seats):
+            ways *= math.comb(left, self._missing(seat))
+            left -= self._missing(seat)
+        return ways
+
+    def _shares(self, scores: list[int]) -> tuple[int, ...]:
+        # Seats sharing the pot in one completion.
+        best = max(scores[seat] for seat in range(self.seats) if seat not in self._folded)
+        return tuple(seat for seat in range(self.seats) if seat not in self._folded and scores[seat] == best)
+
+    def _add(self, scores: list[int], sign: float) -> None:
+        winners = self._shares(scores)
+        for seat in winners:
+            self._totals[seat] += sign / len(winners)
+
+    def _recount(self) -> None:
+        self._totals = [0.0] * self.seats
+        for scores in self._scores:
+            self._add(scores, 1.0)
+
+    def _enumerate(self) -> None:
+        pool = self._pool()
+        # A seat's score depends only on its own cards, so each is computed once.
+        cache: list[dict[int, int]] = [{} for _ in range(self.seats)]
+        completions: list[tuple[int, ...]] = []
+        scores: list[list[int]] = []
+
+        def deal(seat: int, left: list[int], boards: list[int], seat_scores: list[int]) -> None:
+            if seat == self.seats:
+                completions.append(tuple(boards))
+                scores.append(list(seat_scores))
+                return
+            for cards in combinations(left, self._missing(seat)):
+                board = sum(1 << (card_id - 1) for card_id in cards)
+                if board not in cache[seat]:
+                    cache[seat][board] = score(self._known[seat] + list(cards))
+                rest = [card_id for card_id in left if card_id not in cards] if cards else left
+                deal(seat + 1, rest, boards + [board], seat_scores + [cache[seat][board]])
+
+        deal(0, pool, [], [])
+        self.exact = True
+        self._completions = completions
+        self._scores = scores
+        self._recount()
+
+    def _sample(self) -> None:
+        pool = self._pool()
+        self._slots = []
+        self._owner = []
+        for seat in range(self.seats):
+            start = len(self._owner)
+            self._slots.append(list(range(start, start + self._missing(seat))))
+            self._owner.extend([seat] * self._missing(seat))
+        self._owner.extend([-1] * (len(pool) - len(self._owner)))
+        self._completions = []
+        self._scores = []
+        for _ in range(self.samples):
+            order = bytearray(self._rng.sample(pool, len(pool)))
+            self._completions.append(order)
+            self._scores.append([self._seat_score(order, seat) for seat in range(self.seats)])
+        self._recount()
+
+    def _seat_score(self, order: bytearray, seat: int) -> int:
+        return score(self._known[seat] + [order[position] for position in self._slots[seat]])
+
+    def reveal(self, seat: int, card: Card) -> list[float]:
+        """
+        Deals a card face up to a seat and returns the updated equities.
+
+        Raises:
+            ValueError: If the seat's hand is full or the card was already seen
+        """
+        if not 0 <= seat < self.seats:
+            raise ValueError(f"No seat {seat}")
+        if not self._missing(seat):
+            raise ValueError(f"Seat {seat} already has {HAND_SIZE} cards")
+        card_id = _id(card)
+        if card_id in self._dead or any(card_id in cards for cards in self._known):
+            raise ValueError(f"{card} has already been seen")
+        bit = 1 << (card_id - 1)
+        if self.exact:
+            kept = [i for i, boards in enumerate(self._completions) if boards[seat] & bit]
+            self._completions = [self._completions[i] for i in kept]
+            self._scores = [self._scores[i] for i in kept]
+            self._known[seat].append(card_id)
+            self._recount()
+            return self.equities()
+        target = self._slots[seat][0]
+        changed = []
+        for index, order in enumerate(self._completions):
+            position = order.index(card_id)
+            if position == target:
+                continue
+            order[position], order[target] = order[target], card_id
+            other = self._owner[position]
+            # Within the seat's own slots the swap leaves every hand as it was.
+            if other != seat:
+                self._add(self._scores[index], -1.0)
+                changed.append((index, other))
+        self._known[seat].append(card_id)
+        self._slots[seat].pop(0)
+        for index, other in changed:
+            order, scores = self._completions[index], self._scores[index]
+            scores[seat] = self._seat_score(order, seat)
+            if other >= 0:
+                scores[other] = self._seat_score(order, other)
+            self._add(scores, 1.0)
+        if self._space() <= EXACT_LIMIT:
+            self._enumerate()
+        return self.equities()
+
+    def fold(self, seat: int) -> list[float]:
+        """Takes a seat out of the hand; its cards still count as dealt. Returns the updated equities."""
+        if seat in self._folded or not 0 <= seat < self.seats:
+            raise ValueError(f"Seat {seat} is not in the hand")
+        if len(self._folded) == self.seats - 1:
+            raise ValueError("The last seat cannot fold")
+        self._folded.add(seat)
+        self._recount()
+        return self.equities()
+
+    def equities(self) -> list[float]:
+        """Returns each seat's share of the pot, folded seats 0."""
+        count = len(self._scores) or 1
+        return [total / count for total in self._totals]
+
+
+def replay(hands: Sequence[Sequence[Card]], down: int = 1, samples: int = DEFAULT_SAMPLES, seed: int | None = None) -> Iterator[tuple[int, Card, list[float]]]:
+    """
+    Replays dealt stud hands as a spectator sees them: the first down cards
+    of each hand stay hidden, then every up card is revealed street by street.
+
+    Yields:
+        tuple: The seat, the card revealed and every seat's equity afterwards
+    """
+    table = StudEquity(len(hands), samples=samples, seed=seed)
+    for position in range(down, HAND_SIZE):
+        for seat, hand in enumerate(hands):
+            yield seat, hand[position], table.reveal(seat, hand[position])
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from .deck import Deck
+
+    parser = argparse.ArgumentParser(description="Replay a stud deal with live equities.")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    deck = Deck(random.Random(args.seed))
+    hands = [deck.random_deal(HAND_SIZE) for _ in range(args.players)]
+    start = time.perf_counter()
+    last = start
+    for seat, card, shares in replay(hands, samples=args.samples, seed=args.seed):
+        now = time.perf_counter()
+        print(f"seat {seat} shows {str(card):>3}  " + "  ".join(f"{share:6.1%}" for share in shares) + f"  {(now - last) * 1000:5.0f} ms")
+        last = now
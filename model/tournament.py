@@ -0,0 +1,228 @@
+import heapq
+import random
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from .game import PokerGame
+
+HAND_SIZE = 5
+
+
+def play_tables(table_sizes: list[int], seeds: list[int] | None = None) -> list[list[int]]:
+    """
+    Plays one hand of 5-card stud at each table.
+
+    Runs in worker processes, so it only takes and returns plain lists.
+
+    Args:
+        table_sizes (list[int]): Number of seated players at each table
+        seeds (list[int] | None): Seeds each table's deal, so a hand plays out
+        the same in any process; None deals unseeded
+
+    Returns:
+        list[list[int]]: Winning seat indexes for each table
+    """
+    games: dict[int, tuple[PokerGame, dict, random.Random]] = {}
+    results = []
+    for i, size in enumerate(table_sizes):
+        if size not in games:
+            rng = random.Random()
+            game = PokerGame(rng)
+            for seat in range(size):
+                game.add_player(str(seat))
+            seats = {player: seat for seat, player in enumerate(game._players_hands)}
+            games[size] = (game, seats, rng)
+        game, seats, rng = games[size]
+        if seeds is not None:
+            rng.seed(seeds[i])
+        game.restart_game()
+        game.deal_cards(HAND_SIZE)
+        results.append([seats[player] for player in game.winning_players()])
+    return results
+
+
+class Tournament:
+    """
+    Runs a multi-table freezeout of 5-card stud hands.
+
+    Every round each table plays one hand: all seated players pay the ante and
+    the winners split the pot. Players who run out of chips are eliminated,
+    and tables are broken and rebalanced so no table has more than one player
+    more than any other. The ante doubles every rounds_per_level rounds.
+
+    A seeded tournament replays exactly, whatever the number of processes:
+    each round draws a seed for every table's deal from the tournament's own
+    generator.
+
+    Attributes:
+        _names (list[str]): Player names, indexed by player id
+        _ids (dict[str, int]): Player id of each name
+        _chips (array): Chip count per player id
+        _tables (list[list[int]]): Player ids seated at each table
+        _eliminated (list[int]): Player ids in elimination order, first out first
+        _standings (list[tuple[int, int]]): Heap of (-chips, player id) for active players
+    """
+
+    def __init__(
+        self,
+        player_names: list[str],
+        table_size: int = 10,
+        starting_chips: int = 1000,
+        ante: int = 10,
+        rounds_per_level: int = 5,
+        processes: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        if len(player_names) < 2:
+            raise ValueError("Need at least 2 players for a tournament")
+        if not 2 <= table_size <= 10:
+            raise ValueError("Table size must be between 2 and 10")
+        self._names = list(player_names)
+        self._ids = {name: player_id for player_id, name in enumerate(self._names)}
+        if len(self._ids) != len(self._names):
+            raise ValueError("Player names must be unique")
+        self._chips = array("q", [starting_chips]) * len(player_names)
+        self._table_size = table_size
+        self._ante = ante
+        self._rounds_per_level = rounds_per_level
+        self._processes = processes
+        self._rng = random.Random(seed)
+        self._round = 0
+        self._moves = 0
+        self._eliminated: list[int] = []
+
+        ids = list(range(len(player_names)))
+        self._rng.shuffle(ids)
+        num_tables = -(-len(ids) // table_size)
+        self._tables: list[list[int]] = [ids[i::num_tables] for i in range(num_tables)]
+        self._standings: list[tuple[int, int]] = []
+        self._update_standings()
+
+    @property
+    def round(self) -> int:
+        return self._round
+
+    @property
+    def ante(self) -> int:
+        return self._ante << (self._round // self._rounds_per_level)
+
+    @property
+    def remaining(self) -> int:
+        return len(self._standings)
+
+    @property
+    def tables(self) -> list[list[str]]:
+        return [[self._names[player_id] for player_id in table] for table in self._tables]
+
+    @property
+    def moves(self) -> int:
+        """Number of players moved between tables by rebalancing."""
+        return self._moves
+
+    def chips(self, name: str) -> int:
+        player_id = self._ids.get(name)
+        if player_id is None:
+            raise ValueError(f"No player named {name!r}")
+        return self._chips[player_id]
+
+    def is_finished(self) -> bool:
+        return self.remaining <= 1
+
+    def _update_standings(self) -> None:
+        self._standings = [(-self._chips[player_id], player_id) for table in self._tables for player_id in table]
+        heapq.heapify(self._standings)
+
+    def _run_hands(self, executor: Executor | None) -> list[list[int]]:
+        sizes = [len(table) for table in self._tables]
+        seeds = [self._rng.getrandbits(64) for _ in sizes]
+        if executor is None or self._processes <= 1 or len(sizes) < 2 * self._processes:
+            return play_tables(sizes, seeds)
+        chunk = -(-len(sizes) // self._processes)
+        starts = range(0, len(sizes), chunk)
+        chunks = executor.map(play_tables, [sizes[i : i + chunk] for i in starts], [seeds[i : i + chunk] for i in starts])
+        return [winners for result in chunks for winners in result]
+
+    def play_round(self, executor: Executor | None = None) -> None:
+        """Plays one hand at every table, settles the pots and rebalances."""
+        if self.is_finished():
+            return
+        ante = self.ante
+        chips = self._chips
+        # (stack before the hand, player id) for everyone who busts this round
+        busted: list[tuple[int, int]] = []
+        for table, winners in zip(self._tables, self._run_hands(executor)):
+            pot = 0
+            stacks = [chips[player_id] for player_id in table]
+            for player_id in table:
+                paid = min(ante, chips[player_id])
+                chips[player_id] -= paid
+                pot += paid
+            share, odd_chips = divmod(pot, len(winners))
+            for i, seat in enumerate(winners):
+                chips[table[seat]] += share + (1 if i < odd_chips else 0)
+            for player_id, stack in zip(table, stacks):
+                if chips[player_id] == 0:
+                    busted.append((stack, player_id))
+
+        # Players busting in the same round finish in order of the stack they started it with.
+        busted.sort()
+        self._eliminated.extend(player_id for _, player_id in busted)
+        out = {player_id for _, player_id in busted}
+        self._tables = [[player_id for player_id in table if player_id not in out] for table in self._tables]
+        self._round += 1
+        self._rebalance()
+        self._update_standings()
+
+    def _rebalance(self) -> None:
+        tables = [table for table in self._tables if table]
+        remaining = sum(len(table) for table in tables)
+        target = max(1, -(-remaining // self._table_size))
+
+        # Break the smallest tables until the field fits in the target number of tables.
+        tables.sort(key=len)
+        loose: list[int] = []
+        while len(tables) > target:
+            loose.extend(tables.pop(0))
+
+        # Seat loose players at the shortest tables, then even out the rest.
+        heap = [(len(table), i) for i, table in enumerate(tables)]
+        heapq.heapify(heap)
+        self._rng.shuffle(loose)
+        for player_id in loose:
+            size, i = heapq.heappop(heap)
+            tables[i].append(player_id)
+            heapq.heappush(heap, (size + 1, i))
+            self._moves += 1
+        while True:
+            longest = max(range(len(tables)), key=lambda i: len(tables[i]))
+            shortest = min(range(len(tables)), key=lambda i: len(tables[i]))
+            if len(tables[longest]) - len(tables[shortest]) <= 1:
+                break
+            mover = tables[longest].pop(self._rng.randrange(len(tables[longest])))
+            tables[shortest].append(mover)
+            self._moves += 1
+        self._tables = tables
+
+    def run(self, max_rounds: int = 100_000) -> list[str]:
+        """
+        Plays rounds until one player holds every chip.
+
+        Returns:
+            list[str]: Final standings, winner first
+        """
+        if self._processes > 1:
+            with ProcessPoolExecutor(self._processes) as executor:
+                while not self.is_finished() and self._round < max_rounds:
+                    self.play_round(executor)
+        else:
+            while not self.is_finished() and self._round < max_rounds:
+                self.play_round()
+        return self.standings()
+
+    def leaderboard(self, count: int = 10) -> list[tuple[str, int]]:
+        """Returns the count biggest stacks still in the tournament, largest first."""
+        return [(self._names[player_id], -neg_chips) for neg_chips, player_id in heapq.nsmallest(count, self._standings)]
+
+    def standings(self) -> list[str]:
+        """Returns every player's position: active players by stack, then eliminated players, last out first."""
+        active = [self._names[player_id] for _, player_id in sorted(self._standings)]
+        return active + [self._names[player_id] for player_id in reversed(self._eliminated)]
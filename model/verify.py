@@ -0,0 +1,286 @@
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, combinations_with_replacement
+from math import comb, prod
+from typing import Any, Callable
+from . import batch, draw
+from .card import Card
+from .deck import Deck
+from .hand import Hand
+
+HAND_SIZE = 5
+DECK_SIZE = 52
+
+# Modules whose code decides hand values; the cached result is keyed by their source.
+SOURCES = ("card.py", "hand.py", "draw.py", "batch.py", "verify.py")
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".verify_cache")
+MAX_PROBLEMS = 20
+
+# Number of five-card hands in each category out of all 2,598,960.
+KNOWN_COUNTS = {
+    Hand.ROYAL_FLUSH: 4,
+    Hand.STRAIGHT_FLUSH: 36,
+    Hand.FOUR_OF_A_KIND: 624,
+    Hand.FULL_HOUSE: 3744,
+    Hand.FLUSH: 5108,
+    Hand.STRAIGHT: 10200,
+    Hand.THREE_OF_A_KIND: 54912,
+    Hand.TWO_PAIR: 123552,
+    Hand.ONE_PAIR: 1098240,
+    Hand.HIGH_CARD: 1302540,
+}
+
+# Distinct hand values: 10 straight flushes (the royal flush among them), 156
+# four of a kinds, 156 full houses, 1,277 flushes, 10 straights, 858 three of a
+# kinds, 858 two pairs, 2,860 one pairs and 1,277 high cards.
+KNOWN_CLASSES = 7462
+
+CATEGORY_NAMES = {
+    Hand.ROYAL_FLUSH: "Royal Flush",
+    Hand.STRAIGHT_FLUSH: "Straight Flush",
+    Hand.FOUR_OF_A_KIND: "Four of a Kind",
+    Hand.FULL_HOUSE: "Full House",
+    Hand.FLUSH: "Flush",
+    Hand.STRAIGHT: "Straight",
+    Hand.THREE_OF_A_KIND: "Three of a Kind",
+    Hand.TWO_PAIR: "Two Pair",
+    Hand.ONE_PAIR: "One Pair",
+    Hand.HIGH_CARD: "High Card",
+}
+
+
+def category_counts() -> dict[int, int]:
+    """Evaluates every one of the 2,598,960 five-card hands and counts each category."""
+    cards = list(Deck()._deck.values())
+    counts: Counter = Counter()
+    for hand in combinations(cards, HAND_SIZE):
+        counts[Hand(list(hand))._hand_value[0]] += 1
+    return dict(counts)
+
+
+def rank_class_counts() -> dict[int, int]:
+    """
+    Counts each category by evaluating one hand per rank multiset, suited and
+    unsuited, weighted by how many hands share it. Hand values only depend on
+    ranks and whether the hand is a flush, so this matches category_counts()
+    with about 12,000 evaluations instead of 2.6 million.
+    """
+    ranks = list(Card.RANK_DICT)
+    counts: Counter = Counter()
+    for multiset in combinations_with_replacement(ranks, HAND_SIZE):
+        per_rank = Counter(multiset)
+        if max(per_rank.values()) > 4:
+            continue
+        ways = prod(comb(4, count) for count in per_rank.values())
+        if len(per_rank) == HAND_SIZE:
+            suited = Hand([Card(rank, Card.SUITS[0]) for rank in multiset])
+            counts[suited._hand_value[0]] += 4
+            ways -= 4
+        # Deal each rank's copies from different suits, then break any flush.
+        cards = [Card(rank, Card.SUITS[i]) for rank, count in per_rank.items() for i in range(count)]
+        if len({card.suit for card in cards}) == 1:
+            cards[-1] = Card(cards[-1].rankstr, Card.SUITS[1])
+        counts[Hand(cards)._hand_value[0]] += ways
+    return dict(counts)
+
+
+def mismatches(counts: dict[int, int]) -> list[str]:
+    """Describes every category whose count differs from KNOWN_COUNTS."""
+    return [
+        f"{CATEGORY_NAMES[category]}: expected {expected}, got {counts.get(category, 0)}"
+        for category, expected in KNOWN_COUNTS.items()
+        if counts.get(category, 0) != expected
+    ]
+
+
+def _reference_value(cards: tuple[Card, ...]) -> Any:
+    # The textbook ordering, written without Hand or draw: category, then the
+    # ranks grouped by how often they appear, larger groups and higher ranks
+    # first. A straight is ranked by its top card, five for A-2-3-4-5.
+    ranks = sorted((card.rank for card in cards), reverse=True)
+    counts = Counter(ranks)
+    shape = sorted(counts.values(), reverse=True)
+    flush = len({card.suit for card in cards}) == 1
+    straight = 0
+    if len(counts) == HAND_SIZE:
+        if ranks[0] - ranks[4] == 4:
+            straight = ranks[0]
+        elif ranks == [14, 5, 4, 3, 2]:
+            straight = 5
+    if straight and flush:
+        category = 8
+    elif shape[0] == 4:
+        category = 7
+    elif shape == [3, 2]:
+        category = 6
+    elif flush:
+        category = 5
+    elif straight:
+        category = 4
+    elif shape[0] == 3:
+        category = 3
+    elif shape == [2, 2, 1]:
+        category = 2
+    elif shape[0] == 2:
+        category = 1
+    else:
+        category = 0
+    return (category, straight, *sorted(ranks, key=lambda rank: (counts[rank], rank), reverse=True))
+
+
+def _draw_value(cards: tuple[Card, ...]) -> Any:
+    ranks = tuple(sorted((card.rank for card in cards), reverse=True))
+    return draw.hand_value(ranks, len({card.suit for card in cards}) == 1)
+
+
+def _batch_value(cards: tuple[Card, ...]) -> Any:
+    return batch.score([Deck.card_id(card) for card in cards])
+
+
+# Evaluators checked against Hand. Each maps five cards to a value where a
+# greater value is a stronger hand; values need not share Hand's format. The
+# reference engine checks Hand itself: any hands Hand ties but should not, or
+# orders the wrong way round, show up as its problems.
+ENGINES: dict[str, Callable[[tuple[Card, ...]], Any]] = {
+    "reference": _reference_value,
+    "draw": _draw_value,
+    "batch": _batch_value,
+}
+
+
+def ordering_problems(pairs: set[tuple[Any, Any]]) -> list[str]:
+    """
+    Checks that an engine orders hands exactly as Hand does.
+
+    Args:
+        pairs (set[tuple]): Every distinct (Hand value, engine value) pair seen
+
+    Returns:
+        list[str]: Up to MAX_PROBLEMS descriptions of hands Hand tells apart
+        but the engine does not, or the engine ranks the other way round
+    """
+    problems: list[str] = []
+    previous: tuple[Any, Any] | None = None
+    for reference, value in sorted(pairs):
+        if previous is not None:
+            if reference == previous[0]:
+                problems.append(f"{reference} has engine values {previous[1]} and {value}")
+            elif not value > previous[1]:
+                problems.append(f"{reference} beats {previous[0]} but scores {value}, not above {previous[1]}")
+        if len(problems) == MAX_PROBLEMS:
+            break
+        previous = (reference, value)
+    return problems
+
+
+def _check(first: int) -> tuple[Counter, set[Any], dict[str, set[tuple[Any, Any]]]]:
+    # Evaluates every hand whose lowest card is the given deck position.
+    cards = list(Deck()._deck.values())
+    lowest = cards[first]
+    categories: Counter = Counter()
+    values: set[Any] = set()
+    pairs: dict[str, set[tuple[Any, Any]]] = {name: set() for name in ENGINES}
+    engines = list(ENGINES.items())
+    for rest in combinations(cards[first + 1 :], HAND_SIZE - 1):
+        hand = (lowest, *rest)
+        reference = Hand(list(hand))._hand_value
+        categories[reference[0]] += 1
+        values.add(reference)
+        for name, engine in engines:
+            pairs[name].add((reference, engine(hand)))
+    return categories, values, pairs
+
+
+def run(processes: int = 1) -> dict[str, Any]:
+    """
+    Evaluates all 2,598,960 hands with Hand and every engine in ENGINES.
+
+    Work is split into one task per lowest card, so the largest tasks come
+    first, and spread over processes workers.
+
+    Returns:
+        dict: Compact result with the source hash, hand count, category
+        counts, number of distinct Hand values and a list of problems
+    """
+    firsts = range(DECK_SIZE - HAND_SIZE + 1)
+    if processes <= 1:
+        parts = list(map(_check, firsts))
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            parts = list(executor.map(_check, firsts))
+    categories: Counter = Counter()
+    values: set[Any] = set()
+    pairs: dict[str, set[tuple[Any, Any]]] = {name: set() for name in ENGINES}
+    for part_categories, part_values, part_pairs in parts:
+        categories.update(part_categories)
+        values |= part_values
+        for name, seen in part_pairs.items():
+            pairs[name] |= seen
+    counts = dict(categories)
+    problems = mismatches(counts)
+    if len(values) != KNOWN_CLASSES:
+        problems.append(f"Distinct hand values: expected {KNOWN_CLASSES}, got {len(values)}")
+    for name, seen in pairs.items():
+        problems += [f"{name}: {problem}" for problem in ordering_problems(seen)]
+    return {
+        "source": source_hash(),
+        "hands": sum(counts.values()),
+        "counts": {CATEGORY_NAMES[category]: counts.get(category, 0) for category in KNOWN_COUNTS},
+        "classes": len(values),
+        "engines": sorted(ENGINES),
+        "problems": problems,
+    }
+
+
+def source_hash() -> str:
+    """Returns a hash of the evaluator source files and the engines checked."""
+    digest = hashlib.sha256(",".join(sorted(ENGINES)).encode())
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in SOURCES:
+        with open(os.path.join(directory, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def cached_run(processes: int = 1, cache_dir: str = DEFAULT_CACHE_DIR, force: bool = False) -> dict[str, Any]:
+    """
+    Returns the result of run(), reusing the one saved in cache_dir when the
+    evaluator source has not changed since it was computed.
+    """
+    path = os.path.join(cache_dir, f"verify-{source_hash()}.json")
+    if not force:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    result = run(processes)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(result, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Check every 5-card hand against Hand and the known category counts.")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--force", action="store_true", help="ignore any cached result")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    result = cached_run(args.processes, args.cache_dir, args.force)
+    for name, count in result["counts"].items():
+        print(f"{name:<16}{count:>10}")
+    status = "FAILED" if result["problems"] else "OK"
+    print(f"{result['hands']} hands, {result['classes']} distinct values, engines {', '.join(result['engines'])}: {status} ({time.perf_counter() - start:.1f} s)")
+    for problem in result["problems"]:
+        print(problem)
+    raise SystemExit(1 if result["problems"] else 0)
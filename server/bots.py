@@ -0,0 +1,148 @@
+import asyncio
+import time
+from array import array
+from model.strategy import RuleBasedStrategy, Strategy
+from .client import TableClient
+
+
+class LatencyRecorder:
+    """
+    Collects per-action round-trip latencies in compact arrays.
+
+    Samples are stored as whole microseconds per action name, so millions of
+    actions fit in a few megabytes.
+
+    Attributes:
+        _samples (dict[str, array]): Maps action name to its latency samples
+    """
+
+    def __init__(self) -> None:
+        self._samples: dict[str, array] = {}
+
+    def record(self, action: str, elapsed_ns: int) -> None:
+        samples = self._samples.get(action)
+        if samples is None:
+            samples = self._samples[action] = array("L")
+        samples.append(elapsed_ns // 1000)
+
+    def merge(self, other: "LatencyRecorder") -> None:
+        for action, samples in other._samples.items():
+            self._samples.setdefault(action, array("L")).extend(samples)
+
+    @property
+    def count(self) -> int:
+        return sum(len(samples) for samples in self._samples.values())
+
+    def percentiles(self, action: str | None = None, points: tuple[float, ...] = (50, 99)) -> dict[float, float]:
+        """
+        Returns latency percentiles in milliseconds for one action, or all actions if None.
+        """
+        if action is None:
+            merged = array("L")
+            for samples in self._samples.values():
+                merged.extend(samples)
+        else:
+            merged = self._samples.get(action, array("L"))
+        if not merged:
+            return {point: 0.0 for point in points}
+        ordered = sorted(merged)
+        last = len(ordered) - 1
+        return {point: ordered[round(last * point / 100)] / 1000 for point in points}
+
+    def actions(self) -> list[str]:
+        return sorted(self._samples)
+
+
+class Bot:
+    """
+    A simulated player connected to a TableServer.
+
+    Attributes:
+        client (TableClient): Connection the bot plays over
+        table_id (int): Table the bot sits at
+        name (str): Player name at the table
+        seat (int | None): Seat assigned by the server once joined
+        latencies (LatencyRecorder): Round-trip time of every action the bot made
+        strategy (Strategy): Decides which cards to exchange in draw
+    """
+
+    def __init__(
+        self,
+        client: TableClient,
+        table_id: int,
+        name: str,
+        latencies: LatencyRecorder | None = None,
+        strategy: Strategy | None = None,
+    ) -> None:
+        self.client = client
+        self.table_id = table_id
+        self.name = name
+        self.seat: int | None = None
+        self.latencies = latencies if latencies is not None else LatencyRecorder()
+        self.strategy = strategy if strategy is not None else RuleBasedStrategy()
+
+    async def _timed(self, action: str, awaitable):
+        start = time.perf_counter_ns()
+        result = await awaitable
+        self.latencies.record(action, time.perf_counter_ns() - start)
+        return result
+
+    async def join(self, draw_game: bool) -> int:
+        self.seat = await self._timed("join", self.client.join(self.table_id, self.name, draw_game))
+        return self.seat
+
+    async def deal(self) -> None:
+        await self._timed("deal", self.client.deal(self.table_id))
+
+    async def play(self, draw_game: bool) -> list[str]:
+        """Looks at the dealt hand and, in draw, exchanges the cards its strategy picks."""
+        assert self.seat is not None
+        hand_list = await self._timed("show", self.client.show(self.table_id, self.seat))
+        if draw_game:
+            # An empty exchange stands pat; the table reveals once every seat has exchanged.
+            discards = self.strategy.discards(hand_list)
+            hand_list = await self._timed("exchange", self.client.exchange(self.table_id, self.seat, discards))
+        return hand_list
+
+    async def reveal(self) -> list[int]:
+        return await self._timed("reveal", self.client.reveal(self.table_id))
+
+    async def leave(self) -> None:
+        if self.seat is not None:
+            await self._timed("leave", self.client.leave(self.table_id, self.seat))
+            self.seat = None
+
+
+class BotTable:
+    """
+    Runs hands for a group of bots seated at the same table.
+
+    The first bot deals and reveals; every bot looks at (and in draw, exchanges)
+    its own hand concurrently.
+
+    Attributes:
+        bots (list[Bot]): Bots seated at the table, dealer first
+        draw_game (bool): True to play 5-card draw
+        hands (int): Hands completed so far
+    """
+
+    def __init__(self, bots: list[Bot], draw_game: bool) -> None:
+        self.bots = bots
+        self.draw_game = draw_game
+        self.hands = 0
+
+    async def sit(self) -> None:
+        for bot in self.bots:
+            await bot.join(self.draw_game)
+
+    async def play_hand(self) -> list[int]:
+        dealer = self.bots[0]
+        await dealer.deal()
+        await asyncio.gather(*(bot.play(self.draw_game) for bot in self.bots))
+        winners = await dealer.reveal()
+        self.hands += 1
+        return winners
+
+    async def stand(self) -> None:
+        for bot in self.bots:
+            await bot.leave()
@@ -0,0 +1,92 @@
+import asyncio
+from collections import deque
+from . import protocol
+
+
+class ServerError(Exception):
+    """Raised when the server answers a request with an ERROR frame."""
+
+
+class TableClient:
+    """
+    Asyncio client for a TableServer.
+
+    Requests are pipelined over a single connection: responses arrive in the
+    order the requests were sent, so many coroutines can share one client.
+
+    Attributes:
+        _reader (asyncio.StreamReader): Incoming side of the connection
+        _writer (asyncio.StreamWriter): Outgoing side of the connection
+        _pending (deque[asyncio.Future]): Futures waiting for their response, oldest first
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._pending: deque[asyncio.Future] = deque()
+        self._receiver = asyncio.get_running_loop().create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 9000) -> "TableClient":
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _receive(self) -> None:
+        try:
+            while True:
+                payload = await protocol.read_frame(self._reader)
+                if not self._pending:
+                    raise protocol.ProtocolError("Unsolicited response from server")
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_result(protocol.decode(payload))
+        except (asyncio.IncompleteReadError, ConnectionError, protocol.ProtocolError) as e:
+            # Responses are matched to requests by order alone, so after a
+            # stray frame none of them can be trusted: drop the connection.
+            self._writer.close()
+            while self._pending:
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Connection closed: {e}"))
+
+    async def request(self, opcode: int, table_id: int, body: bytes = b"") -> bytes:
+        """Sends one request and returns the body of its response."""
+        if self._receiver.done():
+            raise ConnectionError("Connection closed")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(future)
+        self._writer.write(protocol.encode(opcode, table_id, body))
+        reply_opcode, _, reply_body = await future
+        if reply_opcode == protocol.ERROR:
+            raise ServerError(reply_body.decode("utf-8"))
+        return reply_body
+
+    async def join(self, table_id: int, name: str, draw_game: bool = False, secure: bool = False) -> int:
+        flags = (protocol.FLAG_DRAW if draw_game else 0) | (protocol.FLAG_SECURE if secure else 0)
+        body = await self.request(protocol.JOIN, table_id, bytes((flags,)) + name.encode("utf-8"))
+        return body[0]
+
+    async def leave(self, table_id: int, seat: int) -> None:
+        await self.request(protocol.LEAVE, table_id, bytes((seat,)))
+
+    async def deal(self, table_id: int) -> None:
+        await self.request(protocol.DEAL, table_id)
+
+    async def show(self, table_id: int, seat: int) -> list[str]:
+        return protocol.decode_hand(await self.request(protocol.SHOW, table_id, bytes((seat,))))
+
+    async def exchange(self, table_id: int, seat: int, cards: list[str]) -> list[str]:
+        body = bytes((seat,)) + protocol.encode_cards(cards)
+        return protocol.decode_hand(await self.request(protocol.EXCHANGE, table_id, body))
+
+    async def reveal(self, table_id: int) -> list[int]:
+        body = await self.request(protocol.REVEAL, table_id)
+        return list(body[1 : 1 + body[0]])
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._receiver
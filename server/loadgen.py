@@ -0,0 +1,135 @@
+import argparse
+import asyncio
+import multiprocessing
+import time
+from .bots import Bot, BotTable, LatencyRecorder
+from .client import TableClient
+from .table_server import TableServer
+
+
+async def run_table(
+    host: str,
+    port: int,
+    table_id: int,
+    table_size: int,
+    draw_game: bool,
+    start_at: float,
+    deadline: float,
+    latencies: LatencyRecorder,
+) -> tuple[int, int]:
+    """
+    Opens one connection per bot, seats the bots and plays until the deadline.
+
+    Returns:
+        tuple[int, int]: (hands played, connections opened)
+    """
+    await asyncio.sleep(max(0.0, start_at - time.perf_counter()))
+    clients = [await TableClient.connect(host, port) for _ in range(table_size)]
+    table = BotTable(
+        [Bot(client, table_id, f"bot{i}", latencies) for i, client in enumerate(clients)],
+        draw_game,
+    )
+    try:
+        await table.sit()
+        while time.perf_counter() < deadline:
+            await table.play_hand()
+        await table.stand()
+    finally:
+        for client in clients:
+            await client.close()
+    return table.hands, len(clients)
+
+
+async def run(
+    host: str,
+    port: int,
+    players: int,
+    table_size: int,
+    draw_game: bool,
+    ramp: float,
+    duration: float,
+) -> dict[str, float]:
+    """
+    Ramps up players / table_size tables of bots over ramp seconds, then plays
+    until duration seconds after the start and reports throughput and latency.
+    """
+    tables = max(1, players // table_size)
+    latencies = LatencyRecorder()
+    start = time.perf_counter()
+    deadline = start + duration
+    results = await asyncio.gather(
+        *(
+            run_table(host, port, i, table_size, draw_game, start + ramp * i / tables, deadline, latencies)
+            for i in range(tables)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    overall = latencies.percentiles()
+    stats: dict[str, float] = {
+        "tables": tables,
+        "connections": sum(result[1] for result in results),
+        "elapsed_s": elapsed,
+        "hands": sum(result[0] for result in results),
+        "actions": latencies.count,
+        "actions_per_s": latencies.count / elapsed,
+        "p50_ms": overall[50],
+        "p99_ms": overall[99],
+    }
+    for action in latencies.actions():
+        points = latencies.percentiles(action)
+        stats[f"{action}_p50_ms"] = points[50]
+        stats[f"{action}_p99_ms"] = points[99]
+    return stats
+
+
+def _serve(port: int, ready) -> None:
+    async def main() -> None:
+        server = TableServer()
+        await server.start("127.0.0.1", port)
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drive a poker table server with bot players.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--spawn-server", action="store_true", help="start a server in a child process first")
+    parser.add_argument("--players", type=int, default=2000, help="total bot players, one connection each")
+    parser.add_argument("--table-size", type=int, default=4)
+    parser.add_argument("--draw", action="store_true", help="play 5-card draw instead of stud")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which tables connect")
+    parser.add_argument("--duration", type=float, default=20.0)
+    args = parser.parse_args()
+
+    server_process = None
+    if args.spawn_server:
+        ready = multiprocessing.Event()
+        server_process = multiprocessing.Process(target=_serve, args=(args.port, ready), daemon=True)
+        server_process.start()
+        ready.wait()
+
+    try:
+        stats = asyncio.run(
+            run(args.host, args.port, args.players, args.table_size, args.draw, args.ramp, args.duration)
+        )
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+
+    print(
+        f"{stats['connections']:.0f} players at {stats['tables']:.0f} tables, {stats['hands']:.0f} hands, "
+        f"{stats['actions']:.0f} actions in {stats['elapsed_s']:.1f}s"
+    )
+    print(f"throughput: {stats['actions_per_s']:.0f} actions/s, {stats['hands'] / stats['elapsed_s']:.0f} hands/s")
+    print(f"latency: p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
+    for key in sorted(stats):
+        if key.endswith("_p50_ms") and key != "p50_ms":
+            action = key[: -len("_p50_ms")]
+            print(f"  {action:<8} p50 {stats[key]:.2f} ms, p99 {stats[f'{action}_p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
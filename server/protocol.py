@@ -0,0 +1,103 @@
+import struct
+from model.card import Card
+from model.deck import Deck
+
+# Every frame is a 2 byte big-endian payload length followed by the payload.
+# Payloads start with a 1 byte opcode and a 4 byte table id.
+FRAME_HEADER = struct.Struct("!H")
+MESSAGE_HEADER = struct.Struct("!BI")
+MAX_PAYLOAD = 0xFFFF
+
+# Client to server
+JOIN = 1  # flags(1) + utf-8 name -> JOINED
+LEAVE = 2  # seat(1) -> OK
+DEAL = 3  # -> OK
+SHOW = 4  # seat(1) -> HAND
+EXCHANGE = 5  # seat(1) + card codes -> HAND
+REVEAL = 6  # -> RESULT
+
+# Server to client
+OK = 64
+JOINED = 65  # seat(1)
+HAND = 66  # category(1) + card codes
+RESULT = 67  # winner count(1) + winner seats
+ERROR = 127  # utf-8 message
+
+# JOIN flags, read when the join opens the table
+FLAG_DRAW = 0x01
+FLAG_SECURE = 0x02  # deal from the buffered CSPRNG (model.rng.SecureRandom)
+
+# Cards travel as one byte: their Deck card id minus one.
+RANKS = tuple(Card.RANK_DICT)
+SUITS = Card.SUITS
+_CARD_TO_CODE = {f"{rank}{suit}": Deck.card_id(Card(rank, suit)) - 1 for suit in SUITS for rank in RANKS}
+_CODE_TO_CARD = {code: card for card, code in _CARD_TO_CODE.items()}
+
+# Hand categories travel as the Hand class constant (0 means no hand dealt).
+CATEGORY_CODES = {
+    "Royal Flush": 10,
+    "Straight Flush": 9,
+    "Four of a Kind": 8,
+    "Full House": 7,
+    "Flush": 6,
+    "Straight": 5,
+    "Three of a Kind": 4,
+    "Two Pair": 3,
+    "One Pair": 2,
+    "High Card": 1,
+}
+CATEGORY_NAMES = {code: name for name, code in CATEGORY_CODES.items()}
+
+
+class ProtocolError(ValueError):
+    """Raised when a frame cannot be encoded or decoded."""
+
+
+def encode_cards(cards: list[str]) -> bytes:
+    try:
+        return bytes(_CARD_TO_CODE[card] for card in cards)
+    except KeyError as e:
+        raise ProtocolError(f"Unknown card {e.args[0]!r}") from None
+
+
+def decode_cards(data: bytes) -> list[str]:
+    try:
+        return [_CODE_TO_CARD[code] for code in data]
+    except KeyError as e:
+        raise ProtocolError(f"Unknown card code {e.args[0]}") from None
+
+
+def encode_hand(hand_list: list[str]) -> bytes:
+    """Packs a PokerGame.show_hand() list as category + card codes."""
+    if not hand_list:
+        return b"\x00"
+    return bytes((CATEGORY_CODES[hand_list[0]],)) + encode_cards(hand_list[1:])
+
+
+def decode_hand(data: bytes) -> list[str]:
+    """Inverse of encode_hand(), returning the same list show_hand() produced."""
+    if not data or data[0] == 0:
+        return []
+    return [CATEGORY_NAMES[data[0]]] + decode_cards(data[1:])
+
+
+def encode(opcode: int, table_id: int, body: bytes = b"") -> bytes:
+    payload_len = MESSAGE_HEADER.size + len(body)
+    if payload_len > MAX_PAYLOAD:
+        raise ProtocolError("Message too large")
+    return FRAME_HEADER.pack(payload_len) + MESSAGE_HEADER.pack(opcode, table_id) + body
+
+
+def decode(payload: bytes) -> tuple[int, int, bytes]:
+    """Splits a frame payload into (opcode, table id, body)."""
+    if len(payload) < MESSAGE_HEADER.size:
+        raise ProtocolError("Truncated message")
+    opcode, table_id = MESSAGE_HEADER.unpack_from(payload)
+    return opcode, table_id, payload[MESSAGE_HEADER.size :]
+
+
+async def read_frame(reader) -> bytes:
+    """Reads one frame payload from an asyncio.StreamReader."""
+    header = await reader.readexactly(FRAME_HEADER.size)
+    (length,) = FRAME_HEADER.unpack(header)
+    return await reader.readexactly(length)
@@ -0,0 +1,276 @@
+import asyncio
+import struct
+from model.game import PokerGame
+from model.player import Player
+from model.rng import SecureRandom
+from . import protocol
+
+
+class Table:
+    """
+    One networked poker table wrapping a PokerGame.
+
+    Seats are numbered in join order and stay stable while other players leave,
+    so clients can address their player with a single byte.
+
+    Attributes:
+        table_id (int): The id clients use to address this table
+        secure (bool): True if the table deals from the buffered CSPRNG
+        _game (PokerGame): The game being played at this table
+        _draw_game (bool): True if the table plays 5-card draw
+        _seats (list[Player | None]): Player in each seat, None for an empty seat
+        _owners (dict[int, object]): Maps seat number to the connection that owns it
+        _exchanged (set[int]): Seats that already exchanged cards or stood pat this hand
+    """
+
+    MAX_STUD_PLAYERS = 10
+    MAX_DRAW_PLAYERS = 6
+    MAX_EXCHANGE = 3
+    HAND_SIZE = 5
+
+    def __init__(self, table_id: int, draw_game: bool, secure: bool = False) -> None:
+        self.table_id = table_id
+        self.secure = secure
+        self._draw_game = draw_game
+        self._game = PokerGame(SecureRandom() if secure else None)
+        self._game.set_game_of_draw(draw_game)
+        self._seats: list[Player | None] = []
+        self._owners: dict[int, object] = {}
+        self._exchanged: set[int] = set()
+
+    @property
+    def num_players(self) -> int:
+        return len(self._owners)
+
+    def _player(self, seat: int, owner: object) -> Player:
+        if self._owners.get(seat) is not owner:
+            raise ValueError(f"Seat {seat} is not yours")
+        player = self._seats[seat]
+        assert player is not None
+        return player
+
+    def join(self, name: str, owner: object) -> int:
+        if self._game.state == "playing":
+            raise ValueError("Hand in progress")
+        max_players = self.MAX_DRAW_PLAYERS if self._draw_game else self.MAX_STUD_PLAYERS
+        if self.num_players >= max_players:
+            raise ValueError("Table is full")
+        if not name:
+            raise ValueError("Player name cannot be empty")
+        if self._game.has_player(name):
+            raise ValueError(f"Player '{name}' already exists")
+
+        self._game.add_player(name)
+        # Reuse the first empty seat so seat numbers stay below the table size.
+        seat = self._seats.index(None) if None in self._seats else len(self._seats)
+        if seat == len(self._seats):
+            self._seats.append(None)
+        self._seats[seat] = self._game.get_player(name)
+        self._owners[seat] = owner
+        if self.num_players >= 2 and self._game.state == "setup":
+            self._game.state = "ready"
+        return seat
+
+    def leave(self, seat: int, owner: object) -> None:
+        player = self._player(seat, owner)
+        self._game.remove_player(player.name)
+        self._seats[seat] = None
+        del self._owners[seat]
+        if self.num_players < 2 and self._game.state == "ready":
+            self._game.state = "setup"
+
+    def drop_owner(self, owner: object) -> None:
+        """Removes every seat held by a disconnected client."""
+        for seat in [seat for seat, seat_owner in self._owners.items() if seat_owner is owner]:
+            self.leave(seat, owner)
+
+    def _check_seated(self, owner: object) -> None:
+        if owner not in self._owners.values():
+            raise ValueError("You have no seat at this table")
+
+    def deal(self, owner: object) -> None:
+        self._check_seated(owner)
+        if self.num_players < 2:
+            raise ValueError("Need at least 2 players to start")
+        if self._game.state == "finished":
+            self._game.restart_game()
+            self._game.set_game_of_draw(self._draw_game)
+        if self._game.state != "ready":
+            raise ValueError("Game is not ready to start")
+        self._game.deal_cards(self.HAND_SIZE)
+        self._game.state = "playing"
+        self._exchanged.clear()
+
+    def show(self, seat: int, owner: object) -> list[str]:
+        return self._game.show_hand(self._player(seat, owner))
+
+    def exchange(self, seat: int, owner: object, cards: list[str]) -> list[str]:
+        player = self._player(seat, owner)
+        if not self._draw_game:
+            raise ValueError("Cards can only be exchanged in 5-card draw")
+        if self._game.state != "playing":
+            raise ValueError("No hand in progress")
+        if seat in self._exchanged:
+            raise ValueError("Cards already exchanged this hand")
+        if len(cards) > self.MAX_EXCHANGE:
+            raise ValueError(f"Cannot exchange more than {self.MAX_EXCHANGE} cards")
+        held = set(self._game.show_hand(player)[1:])
+        if not set(cards) <= held or len(set(cards)) != len(cards):
+            raise ValueError("Can only exchange cards in your hand")
+        self._exchanged.add(seat)
+        return self._game.exchange_cards(player, cards)
+
+    def reveal(self, owner: object) -> list[int]:
+        self._check_seated(owner)
+        if self._game.state != "playing":
+            raise ValueError("No hand in progress")
+        if self._draw_game and not self._exchanged >= set(self._owners):
+            raise ValueError("Waiting for every seat to exchange or stand pat")
+        winners = set(self._game.winning_players())
+        self._game.state = "finished"
+        return [seat for seat, player in enumerate(self._seats) if player in winners]
+
+
+class TableServer:
+    """
+    Hosts many independent tables over asyncio streams.
+
+    Every table operation runs to completion without awaiting, so requests
+    on one event loop never interleave and tables need no locks. A request
+    only waits on its own connection, so a busy table never holds up
+    unrelated ones.
+
+    Attributes:
+        max_tables (int): Upper bound on simultaneously open tables
+        secure_shuffle (bool): Deal every table from the buffered CSPRNG,
+        not only those opened with FLAG_SECURE
+        messages (int): Number of requests handled since start
+        _tables (dict[int, Table]): Maps table id to its table
+    """
+
+    def __init__(self, max_tables: int = 100_000, secure_shuffle: bool = False) -> None:
+        self.max_tables = max_tables
+        self.secure_shuffle = secure_shuffle
+        self.messages = 0
+        self._tables: dict[int, Table] = {}
+        self._server: asyncio.Server | None = None
+
+    @property
+    def tables(self) -> dict[int, Table]:
+        return self._tables
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        sockname = self._server.sockets[0].getsockname()
+        return sockname[0], sockname[1]
+
+    async def serve_forever(self) -> None:
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+
+    async def wait_closed(self) -> None:
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def _table(self, table_id: int) -> Table:
+        table = self._tables.get(table_id)
+        if table is None:
+            raise ValueError(f"Table {table_id} does not exist")
+        return table
+
+    def dispatch(self, opcode: int, table_id: int, body: bytes, owner: object) -> bytes:
+        """Runs one request against its table and returns the encoded response frame."""
+        self.messages += 1
+        try:
+            if opcode == protocol.JOIN:
+                if not body:
+                    raise protocol.ProtocolError("JOIN needs flags")
+                table = self._tables.get(table_id)
+                if table is None:
+                    if len(self._tables) >= self.max_tables:
+                        raise ValueError("Server is full")
+                    secure = self.secure_shuffle or bool(body[0] & protocol.FLAG_SECURE)
+                    table = self._tables[table_id] = Table(table_id, bool(body[0] & protocol.FLAG_DRAW), secure)
+                seat = table.join(body[1:].decode("utf-8"), owner)
+                return protocol.encode(protocol.JOINED, table_id, bytes((seat,)))
+
+            table = self._table(table_id)
+            match opcode:
+                case protocol.LEAVE:
+                    table.leave(self._seat(body), owner)
+                    if table.num_players == 0:
+                        del self._tables[table_id]
+                    return protocol.encode(protocol.OK, table_id)
+                case protocol.DEAL:
+                    table.deal(owner)
+                    return protocol.encode(protocol.OK, table_id)
+                case protocol.SHOW:
+                    hand_list = table.show(self._seat(body), owner)
+                    return protocol.encode(protocol.HAND, table_id, protocol.encode_hand(hand_list))
+                case protocol.EXCHANGE:
+                    cards = protocol.decode_cards(body[1:])
+                    hand_list = table.exchange(self._seat(body), owner, cards)
+                    return protocol.encode(protocol.HAND, table_id, protocol.encode_hand(hand_list))
+                case protocol.REVEAL:
+                    seats = table.reveal(owner)
+                    return protocol.encode(protocol.RESULT, table_id, bytes([len(seats)] + seats))
+                case _:
+                    raise protocol.ProtocolError(f"Unknown opcode {opcode}")
+        except (ValueError, IndexError, struct.error) as e:
+            return protocol.encode(protocol.ERROR, table_id, str(e).encode("utf-8"))
+
+    @staticmethod
+    def _seat(body: bytes) -> int:
+        if not body:
+            raise protocol.ProtocolError("Missing seat")
+        return body[0]
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        owner = object()
+        joined: set[int] = set()
+        try:
+            while True:
+                opcode, table_id, body = protocol.decode(await protocol.read_frame(reader))
+                if opcode == protocol.JOIN:
+                    joined.add(table_id)
+                writer.write(self.dispatch(opcode, table_id, body, owner))
+                # Only wait for the socket when the client stops reading its responses.
+                if writer.transport.get_write_buffer_size() > 1 << 16:
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, protocol.ProtocolError):
+            pass
+        finally:
+            for table_id in joined:
+                table = self._tables.get(table_id)
+                if table is None:
+                    continue
+                table.drop_owner(owner)
+                if table.num_players == 0:
+                    del self._tables[table_id]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def _main(host: str, port: int, secure_shuffle: bool) -> None:
+    server = TableServer(secure_shuffle=secure_shuffle)
+    host, port = await server.start(host, port)
+    print(f"Serving poker tables on {host}:{port}")
+    await server.serve_forever()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the multi-table poker server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--secure-shuffle", action="store_true", help="deal every table from the buffered CSPRNG")
+    args = parser.parse_args()
+    asyncio.run(_main(args.host, args.port, args.secure_shuffle))
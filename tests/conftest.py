@@ -0,0 +1,10 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import backend
+
+
+def pytest_report_header(config):
+    return f"model backend: {backend()}"
@@ -0,0 +1,138 @@
+import pytest
+import sys
+import os
+import math
+import random
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import audit
+from model.audit import DealAudit, audit_chunk, chi2_sf, format_report, run
+
+
+class TestChiSquare:
+    def test_matches_closed_forms(self):
+        """Test the survival function against exact values for 1 and 2 degrees of freedom"""
+        for x in (0.5, 2.0, 10.0, 40.0):
+            assert chi2_sf(x, 2) == pytest.approx(math.exp(-x / 2), rel=1e-12)
+            assert chi2_sf(x, 1) == pytest.approx(math.erfc(math.sqrt(x / 2)), rel=1e-12)
+        assert chi2_sf(0.0, 51) == 1.0
+
+    def test_large_degrees_of_freedom(self):
+        """Test that a statistic equal to its degrees of freedom is near the median"""
+        assert 0.45 < chi2_sf(1325, 1325) < 0.5
+        assert chi2_sf(2000, 1325) < 1e-20
+
+
+class TestDealAudit:
+    def test_counts(self):
+        """Test the card, position, pair and serial counts of a single deal"""
+        counts = DealAudit(3)
+        counts.add([5, 1, 52])
+        assert counts.deals == 1
+        assert counts.card_counts[5] == counts.card_counts[1] == counts.card_counts[52] == 1
+        assert counts.position_counts[0 * 52 + 4] == 1
+        assert counts.position_counts[2 * 52 + 51] == 1
+        assert counts.pair_counts[0 * 52 + 4] == 1 and counts.pair_counts[4 * 52 + 51] == 1
+        assert sum(counts.pair_counts) == 3
+        assert counts.within == [2, 6, 53, 26, 2705, 57]
+        counts.add([2, 3, 4])
+        # The last card of one deal and the first of the next.
+        assert counts.between == [1, 52, 2, 2704, 4, 104]
+
+    def test_rejects_wrong_size(self):
+        """Test that deals of the wrong size and mismatched merges are rejected"""
+        with pytest.raises(ValueError):
+            DealAudit(3).add([1, 2])
+        with pytest.raises(ValueError):
+            DealAudit(3).merge(DealAudit(5))
+        with pytest.raises(ValueError):
+            DealAudit(1)
+
+    def test_merge_equals_one_stream(self):
+        """Test that merged chunk audits match counting the chunks one after another"""
+        first = audit_chunk(500, 5, seed=1)
+        second = audit_chunk(500, 5, seed=2)
+        combined = DealAudit(5)
+        for part in (first, second):
+            combined.merge(part)
+        assert combined.deals == 1000
+        assert sum(combined.card_counts) == 5000
+        assert list(combined.pair_counts) == [a + b for a, b in zip(first.pair_counts, second.pair_counts)]
+        assert combined.within == [a + b for a, b in zip(first.within, second.within)]
+
+    def test_uniform_dealer_passes(self):
+        """Test that the real dealer passes every test"""
+        report = run(20_000, 5, seed=7).report()
+        assert report["passed"], format_report(report)
+        assert set(report["tests"]) == {"cards", "positions", "pairs", "serial_within", "serial_between"}
+        assert report["tests"]["serial_within"]["correlation"] == pytest.approx(-1 / 51, abs=0.01)
+
+    def test_p_values_calibrated(self):
+        """Test that a fair dealer fails each test at about its alpha and the card and pair tests measure different things"""
+        rng = random.Random(6)
+        runs = 300
+        p_values: dict[str, list[float]] = {}
+        cards = []
+        pairs = []
+        for _ in range(runs):
+            counts = DealAudit(5)
+            for _ in range(200):
+                counts.add(rng.sample(range(1, 53), 5))
+            tests = counts.report()["tests"]
+            for name, test in tests.items():
+                p_values.setdefault(name, []).append(test["p_value"])
+            cards.append(tests["cards"]["statistic"])
+            pairs.append(tests["pairs"]["statistic"])
+        # At alpha 0.1 about 30 of 300 runs fail; 3.5 standard deviations either side.
+        for name, values in p_values.items():
+            assert 12 <= sum(p < 0.1 for p in values) <= 48, name
+        # The uncorrected card statistic averaged 47 and the pair statistic
+        # repeated the card counts' variation.
+        assert statistics.mean(cards) == pytest.approx(51, abs=4 * math.sqrt(102 / runs))
+        assert statistics.mean(pairs) == pytest.approx(1274, abs=4 * math.sqrt(2548 / runs))
+        assert abs(statistics.correlation(cards, pairs)) < 0.25
+
+    def test_biased_dealer_fails(self):
+        """Test that a dealer favouring low cards in the first position is caught"""
+        rng = random.Random(3)
+        counts = DealAudit(5)
+        for _ in range(20_000):
+            ids = rng.sample(range(1, 53), 5)
+            if ids[0] > 26 and rng.random() < 0.05:
+                ids[0] = next(card for card in range(1, 27) if card not in ids)
+            counts.add(ids)
+        report = counts.report()
+        assert not report["passed"]
+        assert not report["tests"]["positions"]["passed"]
+        assert "FAIL" in format_report(report)
+
+    def test_serial_dependence_fails(self):
+        """Test that deals following on from the previous deal are caught"""
+        counts = DealAudit(5)
+        rng = random.Random(4)
+        last = 1
+        for _ in range(5_000):
+            start = last % 52 + 1 if rng.random() < 0.5 else rng.randrange(1, 53)
+            ids = [(start + step * 7 - 1) % 52 + 1 for step in range(5)]
+            counts.add(ids)
+            last = ids[-1]
+        assert not counts.report()["tests"]["serial_between"]["passed"]
+
+
+class TestRun:
+    def test_processes_match_inline(self, monkeypatch):
+        """Test that a seed gives the same counts on a process pool as inline"""
+        monkeypatch.setattr(audit, "CHUNK", 300)
+        inline = run(1_000, 5, processes=1, seed=9)
+        pooled = run(1_000, 5, processes=2, seed=9)
+        assert pooled.deals == inline.deals == 1_000
+        assert list(pooled.position_counts) == list(inline.position_counts)
+        assert pooled.within == inline.within
+
+    def test_secure_mode(self):
+        """Test that the secure dealing mode can be audited"""
+        report = run(2_000, 5, secure=True).report()
+        assert report["deals"] == 2_000
+        assert sum(run(100, 7, secure=True).card_counts) == 700
@@ -0,0 +1,143 @@
+import pytest
+import sys
+import os
+import random
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import batch
+from model.card import Card
+from model.deck import Deck
+from model.hand import Hand
+
+
+def ids(cards: list[Card]) -> list[int]:
+    return [Deck.card_id(card) for card in cards]
+
+
+class TestBatch:
+    def test_deal_is_seeded(self):
+        """Test that the same seed deals the same decks and a different seed does not"""
+        assert batch.deal(20, 4, seed=7).decks == batch.deal(20, 4, seed=7).decks
+        assert batch.deal(20, 4, seed=7).decks != batch.deal(20, 4, seed=8).decks
+
+    def test_every_row_is_a_deck(self):
+        """Test that each game gets all 52 cards once, split into hands and stub"""
+        deals = batch.deal(50, 6, seed=1)
+        assert len(deals.decks) == 50 * 52
+        for game in range(deals.games):
+            row = deals.decks[game * 52 : (game + 1) * 52]
+            assert sorted(row) == list(range(1, 53))
+            hands = [card for player in range(6) for card in deals.hand(game, player)]
+            assert hands + list(deals.stub(game)) == list(row)
+        assert len(deals.stub(0)) == 52 - 30
+
+    def test_deal_rejects_bad_sizes(self):
+        """Test that impossible deals raise ValueError"""
+        with pytest.raises(ValueError):
+            batch.deal(1, 11)
+        with pytest.raises(ValueError):
+            batch.deal(-1, 2)
+        assert batch.deal(0, 2).games == 0
+
+    def test_deal_is_roughly_uniform(self):
+        """Test that every card turns up first about equally often"""
+        deals = batch.deal(5200, 1, seed=3)
+        counts = [0] * 53
+        for game in range(deals.games):
+            counts[deals.decks[game * 52]] += 1
+        assert 50 < min(counts[1:]) and max(counts) < 150
+
+    def test_score_matches_hand(self):
+        """Test that packed scores equal packed Hand values and unpack back"""
+        deck = Deck()
+        rng = random.Random(5)
+        for _ in range(2000):
+            cards = rng.sample(list(deck._deck.values()), 5)
+            value = Hand(cards)._hand_value
+            assert batch.score(ids(cards)) == batch.pack(value)
+            assert batch.unpack(batch.pack(value)) == value
+
+    def test_score_orders_like_hand(self):
+        """Test ordering across categories, including the wheel"""
+        wheel = [Card("A", "♠"), Card("2", "♥"), Card("3", "♠"), Card("4", "♠"), Card("5", "♠")]
+        six_high = [Card("6", "♠"), Card("2", "♥"), Card("3", "♠"), Card("4", "♠"), Card("5", "♠")]
+        trips = [Card("A", "♠"), Card("A", "♥"), Card("A", "♦"), Card("4", "♠"), Card("5", "♠")]
+        steel_wheel = [Card("A", "♠"), Card("2", "♠"), Card("3", "♠"), Card("4", "♠"), Card("5", "♠")]
+        scores = [batch.score(ids(hand)) for hand in (trips, wheel, six_high, steel_wheel)]
+        assert scores == sorted(scores) and len(set(scores)) == 4
+        assert batch.unpack(scores[3]) == (Hand.STRAIGHT_FLUSH, 5, -1, -1, -1, -1)
+
+    def test_showdown_matches_hand(self):
+        """Test that showdown picks the same winners as comparing Hands"""
+        deals = batch.deal(300, 5, seed=11)
+        deck = Deck()
+        winners = batch.showdown(deals)
+        for game in range(deals.games):
+            hands = [Hand([deck._deck[card_id] for card_id in deals.hand(game, seat)]) for seat in range(5)]
+            best = max(hand._hand_value for hand in hands)
+            assert winners[game] == tuple(seat for seat in range(5) if hands[seat]._hand_value == best)
+
+    def test_showdown_split_pot(self):
+        """Test that identical hand values share the pot"""
+        first = ids([Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("9", "♥")])
+        second = ids([Card("A", "♦"), Card("K", "♦"), Card("Q", "♦"), Card("J", "♦"), Card("9", "♣")])
+        used = set(first + second)
+        rest = [card_id for card_id in range(1, 53) if card_id not in used]
+        deals = batch.Deals(1, 2, 5, array("B", first + second + rest))
+        assert batch.showdown(deals) == [(0, 1)]
+        with pytest.raises(ValueError):
+            batch.scores(batch.deal(1, 2, hand_size=7))
+
+    def test_hold_positions_match_draw_table(self):
+        """Test that batch holds agree with draw_table.advise"""
+        from model.draw_table import advise
+
+        rng = random.Random(2)
+        for _ in range(500):
+            hand = rng.sample(range(1, 53), 5)
+            keys = [((card_id - 1) % 13 + 2, (card_id - 1) // 13) for card_id in hand]
+            assert tuple(batch.hold_positions(hand, batch.table())) == advise(keys)
+        assert batch.hold_positions([1, 2, 3, 4, 5], {}) == [0, 1, 2, 3, 4]
+
+    def test_draw_replaces_from_the_stub(self):
+        """Test that discards are replaced from the top of the stub in seat order"""
+        deals = batch.deal(200, 4, seed=9)
+        after, exchanged = batch.draw(deals)
+        assert len(exchanged) == 200 * 4 and max(exchanged) <= 3
+        for game in range(deals.games):
+            row = after.decks[game * 52 : (game + 1) * 52]
+            assert sorted(row) == list(range(1, 53))
+            top = 20
+            for seat in range(4):
+                hand = deals.hand(game, seat)
+                keep = [hand[i] for i in batch.hold_positions(hand, batch.table())]
+                count = exchanged[game * 4 + seat]
+                assert list(after.hand(game, seat)) == keep + list(deals.decks[game * 52 + top : game * 52 + top + count])
+                top += count
+
+    def test_draw_stand_pat_and_full_exchange(self):
+        """Test an empty policy keeps every hand and a zero mask replaces all five cards"""
+        deals = batch.deal(10, 3, seed=4)
+        after, exchanged = batch.draw(deals, {})
+        assert after.decks == deals.decks and not any(exchanged)
+        board = 0
+        for card_id in deals.hand(0, 0):
+            board |= 1 << (card_id - 1)
+        after, exchanged = batch.draw(deals, {batch.canonical(board): 0})
+        assert exchanged[0] == 5
+        assert list(after.hand(0, 0)) == list(deals.stub(0)[:5])
+        crowded = batch.deal(1, 10, seed=4)
+        board = 0
+        for card_id in crowded.hand(0, 0):
+            board |= 1 << (card_id - 1)
+        with pytest.raises(ValueError):
+            batch.draw(crowded, {batch.canonical(board): 0})
+
+    def test_win_shares(self):
+        """Test that split pots are shared and shares add up to one"""
+        assert batch.win_shares([(0,), (1,), (0, 1)], 3) == [0.5, 0.5, 0.0]
+        shares = batch.win_shares(batch.showdown(batch.draw(batch.deal(600, 3, seed=1))[0]), 3)
+        assert sum(shares) == pytest.approx(1.0)
+        assert all(0.25 < share < 0.42 for share in shares)
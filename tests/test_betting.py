@@ -0,0 +1,281 @@
+import pytest
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model.betting import Betting
+from model.card import Card
+from model.hand import Hand
+
+
+class TestBetting:
+    def test_blinds_and_first_to_act(self):
+        """Test that blinds are posted left of the button and action starts after the big blind"""
+        betting = Betting([100] * 4, button=0)
+        betting.post_blinds(5, 10)
+        assert list(betting.committed) == [0, 5, 10, 0]
+        assert betting.pot == 15
+        assert betting.to_act == 3
+
+    def test_heads_up_button_posts_small_blind(self):
+        """Test that heads-up the button posts the small blind and acts first"""
+        betting = Betting([100, 100], button=1)
+        betting.post_blinds(5, 10)
+        assert list(betting.committed) == [10, 5]
+        assert betting.to_act == 1
+
+    def test_antes_do_not_count_toward_the_bet(self):
+        """Test that antes go in the pot without changing what each seat must call"""
+        betting = Betting([100, 100, 3], button=0)
+        betting.post_antes(5)
+        assert list(betting.committed) == [5, 5, 3]
+        assert list(betting.street) == [0, 0, 0]
+        assert betting.is_all_in(2)
+        assert betting.to_act == 1
+
+    def test_acting_out_of_turn_raises(self):
+        """Test that only the seat to act may act"""
+        betting = Betting([100] * 3)
+        betting.post_blinds(5, 10)
+        with pytest.raises(ValueError):
+            betting.call(1)
+
+    def test_check_facing_bet_raises(self):
+        """Test that a seat facing a bet cannot check"""
+        betting = Betting([100] * 3)
+        betting.post_blinds(5, 10)
+        with pytest.raises(ValueError):
+            betting.check(0)
+
+    def test_big_blind_gets_option(self):
+        """Test that the big blind may still act after everyone calls"""
+        betting = Betting([100] * 3, button=0)
+        betting.post_blinds(5, 10)
+        betting.call(0)
+        betting.call(1)
+        assert betting.to_act == 2
+        betting.check(2)
+        assert betting.street_complete()
+        assert betting.to_act == -1
+
+    def test_minimum_raise(self):
+        """Test that raises must be at least the previous raise increment"""
+        betting = Betting([1000] * 3, button=0)
+        betting.post_blinds(5, 10)
+        with pytest.raises(ValueError):
+            betting.raise_to(0, 15)
+        betting.raise_to(0, 30)
+        with pytest.raises(ValueError):
+            betting.raise_to(1, 45)
+        betting.raise_to(1, 50)
+        assert betting.current_bet == 50
+        assert betting.min_raise == 20
+
+    def test_full_raise_reopens_action(self):
+        """Test that a raise gives seats that already acted another turn"""
+        betting = Betting([1000] * 3, button=0)
+        betting.post_blinds(5, 10)
+        betting.call(0)
+        betting.call(1)
+        betting.raise_to(2, 40)
+        assert betting.to_act == 0
+        betting.call(0)
+        betting.fold(1)
+        assert betting.street_complete()
+
+    def test_next_street_starts_left_of_button(self):
+        """Test that later streets reset the bet and start left of the button"""
+        betting = Betting([100] * 3, button=0)
+        betting.post_blinds(5, 10)
+        with pytest.raises(ValueError):
+            betting.next_street()
+        betting.call(0)
+        betting.call(1)
+        betting.check(2)
+        betting.next_street()
+        assert betting.current_bet == 0
+        assert betting.to_act == 1
+        betting.bet(1, 20)
+        with pytest.raises(ValueError):
+            betting.bet(2, 40)
+
+    def test_minimum_bet_resets_each_street(self):
+        """Test that a big preflop raise does not carry its increment to later streets"""
+        betting = Betting([1000] * 3, button=0)
+        betting.post_blinds(5, 10)
+        betting.raise_to(0, 200)
+        betting.call(1)
+        betting.call(2)
+        for _ in range(3):
+            betting.next_street()
+            assert betting.min_raise == 10
+            with pytest.raises(ValueError):
+                betting.bet(1, 5)
+            betting.bet(1, 10)
+            betting.raise_to(2, 20)
+            betting.call(0)
+            betting.call(1)
+            assert betting.street_complete()
+        assert betting.pot == 600 + 3 * 60
+        assert list(betting.stacks) == [740] * 3
+
+    def test_no_blinds_street_minimum(self):
+        """Test that without blinds any bet opens a later street"""
+        betting = Betting([100] * 2, button=0)
+        betting.bet(1, 50)
+        betting.call(0)
+        betting.next_street()
+        assert betting.min_raise == 0
+        betting.bet(1, 1)
+
+    def test_short_all_in_does_not_reopen(self):
+        """Test that seats that acted may only call or fold after an all-in short of a full raise"""
+        betting = Betting([1000, 1000, 1000, 55], button=0)
+        betting.post_blinds(5, 10)
+        betting.raise_to(3, 40)
+        betting.call(0)
+        betting.call(1)
+        betting.call(2)
+        betting.next_street()
+        betting.bet(1, 10)
+        betting.call(2)
+        # Seat 3 has 15 left: all-in to 15 is short of the full raise to 20.
+        betting.all_in(3)
+        assert betting.current_bet == 15
+        assert betting.can_raise(0)
+        betting.call(0)
+        assert betting.to_act == 1 and not betting.can_raise(1)
+        with pytest.raises(ValueError):
+            betting.raise_to(1, 100)
+        betting.all_in(1)
+        assert betting.stacks[1] == 1000 - 40 - 15
+        betting.call(2)
+        assert betting.street_complete()
+
+    def test_full_raise_after_short_all_in_reopens(self):
+        """Test that a seat yet to act may make a full raise after a short all-in, reopening the betting"""
+        betting = Betting([1000, 1000, 25, 1000], button=0)
+        betting.post_blinds(5, 10)
+        betting.call(3)
+        betting.call(0)
+        betting.call(1)
+        betting.check(2)
+        betting.next_street()
+        betting.bet(1, 10)
+        betting.all_in(2)
+        assert betting.current_bet == 15
+        assert betting.can_raise(3)
+        with pytest.raises(ValueError):
+            betting.raise_to(3, 20)
+        betting.raise_to(3, 40)
+        betting.call(0)
+        assert betting.to_act == 1 and betting.can_raise(1)
+        betting.raise_to(1, 100)
+
+    def test_everyone_folds(self):
+        """Test that the hand ends when one seat is left and that seat takes the pot"""
+        betting = Betting([100] * 3, button=0)
+        betting.post_blinds(5, 10)
+        betting.fold(0)
+        betting.fold(1)
+        assert betting.hand_over()
+        assert betting.to_act == -1
+        payouts = betting.resolve([0, 0, 0])
+        assert list(payouts) == [0, 0, 15]
+        assert list(betting.stacks) == [100, 95, 105]
+
+    def test_side_pots(self):
+        """Test that all-ins for different amounts build a main pot and side pots"""
+        betting = Betting([50, 100, 300, 300], button=3)
+        betting.all_in(0)
+        betting.all_in(1)
+        betting.all_in(2)
+        betting.call(3)
+        assert betting.pots() == [(200, [0, 1, 2, 3]), (150, [1, 2, 3]), (400, [2, 3])]
+
+    def test_folded_chips_stay_in_pot(self):
+        """Test that folded seats fund pots they are not eligible for"""
+        betting = Betting([100, 30, 100], button=2)
+        betting.bet(0, 60)
+        betting.all_in(1)
+        betting.fold(2)
+        assert betting.pots() == [(60, [0, 1]), (30, [0])]
+
+    def test_resolve_side_pots(self):
+        """Test that each pot goes to the best hand among its eligible seats"""
+        betting = Betting([50, 100, 300, 300], button=3)
+        betting.all_in(0)
+        betting.all_in(1)
+        betting.all_in(2)
+        betting.call(3)
+        payouts = betting.resolve([4, 3, 1, 2])
+        assert list(payouts) == [200, 150, 0, 400]
+        assert list(betting.stacks) == [200, 150, 0, 400]
+
+    def test_resolve_with_hands(self):
+        """Test that Hand objects can be used as strengths"""
+        betting = Betting([100, 100], button=0)
+        betting.bet(1, 50)
+        betting.call(0)
+        flush = Hand([Card(rank, "♥") for rank in ("2", "5", "9", "J", "K")])
+        pair = Hand([Card("A", "♠"), Card("A", "♦"), Card("3", "♣"), Card("7", "♣"), Card("9", "♠")])
+        payouts = betting.resolve([pair, flush])
+        assert list(payouts) == [0, 100]
+
+    def test_split_pot_odd_chip(self):
+        """Test that tied seats split a pot and the odd chip goes left of the button"""
+        betting = Betting([100, 100, 100], button=1)
+        betting.post_antes(5)
+        betting.fold(2)
+        betting.check(0)
+        betting.check(1)
+        payouts = betting.resolve([7, 7, 9])
+        assert list(payouts) == [8, 7, 0]
+
+    def test_folded_strength_is_ignored(self):
+        """Test that a folded seat cannot win even with the best strength"""
+        betting = Betting([100] * 3, button=0)
+        betting.post_blinds(5, 10)
+        betting.raise_to(0, 30)
+        betting.call(1)
+        betting.fold(2)
+        payouts = betting.resolve([1, 2, 99])
+        assert list(payouts) == [0, 70, 0]
+
+    def test_uncalled_chips_return(self):
+        """Test that chips nobody else could match go back to the seat that bet them"""
+        betting = Betting([500, 40], button=1)
+        betting.post_blinds(5, 10)
+        betting.raise_to(1, 40)
+        betting.all_in(0)
+        assert betting.pots() == [(80, [0, 1]), (460, [0])]
+        payouts = betting.resolve([1, 2])
+        assert list(payouts) == [460, 80]
+
+    def test_chips_are_conserved(self):
+        """Test random hands never create or lose chips"""
+        rng = random.Random(7)
+        for _ in range(300):
+            num_seats = rng.randint(2, 10)
+            betting = Betting([rng.randint(1, 200) for _ in range(num_seats)], button=rng.randrange(num_seats))
+            total = sum(betting.stacks)
+            betting.post_antes(1)
+            while betting.to_act != -1:
+                seat = betting.to_act
+                choice = rng.random()
+                if choice < 0.2:
+                    betting.fold(seat)
+                elif choice < 0.4:
+                    betting.all_in(seat)
+                else:
+                    betting.call(seat)
+            payouts = betting.resolve([rng.randint(0, 3) for _ in range(num_seats)])
+            assert sum(payouts) == sum(betting.committed)
+            assert sum(betting.stacks) == total
+
+    def test_too_few_seats(self):
+        """Test that betting needs at least two seats"""
+        with pytest.raises(ValueError):
+            Betting([100])
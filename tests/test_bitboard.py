@@ -0,0 +1,38 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import bitboard
+from model.card import Card
+from model.deck import Deck
+
+
+class TestBitboard:
+    def test_bits_lowest_first(self):
+        """Test that bits yields set bit indexes in ascending order"""
+        assert bitboard.bits(0) == ()
+        assert bitboard.bits(0b1011 | 1 << 51) == (0, 1, 3, 51)
+        assert bitboard.bits(bitboard.FULL_BOARD) == tuple(range(52))
+
+    def test_rank_and_suit_extraction(self):
+        """Test rank masks, rank counts and suit counts against the cards"""
+        cards = [Card("A", "♠"), Card("A", "♥"), Card("K", "♠"), Card("2", "♣"), Card("2", "♠")]
+        board = bitboard.board(cards)
+        assert bitboard.rank_mask(board) == 1 << 12 | 1 << 11 | 1
+        assert bitboard.suit_mask(board, Card.SUITS.index("♠")) == 1 << 12 | 1 << 11 | 1
+        assert bitboard.suit_counts(board) == (1, 0, 1, 3)
+        assert bitboard.rank_count(board, 14) == 2
+        assert bitboard.rank_count(board, 7) == 0
+        counts = bitboard.rank_counts(board)
+        assert len(counts) == 15
+        assert counts[14] == 2 and counts[13] == 1 and counts[2] == 2 and sum(counts) == 5
+
+    def test_full_deck(self):
+        """Test that a full deck has four of every rank and thirteen of every suit"""
+        board = bitboard.board(Deck()._deck.values())
+        assert board == bitboard.FULL_BOARD
+        assert bitboard.suit_counts(board) == (13, 13, 13, 13)
+        assert bitboard.rank_counts(board)[2:] == [4] * 13
+        assert bitboard.rank_mask(board) == bitboard.SUIT_MASK
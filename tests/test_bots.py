@@ -0,0 +1,98 @@
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from server import loadgen
+from server.bots import Bot, BotTable, LatencyRecorder
+from server.client import TableClient
+from server.table_server import TableServer
+
+
+class TestBotStrategy:
+    def discards(self, hand_list):
+        # Bots play the rule based strategy unless given another.
+        return Bot(None, 0, "bot").strategy.discards(hand_list)
+
+    def test_discards_kickers(self):
+        """Test that a default bot keeps grouped cards and throws away kickers"""
+        assert self.discards(["One Pair", "A♠", "A♥", "K♦", "Q♣", "J♠"]) == ["K♦", "Q♣", "J♠"]
+        assert self.discards(["Two Pair", "A♠", "A♥", "K♦", "K♣", "Q♠"]) == ["Q♠"]
+        assert self.discards(["Three of a Kind", "A♠", "A♥", "A♦", "K♣", "Q♠"]) == ["K♣", "Q♠"]
+
+    def test_high_card_keeps_two_highest(self):
+        """Test that a high card hand keeps its two highest cards"""
+        assert self.discards(["High Card", "A♠", "K♥", "Q♦", "J♣", "9♠"]) == ["Q♦", "J♣", "9♠"]
+
+    def test_made_hands_stand_pat(self):
+        """Test that straights and better are kept whole"""
+        assert self.discards(["Straight", "10♠", "J♣", "Q♦", "K♥", "A♠"]) == []
+        assert self.discards(["Full House", "A♠", "A♥", "A♦", "K♣", "K♠"]) == []
+        assert self.discards([]) == []
+
+
+class TestLatencyRecorder:
+    def test_percentiles(self):
+        """Test that percentiles are reported in milliseconds"""
+        latencies = LatencyRecorder()
+        for ms in range(1, 101):
+            latencies.record("show", ms * 1_000_000)
+        points = latencies.percentiles("show")
+        assert points[50] == 51.0
+        assert points[99] == 99.0
+        assert latencies.percentiles("missing") == {50: 0.0, 99: 0.0}
+
+    def test_merge(self):
+        """Test that recorders merge per action"""
+        a = LatencyRecorder()
+        b = LatencyRecorder()
+        a.record("deal", 1_000_000)
+        b.record("deal", 3_000_000)
+        b.record("reveal", 2_000_000)
+        a.merge(b)
+        assert a.count == 3
+        assert a.actions() == ["deal", "reveal"]
+
+
+class TestBots:
+    def test_bot_table_plays_draw_hands(self):
+        """Test that a table of bots plays draw hands against a local server"""
+
+        async def main():
+            server = TableServer()
+            host, port = await server.start()
+            clients = [await TableClient.connect(host, port) for _ in range(3)]
+            latencies = LatencyRecorder()
+            table = BotTable([Bot(client, 7, f"bot{i}", latencies) for i, client in enumerate(clients)], True)
+            await table.sit()
+            winners = [await table.play_hand() for _ in range(5)]
+            await table.stand()
+            for client in clients:
+                await client.close()
+            server.close()
+            await server.wait_closed()
+            return table, winners, latencies
+
+        table, winners, latencies = asyncio.run(main())
+        assert table.hands == 5
+        assert all(1 <= len(seats) <= 3 for seats in winners)
+        assert {"join", "deal", "show", "reveal", "leave"} <= set(latencies.actions())
+
+    def test_load_generator_reports_throughput(self):
+        """Test that the load generator reports throughput and latency percentiles"""
+
+        async def main():
+            server = TableServer()
+            host, port = await server.start()
+            stats = await loadgen.run(host, port, players=8, table_size=4, draw_game=False, ramp=0.05, duration=0.3)
+            server.close()
+            await server.wait_closed()
+            return stats
+
+        stats = asyncio.run(main())
+        assert stats["tables"] == 2
+        assert stats["connections"] == 8
+        assert stats["hands"] > 0
+        assert stats["actions_per_s"] > 0
+        assert 0 < stats["p50_ms"] <= stats["p99_ms"]
@@ -0,0 +1,104 @@
+import pytest
+import sys
+import os
+import random
+from itertools import combinations
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import canonical
+from model.card import Card
+from model.deck import Deck
+
+
+def relabel(mask: int, suits: list[int]) -> int:
+    # Moves every card of suit s to suit suits[s].
+    result = 0
+    for bit in range(52):
+        if mask >> bit & 1:
+            result |= 1 << (suits[bit // 13] * 13 + bit % 13)
+    return result
+
+
+class TestCanonical:
+    def test_board_uses_card_ids(self):
+        """Test that a card's bit is its deck id minus one"""
+        deck = Deck()
+        assert canonical.board([deck._deck[1]]) == 1
+        assert canonical.board([deck._deck[52]]) == 1 << 51
+        assert canonical.board(deck._deck.values()) == (1 << 52) - 1
+
+    def test_invariant_under_suit_relabelling(self):
+        """Test that permuting suits never changes the key, with or without dead cards"""
+        rng = random.Random(1)
+        for _ in range(500):
+            bits = rng.sample(range(52), 9)
+            hand = sum(1 << bit for bit in bits[:5])
+            dead = sum(1 << bit for bit in bits[5:])
+            suits = [0, 1, 2, 3]
+            rng.shuffle(suits)
+            assert canonical.canonical(hand) == canonical.canonical(relabel(hand, suits))
+            assert canonical.canonical(hand, dead) == canonical.canonical(relabel(hand, suits), relabel(dead, suits))
+
+    def test_dead_cards_distinguish_hands(self):
+        """Test that the same hand with dead cards in different suits gets different keys"""
+        hand = canonical.board([Card("A", "♠"), Card("K", "♠")])
+        suited_dead = canonical.board([Card("2", "♠")])
+        offsuit_dead = canonical.board([Card("2", "♥")])
+        assert canonical.canonical(hand, suited_dead) != canonical.canonical(hand, offsuit_dead)
+        assert canonical.canonical(hand) < 1 << 52
+
+    def test_canonical_is_a_valid_board(self):
+        """Test that the canonical hand keeps the card count and is its own canonical form"""
+        rng = random.Random(2)
+        for _ in range(200):
+            hand = sum(1 << bit for bit in rng.sample(range(52), 7))
+            key = canonical.canonical(hand)
+            assert key.bit_count() == 7
+            assert canonical.canonical(key) == key
+
+    def test_canonical_cards(self):
+        """Test the Card convenience wrapper"""
+        cards = [Card("A", "♣"), Card("A", "♦")]
+        assert canonical.canonical_cards(cards) == canonical.canonical_cards([Card("A", "♥"), Card("A", "♠")])
+
+    def test_class_counts(self):
+        """Test the known numbers of suit-canonical hands"""
+        assert [len(canonical.CanonicalIndex(n)) for n in range(6)] == [1, 13, 169, 1755, 16432, 134459]
+
+    def test_index_matches_enumeration(self):
+        """Test that every three card hand maps to a dense index that round trips"""
+        index = canonical.CanonicalIndex(3)
+        seen = set()
+        for bits in combinations(range(52), 3):
+            hand = sum(1 << bit for bit in bits)
+            i = index.index(hand)
+            assert index.board(i) == canonical.canonical(hand)
+            seen.add(i)
+        assert seen == set(range(len(index)))
+        with pytest.raises(ValueError):
+            index.index(1)
+
+    def test_index_with_dead_cards(self):
+        """Test that hands with dead cards map to a dense index over canonical (hand, dead) classes"""
+        index = canonical.CanonicalIndex(2, 1)
+        seen = set()
+        for bits in combinations(range(52), 3):
+            for dead_bit in bits:
+                hand = sum(1 << bit for bit in bits if bit != dead_bit)
+                i = index.index(hand, 1 << dead_bit)
+                assert index.board(i) == canonical.canonical(hand, 1 << dead_bit)
+                seen.add(i)
+        assert seen == set(range(len(index))) and len(index) == 5083
+        assert len(canonical.CanonicalIndex(0, 2)) == 169
+        with pytest.raises(ValueError):
+            index.index(0b11)
+        with pytest.raises(ValueError):
+            index.index(0b11, 0b1)
+        with pytest.raises(ValueError):
+            canonical.CanonicalIndex(50, 3)
+
+    def test_suit_order(self):
+        """Test that suits are ordered by their rank masks and ties keep suit order"""
+        hand = canonical.board([Card("2", "♥"), Card("3", "♥"), Card("A", "♦"), Card("A", "♠")])
+        assert canonical.suit_order(hand) == [1, 3, 2, 0]
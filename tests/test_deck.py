@@ -1,6 +1,7 @@
 import pytest
 import sys
 import os
+import random
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -33,7 +34,7 @@ class TestDeck:
         dealt_cards = deck.random_deal(5)
 
         assert len(dealt_cards) == 5
-        assert len(deck._dealt) == 5
+        assert deck._dealt.bit_count() == 5
 
     def test_random_deal_one(self):
         """Test that random_deal_one returns a single card"""
@@ -41,20 +42,50 @@ class TestDeck:
         card = deck.random_deal_one()
 
         assert isinstance(card, Card)
-        assert len(deck._dealt) == 1
+        assert deck._dealt.bit_count() == 1
 
     def test_reset_deck(self):
         """Test that reset_deck clears dealt cards"""
         deck = Deck()
         deck.random_deal(5)
-        assert len(deck._dealt) == 5
+        assert deck._dealt.bit_count() == 5
 
         deck.reset_deck()
-        assert len(deck._dealt) == 0
+        assert deck._dealt.bit_count() == 0
 
     def test_deal_all_cards(self):
         """Test that we can deal all 52 cards"""
         deck = Deck()
         all_cards = deck.random_deal(52)
         assert len(all_cards) == 52
-        assert len(deck._dealt) == 52
+        assert deck._dealt.bit_count() == 52
+
+    def test_dealt_cards_are_a_bitboard(self):
+        """Test that dealt cards are tracked as bits and no longer available"""
+        deck = Deck()
+        dealt = deck.random_deal(7)
+        board = 0
+        for card in dealt:
+            board |= 1 << (Deck.card_id(card) - 1)
+        assert deck._dealt == board
+        assert deck.available() == ((1 << 52) - 1) & ~board
+        assert deck.cards(board) == sorted(dealt, key=Deck.card_id)
+
+    def test_remove_dead_cards(self):
+        """Test that removed cards are never dealt"""
+        deck = Deck()
+        dead = deck._deck[1].bit | deck._deck[52].bit
+        deck.remove(dead)
+        remaining = deck.random_deal(50)
+        assert deck._deck[1] not in remaining and deck._deck[52] not in remaining
+        with pytest.raises(ValueError):
+            deck.random_deal_one()
+
+    def test_decks_deal_from_their_own_generator(self):
+        """Test that a seeded deck repeats its deal and ignores the global generator"""
+        first = Deck(random.Random(42))
+        random.seed(0)
+        second = Deck(random.Random(42))
+        random.seed(1)
+        assert [str(card) for card in first.random_deal(10)] == [str(card) for card in second.random_deal(10)]
+        assert str(first.random_deal_one()) == str(second.random_deal_one())
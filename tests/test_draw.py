@@ -0,0 +1,77 @@
+import pytest
+import sys
+import os
+import random
+from itertools import combinations
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import draw
+from model.card import Card
+from model.hand import Hand
+
+DECK = [(rank, suit) for suit in range(4) for rank in draw.RANKS]
+RANK_NAMES = {value: name for name, value in Card.RANK_DICT.items()}
+
+
+def to_hand(cards: list) -> Hand:
+    return Hand([Card(RANK_NAMES[rank], Card.SUITS[suit]) for rank, suit in cards])
+
+
+class TestDraw:
+    def test_hand_value_matches_hand(self):
+        """Test that hand_value builds the same tuple as Hand.best_hand"""
+        rng = random.Random(1)
+        for _ in range(2000):
+            cards = rng.sample(DECK, 5)
+            ranks = tuple(sorted((rank for rank, _ in cards), reverse=True))
+            flush = len({suit for _, suit in cards}) == 1
+            assert draw.hand_value(ranks, flush) == to_hand(cards)._hand_value
+
+    def test_kickers(self):
+        """Test that one pair and four of a kind break ties on their unpaired ranks"""
+        assert draw.hand_value((14, 13, 5, 5, 3), False) == (Hand.ONE_PAIR, 5, 14, 13, 3, -1)
+        assert draw.hand_value((14, 12, 5, 5, 3), False) < draw.hand_value((14, 13, 5, 5, 3), False)
+        assert len([value for value in draw.STRENGTHS if value[0] == Hand.ONE_PAIR]) == 2860
+        assert draw.hand_value((9, 9, 9, 9, 2), False) < draw.hand_value((9, 9, 9, 9, 3), False)
+        assert len(draw.STRENGTHS) == 7462
+
+    def test_strengths_follow_hand_order(self):
+        """Test that stronger hands always have a higher strength"""
+        rng = random.Random(2)
+        for _ in range(500):
+            first, second = rng.sample(DECK, 5), rng.sample(DECK, 5)
+            if to_hand(first) < to_hand(second):
+                assert draw.strength(first) < draw.strength(second)
+        assert 0 < min(draw.STRENGTHS.values()) < max(draw.STRENGTHS.values()) < 1
+
+    def test_card_key(self):
+        """Test parsing card strings"""
+        assert draw.card_key("10♥") == (10, 2)
+        assert draw.card_key("A♠") == (14, 3)
+
+    def test_hold_value_matches_enumeration(self):
+        """Test that the counted expectation equals averaging over every possible draw"""
+        rng = random.Random(3)
+        hand = rng.sample(DECK, 5)
+        rest = [card for card in DECK if card not in hand]
+        for hold in [(0, 1, 2, 3), (1, 2, 4), (0, 3)]:
+            held = [hand[i] for i in hold]
+            draws = list(combinations(rest, 5 - len(hold)))
+            expected = sum(draw.strength(held + list(cards)) for cards in draws) / len(draws)
+            assert draw.hold_value(hand, hold) == pytest.approx(expected, abs=1e-12)
+
+    def test_best_hold_keeps_made_hands(self):
+        """Test that a straight stands pat and a pair of aces keeps the pair"""
+        straight = [(10, 0), (11, 1), (12, 2), (13, 3), (9, 0)]
+        assert draw.best_hold(straight)[0] == (0, 1, 2, 3, 4)
+        aces = [(14, 0), (14, 1), (5, 0), (9, 2), (2, 1)]
+        assert draw.best_hold(aces)[0] == (0, 1)
+
+    def test_best_hold_respects_discard_limit(self):
+        """Test that advice never exchanges more cards than allowed"""
+        junk = [(2, 0), (5, 1), (7, 2), (9, 3), (11, 0)]
+        assert len(draw.best_hold(junk)[0]) >= 5 - draw.MAX_DISCARDS
+        assert len(draw.best_hold(junk, max_discards=1)[0]) >= 4
+        with pytest.raises(ValueError):
+            draw.best_hold(junk[:4])
@@ -0,0 +1,68 @@
+import pytest
+import sys
+import os
+import random
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import draw_table
+from model.draw import RANKS, best_hold, hold_value
+
+DECK = [(rank, suit) for suit in range(4) for rank in RANKS]
+
+
+class TestDrawTable:
+    def test_canonical_ignores_suit_names_and_order(self):
+        """Test that relabelling suits or reordering cards keeps the key"""
+        rng = random.Random(1)
+        for _ in range(200):
+            hand = rng.sample(DECK, 5)
+            suits = [0, 1, 2, 3]
+            rng.shuffle(suits)
+            relabelled = [(rank, suits[suit]) for rank, suit in hand]
+            rng.shuffle(relabelled)
+            assert draw_table.canonical(hand)[0] == draw_table.canonical(relabelled)[0]
+
+    def test_canonical_separates_different_hands(self):
+        """Test that a flush and an unsuited hand with the same ranks get different keys"""
+        flush = [(2, 0), (5, 0), (9, 0), (11, 0), (13, 0)]
+        unsuited = [(2, 0), (5, 0), (9, 0), (11, 0), (13, 1)]
+        assert draw_table.canonical(flush)[0] != draw_table.canonical(unsuited)[0]
+
+    def test_round_trip(self):
+        """Test that entries survive dumps and loads"""
+        entries = array("Q", [(1 << 5) | 3, (7 << 5) | 31, (1 << 50) | 0])
+        assert draw_table.loads(draw_table.dumps(entries)) == {1: 3, 7: 31, 1 << 45: 0}
+
+    def test_corrupt_data_raises(self):
+        """Test that garbage and truncated tables raise ValueError"""
+        data = draw_table.dumps(array("Q", [1, 2, 3]))
+        with pytest.raises(ValueError):
+            draw_table.loads(b"nonsense")
+        with pytest.raises(ValueError):
+            draw_table.loads(data[:-3])
+
+    def test_solve_matches_best_hold(self):
+        """Test that a table built from some hands gives holds as good as solving them"""
+        rng = random.Random(2)
+        hands = [rng.sample(DECK, 5) for _ in range(20)]
+        table = draw_table.loads(draw_table.dumps(array("Q", sorted(draw_table._solve(hands)))))
+        for hand in hands:
+            key, order = draw_table.canonical(hand)
+            hold = tuple(sorted(order[i] for i in range(5) if table[key] >> i & 1))
+            assert hold_value(hand, hold) == pytest.approx(best_hold(hand)[1], abs=1e-12)
+
+    def test_shipped_table(self):
+        """Test that the shipped table covers every suit-canonical hand and answers quickly"""
+        table = draw_table.table()
+        assert len(table) == 134459
+        rng = random.Random(3)
+        hands = [rng.sample(DECK, 5) for _ in range(2000)]
+        start = time.perf_counter()
+        holds = [draw_table.advise(hand) for hand in hands]
+        assert (time.perf_counter() - start) / len(hands) < 0.0001
+        for hand, hold in list(zip(hands, holds))[:20]:
+            assert len(hold) >= 2
+            assert hold_value(hand, hold) == pytest.approx(best_hold(hand)[1], abs=1e-12)
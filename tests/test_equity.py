@@ -0,0 +1,117 @@
+import pytest
+import sys
+import os
+import math
+from itertools import combinations
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model.batch import score
+from model.deck import Deck
+from model.equity import METHODS, _pot_share, equity
+from model.hand import Hand
+
+CARDS = {Deck.card_id(card): card for card in Deck()._deck.values()}
+
+
+def cards(*ids):
+    return [CARDS[card_id] for card_id in ids]
+
+
+def exact_equity(known, opponents, pool):
+    # Enumerates every completion of the hero and every deal to the opponents.
+    total = 0.0
+    deals = 0
+    for completion in combinations(pool, 5 - len(known)):
+        hero = score(list(known) + list(completion))
+        rest = [card_id for card_id in pool if card_id not in completion]
+
+        def deal(left, remaining, best, ties):
+            nonlocal total, deals
+            if not remaining:
+                deals += 1
+                total += 1.0 if hero > best else (1.0 / (ties + 1) if hero == best else 0.0)
+                return
+            for hand in combinations(left, 5):
+                value = score(list(hand))
+                others = [card_id for card_id in left if card_id not in hand]
+                if value > best:
+                    deal(others, remaining - 1, value, 1)
+                else:
+                    deal(others, remaining - 1, best, ties + (value == best))
+
+        deal(rest, opponents, 0, 0)
+    return total / deals
+
+
+class TestPotShare:
+    def test_matches_brute_force(self):
+        """Test the pot share over every opponent set against counting each set"""
+        scores = [3, 5, 5, 7, 2, 5]
+        for opponents in (1, 2, 3):
+            expected = 0.0
+            for chosen in combinations(scores, opponents):
+                best = max(chosen)
+                expected += 1.0 if 5 > best else (1 / (chosen.count(5) + 1) if best == 5 else 0.0)
+            expected /= math.comb(len(scores), opponents)
+            assert _pot_share(5, scores, opponents) == pytest.approx(expected)
+
+
+class TestEquity:
+    # Only the 7s, 8s and 9s are unseen; a 12 card pool keeps exact enumeration quick.
+    POOL = [suit * 13 + rank + 1 for suit in range(4) for rank in (5, 6, 7)]
+
+    def dead(self, known):
+        return cards(*(card_id for card_id in range(1, 53) if card_id not in self.POOL and card_id not in known))
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_complete_hand_matches_enumeration(self, method):
+        """Test every method against exact equity for a complete hand"""
+        known = [1, 14, 40, 41, 2]
+        expected = exact_equity(known, 1, self.POOL)
+        result = equity(cards(*known), 1, self.dead(known), method=method, target=None, max_hands=20_000, seed=1)
+        assert abs(result["equity"] - expected) <= 4 * result["stderr"]
+        assert result["low"] <= result["equity"] <= result["high"]
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_partial_hand_matches_enumeration(self, method):
+        """Test every method against exact equity when the hero still needs cards"""
+        known = [13, 26, 52]
+        expected = exact_equity(known, 1, self.POOL)
+        assert 0 < expected < 1
+        result = equity(cards(*known), 1, self.dead(known), method=method, target=None, max_hands=20_000, seed=2)
+        assert abs(result["equity"] - expected) <= 4 * result["stderr"]
+
+    def test_two_opponents(self):
+        """Test a three-way pot against exact equity"""
+        known = [13, 26, 52, 1]
+        expected = exact_equity(known, 2, self.POOL)
+        assert 0 < expected < 1
+        for method in METHODS:
+            result = equity(cards(*known), 2, self.dead(known), method=method, target=None, max_hands=20_000, seed=3)
+            assert abs(result["equity"] - expected) <= 4 * result["stderr"], method
+
+    def test_stops_at_target(self):
+        """Test that sampling stops once the interval is narrow enough"""
+        hand = Hand(cards(13, 26, 3, 17, 45))
+        result = equity(hand, 2, target=0.01, seed=4)
+        assert result["high"] - result["equity"] <= 0.01
+        assert result["hands"] < 200_000
+
+    def test_stratified_beats_plain(self):
+        """Test that partitioning the deck narrows the interval for the same work"""
+        hand = cards(13, 26)
+        plain = equity(hand, 1, method="plain", target=None, max_hands=40_000, seed=5)
+        stratified = equity(hand, 1, method="stratified", target=None, max_hands=40_000, seed=5)
+        assert stratified["stderr"] < plain["stderr"]
+
+    def test_rejects_bad_input(self):
+        """Test that impossible requests raise ValueError"""
+        with pytest.raises(ValueError):
+            equity(cards(1, 2), method="bogus")
+        with pytest.raises(ValueError):
+            equity(cards(1, 2, 3, 4, 5, 6))
+        with pytest.raises(ValueError):
+            equity(cards(1, 2), opponents=0)
+        with pytest.raises(ValueError):
+            equity(cards(1, 2), opponents=10)
@@ -1,9 +1,11 @@
 import pytest
 import sys
 import os
+import subprocess
 from model.game import PokerGame
 from model.hand import Hand
 from model.card import Card
+from model.strategy import RandomStrategy, RuleBasedStrategy
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -30,6 +32,24 @@ class TestPokerGame:
         game.remove_player("Bob")
         assert len(game._players_hands) == 0
 
+    def test_add_duplicate_player(self):
+        """Test that adding a player name twice raises ValueError"""
+        game = PokerGame()
+        game.add_player("Alice")
+        with pytest.raises(ValueError, match="Player 'Alice' already exists"):
+            game.add_player("Alice")
+
+    def test_player_names_in_seat_order(self):
+        """Test that player names are reported in join order"""
+        game = PokerGame()
+        for name in ["Alice", "Bob", "Carol"]:
+            game.add_player(name)
+        assert game.remove_player("Bob")
+        assert not game.remove_player("Bob")
+        assert game.player_names() == ("Alice", "Carol")
+        assert game.num_players == 2
+        assert game.has_player("Carol")
+
     def test_get_nonexistent_player(self):
         """Test that getting non-existent player raises ValueError"""
         game = PokerGame()
@@ -71,7 +91,7 @@ class TestPokerGame:
         assert hand_display == []
 
     def test_exchange_cards(self):
-        """Test that cards can be exchanged"""
+        """Test that cards can be exchanged and the exchange is remembered until the next hand"""
         game = PokerGame()
         game.add_player("Grace")
         game.state = "ready"
@@ -84,6 +104,84 @@ class TestPokerGame:
         new_hand = game.exchange_cards(player, ["A♠"])
         assert len(new_hand) > 0
         assert new_hand != original_hand
+        assert game.has_exchanged(player)
+        game.restart_game()
+        assert not game.has_exchanged(player)
+
+    def test_play_round_without_ui(self):
+        """Test that strategies can play whole draw hands with no UI"""
+        game = PokerGame()
+        for name in ["Alice", "Bob", "Carol"]:
+            game.add_player(name)
+        game.state = "ready"
+        game.set_game_of_draw(True)
+        strategies = {"Alice": RandomStrategy(seed=1), "Bob": RuleBasedStrategy(), "Carol": RuleBasedStrategy()}
+        for _ in range(5):
+            winners = game.play_round(strategies)
+            assert winners and all(game.has_player(player.name) for player in winners)
+            assert game.state == "finished"
+            assert game.get_game_of_draw()
+            boards = [hand.board for hand in game._players_hands.values()]
+            assert all(board & game._deck._dealt == board for board in boards)
+            assert sum(board.bit_count() for board in boards) == sum(boards).bit_count() == 15
+
+        game.remove_player("Bob")
+        game.remove_player("Carol")
+        with pytest.raises(ValueError):
+            game.play_round(RuleBasedStrategy())
+
+    def test_play_round_rejects_bad_discards(self):
+        """Test that a strategy discarding too many cards or cards it does not hold stops the round"""
+
+        class Greedy(RuleBasedStrategy):
+            def __init__(self, pick):
+                self.pick = pick
+
+            def choose_discards(self, hand_lists):
+                return [self.pick(hand_list) for hand_list in hand_lists]
+
+        for pick in (lambda hand: hand[1:5], lambda hand: ["X♠"], lambda hand: [hand[1], hand[1]]):
+            game = PokerGame()
+            game.add_player("Alice")
+            game.add_player("Bob")
+            game.state = "ready"
+            game.set_game_of_draw(True)
+            with pytest.raises(ValueError):
+                game.play_round(Greedy(pick))
+            assert all(len(game.show_hand(player)) == 6 for player in game._players_hands)
+            assert game._deck._dealt.bit_count() == 10
+
+    def test_import_skips_draw_tables(self):
+        """Test that importing the game does not build the draw, equity or strategy tables"""
+        code = "import sys, model.game; print(sorted(m for m in ('model.draw', 'model.equity', 'model.batch', 'model.strategy') if m in sys.modules))"
+        root = os.path.join(os.path.dirname(__file__), "..")
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "[]"
+
+    def test_suggest_exchange(self):
+        """Test that draw advice keeps a made pair and stands pat on a straight"""
+        game = PokerGame()
+        game.add_player("Alice")
+        game.add_player("Bob")
+        alice = game.get_player("Alice")
+        bob = game.get_player("Bob")
+        assert game.suggest_exchange(alice) == []
+        game._players_hands[alice] = Hand([Card("9", "♠"), Card("A", "♥"), Card("4", "♦"), Card("A", "♣"), Card("7", "♠")])
+        game._players_hands[bob] = Hand([Card("9", "♠"), Card("10", "♥"), Card("J", "♦"), Card("Q", "♣"), Card("K", "♠")])
+        assert set(game.suggest_exchange(alice)) == {"9♠", "4♦", "7♠"}
+        assert game.suggest_exchange(bob) == []
+
+    def test_hand_equity(self):
+        """Test the equity hint for a dealt hand"""
+        game = PokerGame()
+        game.add_player("Alice")
+        alice = game.get_player("Alice")
+        assert game.hand_equity(alice) == 0.0
+        game._players_hands[alice] = Hand([Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("10", "♠")])
+        assert game.hand_equity(alice) == 1.0
+        game.add_player("Bob")
+        game._players_hands[alice] = Hand([Card("9", "♠"), Card("A", "♥"), Card("4", "♦"), Card("A", "♣"), Card("7", "♠")])
+        assert 0.85 < game.hand_equity(alice) < 0.95
 
     def test_restart_game(self):
         """Test that the game can be restarted"""
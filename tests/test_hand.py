@@ -102,6 +102,17 @@ class TestHand:
         assert result is True
         assert len(hand._cards) == original_length - 1
 
+    def test_board_tracks_cards(self):
+        """Test that the hand's bitboard follows added and removed cards"""
+        cards = [Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("10", "♠")]
+        hand = Hand(list(cards))
+        assert hand.board.bit_count() == 5
+        assert Card("A", "♠") in hand and Card("A", "♥") not in hand
+        hand.remove_card("A", "♠")
+        hand.add_card(Card("2", "♥"))
+        assert Card("A", "♠") not in hand and Card("2", "♥") in hand
+        assert hand.board == Hand(cards[1:] + [Card("2", "♥")]).board
+
     def test_remove_nonexistent_card(self):
         """Test that removing non-existent card returns False"""
         cards = [Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("10", "♠")]
@@ -122,9 +133,9 @@ class TestHand:
         straight_flush2 = Hand([Card("9", "♥"), Card("8", "♥"), Card("7", "♥"), Card("6", "♥"), Card("5", "♥")])
         assert straight_flush1 == straight_flush2
 
-        # Test four of a kind equality (same four cards)
+        # Test four of a kind equality (same four cards and kicker)
         four_kind1 = Hand([Card("A", "♠"), Card("A", "♥"), Card("A", "♦"), Card("A", "♣"), Card("K", "♠")])
-        four_kind2 = Hand([Card("A", "♠"), Card("A", "♥"), Card("A", "♦"), Card("A", "♣"), Card("Q", "♥")])
+        four_kind2 = Hand([Card("A", "♠"), Card("A", "♥"), Card("A", "♦"), Card("A", "♣"), Card("K", "♥")])
         assert four_kind1 == four_kind2
 
         # Test full house equality (same three and pair)
@@ -265,6 +276,19 @@ class TestHand:
         one_pair4 = Hand([Card("A", "♠"), Card("A", "♥"), Card("K", "♦"), Card("Q", "♣"), Card("10", "♠")])
         assert one_pair4 < one_pair3
 
+        # Test one pair whose kickers straddle the pair
+        one_pair5 = Hand([Card("5", "♠"), Card("5", "♥"), Card("A", "♦"), Card("K", "♣"), Card("3", "♠")])
+        one_pair6 = Hand([Card("5", "♣"), Card("5", "♦"), Card("A", "♠"), Card("Q", "♥"), Card("3", "♦")])
+        assert one_pair6 < one_pair5
+        assert one_pair5._hand_value == (Hand.ONE_PAIR, 5, 14, 13, 3, -1)
+
+        # Test four of a kind with the same four but different kickers
+        quads1 = Hand([Card("2", "♠"), Card("2", "♥"), Card("2", "♦"), Card("2", "♣"), Card("4", "♠")])
+        quads2 = Hand([Card("2", "♠"), Card("2", "♥"), Card("2", "♦"), Card("2", "♣"), Card("3", "♠")])
+        assert quads2 < quads1
+        assert quads1 != quads2
+        assert quads1._hand_value == (Hand.FOUR_OF_A_KIND, 2, 4, -1, -1, -1)
+
         # Test high card with different high cards
         high_card1 = Hand([Card("A", "♠"), Card("K", "♥"), Card("Q", "♦"), Card("J", "♣"), Card("9", "♠")])
         high_card2 = Hand([Card("K", "♠"), Card("Q", "♥"), Card("J", "♦"), Card("10", "♣"), Card("8", "♠")])
@@ -282,6 +306,15 @@ class TestHand:
         ten_high_straight = Hand([Card("10", "♠"), Card("9", "♥"), Card("8", "♦"), Card("7", "♣"), Card("6", "♠")])
         assert wheel_straight < ten_high_straight
 
+        # The wheel is a five-high straight, so it beats three of a kind and ace high
+        trips = Hand([Card("A", "♠"), Card("A", "♥"), Card("A", "♦"), Card("K", "♣"), Card("Q", "♠")])
+        ace_high = Hand([Card("A", "♦"), Card("K", "♥"), Card("Q", "♦"), Card("J", "♣"), Card("9", "♠")])
+        assert wheel_straight._hand_value == (Hand.STRAIGHT, 5, -1, -1, -1, -1)
+        assert trips < wheel_straight
+        assert ace_high < wheel_straight
+        steel_wheel = Hand([Card("A", "♥"), Card("2", "♥"), Card("3", "♥"), Card("4", "♥"), Card("5", "♥")])
+        assert steel_wheel._hand_value == (Hand.STRAIGHT_FLUSH, 5, -1, -1, -1, -1)
+
         # Test hands with same kicker values but different suits
         flush1 = Hand([Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("9", "♠")])
         flush2 = Hand([Card("A", "♥"), Card("K", "♥"), Card("Q", "♥"), Card("J", "♥"), Card("9", "♥")])
@@ -535,3 +568,31 @@ class TestHand:
         assert fh1 != fh3
         assert not (fh1 == fh3)
         assert not (fh1 < fh3)
+
+    def test_rank_mask_tables(self):
+        """Test the straight and sorted-rank lookup tables behind the fast path"""
+        from model.hand import _RANKS_DESC, _STRAIGHT_HIGH
+
+        assert _STRAIGHT_HIGH[0b11111] == 6
+        assert _STRAIGHT_HIGH[0b11111 << 8] == 14
+        assert _STRAIGHT_HIGH[0b11101] == 0
+        assert _STRAIGHT_HIGH[1 << 12 | 0b1111] == 5
+        assert sum(1 for high in _STRAIGHT_HIGH if high) == 10
+        assert _RANKS_DESC[0b1000000010111] == (14, 6, 4, 3, 2)
+
+    def test_fast_path_matches_category_counts(self):
+        """Test random hands, a fifth of them flushes, against an independent evaluator"""
+        import random
+        from model.draw import hand_value
+
+        rng = random.Random(5)
+        suits = Card.SUITS
+        ranks = list(Card.RANK_DICT)
+        for _ in range(5000):
+            cards = [Card(rank, suit) for rank, suit in rng.sample([(r, s) for r in ranks for s in suits], 5)]
+            if rng.random() < 0.2:
+                suit = rng.choice(suits)
+                cards = [Card(rank, suit) for rank in rng.sample(ranks, 5)]
+            values = tuple(sorted((card.rank for card in cards), reverse=True))
+            flush = len({card.suit for card in cards}) == 1
+            assert Hand(cards)._hand_value == hand_value(values, flush)
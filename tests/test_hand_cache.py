@@ -0,0 +1,117 @@
+import pytest
+import sys
+import os
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import hand_cache
+from model.card import Card
+from model.deck import Deck
+from model.hand import Hand
+
+
+@pytest.fixture(autouse=True)
+def cache_off():
+    hand_cache.disable()
+    yield
+    hand_cache.disable()
+
+
+def child_info(_: int) -> dict:
+    Hand([Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("10", "♠")])
+    return hand_cache.info()
+
+
+class TestHandCache:
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = hand_cache.LRUCache(2)
+        cache.put(1, "a")
+        cache.put(2, "b")
+        assert cache.get(1) == "a"
+        cache.put(3, "c")
+        assert cache.get(2) is None
+        assert cache.get(1) == "a"
+        assert cache.info() == {"hits": 2, "misses": 1, "size": 2, "maxsize": 2}
+        with pytest.raises(ValueError):
+            hand_cache.LRUCache(0)
+
+    def test_disabled_by_default(self):
+        """Test that hands are evaluated directly while the cache is off"""
+        Hand(random.sample(list(Deck()._deck.values()), 5))
+        assert hand_cache.active() is None
+        assert hand_cache.info()["maxsize"] == 0
+
+    def test_environment_size(self, monkeypatch):
+        """Test that POKER_HAND_CACHE sets the size and a bad value falls back to the default with a warning"""
+        monkeypatch.setenv("POKER_HAND_CACHE", "500")
+        assert hand_cache._CacheState().cache.maxsize == 500
+        monkeypatch.setenv("POKER_HAND_CACHE", "0")
+        assert hand_cache._CacheState().cache is None
+        for bad in ("lots", "-5", "1e4"):
+            monkeypatch.setenv("POKER_HAND_CACHE", bad)
+            with pytest.warns(RuntimeWarning, match="POKER_HAND_CACHE"):
+                state = hand_cache._CacheState()
+            assert state.cache.maxsize == hand_cache.DEFAULT_SIZE
+
+    def test_cached_values_match(self):
+        """Test that cached evaluation gives the same values and counts hits for suit relabellings"""
+        cards = list(Deck()._deck.values())
+        rng = random.Random(1)
+        hands = [rng.sample(cards, 5) for _ in range(300)]
+        expected = [Hand(list(hand))._hand_value for hand in hands]
+        hand_cache.enable(1000)
+        assert [Hand(list(hand))._hand_value for hand in hands] == expected
+        assert [Hand(list(hand))._hand_value for hand in hands] == expected
+        info = hand_cache.info()
+        assert info["hits"] >= 300
+        assert info["hits"] + info["misses"] == 600
+
+        spades = Hand([Card(rank, "♠") for rank in ("2", "5", "9", "J", "K")])
+        hearts = Hand([Card(rank, "♥") for rank in ("2", "5", "9", "J", "K")])
+        assert spades == hearts
+        assert hand_cache.info()["hits"] == info["hits"] + 1
+
+    def test_bounded_size(self):
+        """Test that the cache never grows past its size"""
+        hand_cache.enable(50)
+        cards = list(Deck()._deck.values())
+        rng = random.Random(2)
+        for _ in range(500):
+            Hand(rng.sample(cards, 5))
+        assert hand_cache.info()["size"] == 50
+        hand_cache.clear()
+        assert hand_cache.info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 50}
+
+    def test_thread_safe(self):
+        """Test that threads sharing the cache keep consistent counters"""
+        hand_cache.enable(100)
+        cards = list(Deck()._deck.values())
+
+        def work(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(500):
+                Hand(rng.sample(cards, 5))
+
+        threads = [threading.Thread(target=work, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = hand_cache.info()
+        assert info["hits"] + info["misses"] == 2000
+        assert info["size"] <= 100
+
+    def test_each_process_has_its_own_cache(self):
+        """Test that worker processes start with an empty cache of the same size"""
+        hand_cache.enable(123)
+        Hand([Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("10", "♠")])
+        with ProcessPoolExecutor(1) as executor:
+            info = list(executor.map(child_info, [0]))[0]
+        if info["maxsize"]:
+            # Forked worker: a fresh cache, not the parent's entries.
+            assert info == {"hits": 0, "misses": 1, "size": 1, "maxsize": 123}
+        assert hand_cache.info()["misses"] == 1
@@ -27,3 +27,17 @@ class TestPlayer:
         """Test that player can be created with special characters in name"""
         player = Player("Player_123!")
         assert player.name == "Player_123!"
+
+    def test_player_uses_slots(self):
+        """Test that players have no per-instance __dict__"""
+        player = Player("Alice")
+        assert not hasattr(player, "__dict__")
+        with pytest.raises(AttributeError):
+            player.score = 10
+
+    def test_players_hash_by_identity(self):
+        """Test that players with the same name are distinct keys"""
+        first = Player("Alice")
+        second = Player("Alice")
+        assert first != second
+        assert len({first: 1, second: 2}) == 2
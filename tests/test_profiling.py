@@ -0,0 +1,96 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import profiling
+from model.game import PokerGame
+
+
+@pytest.fixture
+def profiler():
+    profiling.reset()
+    profiling.enable()
+    yield profiling
+    profiling.disable()
+    profiling.reset()
+
+
+class TestProfiling:
+    def test_disabled_by_default_records_nothing(self):
+        """Test that counters stay at zero while profiling is disabled"""
+        profiling.disable()
+        profiling.reset()
+        game = PokerGame()
+        game.add_player("Alice")
+        game.deal_cards(5)
+        assert profiling.snapshot()["game.deal_cards"] == {"calls": 0, "total_ns": 0, "self_ns": 0}
+
+    def test_counts_calls_when_enabled(self, profiler):
+        """Test that instrumented game and hand methods are counted"""
+        game = PokerGame()
+        game.add_player("Alice")
+        game.add_player("Bob")
+        game.deal_cards(5)
+        game.winners()
+
+        counters = profiler.snapshot()
+        assert counters["game.deal_cards"]["calls"] == 1
+        assert counters["game.winners"]["calls"] == 1
+        # winners() formats every player's hand
+        assert counters["game.show_hand"]["calls"] == 2
+        # Each dealt hand is evaluated once
+        assert counters["hand.best_hand"]["calls"] == 2
+        assert counters["game.deal_cards"]["total_ns"] > 0
+
+    def test_exchange_cards_counted(self, profiler):
+        """Test that exchange_cards and the re-evaluation it triggers are counted"""
+        game = PokerGame()
+        game.add_player("Alice")
+        game.deal_cards(5)
+        player = game.get_player("Alice")
+        card = game.show_hand(player)[1]
+        game.exchange_cards(player, [card])
+
+        counters = profiler.snapshot()
+        assert counters["game.exchange_cards"]["calls"] == 1
+        assert counters["hand.best_hand"]["calls"] == 2
+
+    def test_nested_sections_self_time(self, profiler):
+        """Test that self times leave out nested sections so they add up to the outer section's total"""
+        game = PokerGame()
+        for name in ("Alice", "Bob", "Carol"):
+            game.add_player(name)
+        game.deal_cards(5)
+        profiler.reset()
+        game.winners()
+
+        counters = {name: values for name, values in profiler.snapshot().items() if values["calls"]}
+        assert set(counters) == {"game.winners", "game.winning_players", "game.show_hand"}
+        outer = counters["game.winners"]
+        assert counters["game.winning_players"]["total_ns"] <= outer["total_ns"]
+        assert outer["self_ns"] < outer["total_ns"]
+        assert sum(values["self_ns"] for values in counters.values()) == outer["total_ns"]
+        assert all(0 <= values["self_ns"] <= values["total_ns"] for values in counters.values())
+
+    def test_reset_clears_counters(self, profiler):
+        """Test that reset zeroes all counters"""
+        game = PokerGame()
+        game.add_player("Alice")
+        game.deal_cards(5)
+        profiler.reset()
+        assert all(values["calls"] == 0 for values in profiler.snapshot().values())
+
+    def test_prometheus_format(self, profiler):
+        """Test that the Prometheus dump contains typed counters for every section"""
+        game = PokerGame()
+        game.add_player("Alice")
+        game.deal_cards(5)
+
+        text = profiler.to_prometheus()
+        assert "# TYPE poker_section_calls_total counter" in text
+        assert 'poker_section_calls_total{section="game.deal_cards"} 1' in text
+        assert 'poker_section_duration_nanoseconds_total{section="hand.best_hand"}' in text
+        assert "# TYPE poker_section_self_nanoseconds_total counter" in text
+        assert text.endswith("\n")
@@ -0,0 +1,92 @@
+import pytest
+import sys
+import os
+import math
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model.batch import score
+from model.deck import Deck
+from model.game import PokerGame
+from model.hand import Hand
+from model.rare import HANDS, estimate, hit_probability, plain_estimate, rules_hold, targets
+from model.strategy import RuleBasedStrategy
+
+# Royal flush rate with RuleBasedStrategy's discards, from summing hit_probability() over all 2,598,960 deals.
+RULES_ROYAL_RATE = 6.286154965767678e-06
+
+
+def ids_of(board):
+    return [bit + 1 for bit in range(52) if board >> bit & 1]
+
+
+class TestTargets:
+    def test_counts_and_categories(self):
+        """Test that each target list holds every hand of its category"""
+        for category, count in ((Hand.ROYAL_FLUSH, 4), (Hand.STRAIGHT_FLUSH, 36), (Hand.FOUR_OF_A_KIND, 624)):
+            boards = targets(category)
+            assert len(set(boards)) == count
+            assert all(board.bit_count() == 5 and score(ids_of(board)) >> 20 == category for board in boards)
+
+    def test_rejects_common_categories(self):
+        """Test that only rare categories are supported"""
+        with pytest.raises(ValueError):
+            targets(Hand.FLUSH)
+
+
+class TestHitProbability:
+    def test_exact_draws(self):
+        """Test the probability of completing a royal for a few holds"""
+        royals = targets(Hand.ROYAL_FLUSH)
+        # 10-J-Q-K of clubs and the 2 of diamonds: one card in 47 completes it.
+        hand = [9, 10, 11, 12, 14]
+        assert hit_probability(hand, [0, 1, 2, 3], royals) == pytest.approx(1 / 47)
+        assert hit_probability(hand, [0, 1, 2, 3, 4], royals) == 0.0
+        # Discarding a royal card rules out that suit's royal.
+        assert hit_probability(hand, [], royals) == pytest.approx(3 / math.comb(47, 5))
+        assert hit_probability(ids_of(royals[0]), [0, 1, 2, 3, 4], royals) == 1.0
+
+
+class TestRulesHold:
+    def test_matches_rule_based_strategy(self):
+        """Test that rules_hold keeps the same cards as RuleBasedStrategy at the table"""
+        game = PokerGame(random.Random(5))
+        for name in "abcdef":
+            game.add_player(name)
+        strategy = RuleBasedStrategy()
+        for _ in range(100):
+            game._deck.reset_deck()
+            game.deal_cards(5)
+            for player, hand in game._players_hands.items():
+                ids = sorted(Deck.card_id(card) for card in hand._cards)
+                discards = strategy.choose_discards([game.show_hand(player)])[0]
+                discarded = {Deck.card_id(card) for card in hand._cards if str(card) in discards}
+                assert {ids[i] for i in rules_hold(ids)} == set(ids) - discarded
+
+
+class TestEstimate:
+    def test_known_rates(self):
+        """Test that standing pat or drawing five both give the royal's deal rate"""
+        for policy in (lambda ids: list(range(5)), lambda ids: []):
+            result = estimate(Hand.ROYAL_FLUSH, 5_000, policy, seed=1)
+            assert result["low"] <= 4 / HANDS <= result["high"]
+
+    def test_matches_exact_rate(self):
+        """Test the estimate against the exact royal rate with rule-based discards"""
+        result = estimate(Hand.ROYAL_FLUSH, 5_000, rules_hold, seed=2)
+        assert abs(result["rate"] - RULES_ROYAL_RATE) < 4 * result["stderr"]
+        # Thousands of hands stand in for hundreds of millions of plain ones.
+        assert result["effective_hands"] > 10_000 * result["hands"]
+
+    def test_agrees_with_plain_monte_carlo(self):
+        """Test that both estimators agree on the rate of four of a kind"""
+        weighted = estimate(Hand.FOUR_OF_A_KIND, 2_000, rules_hold, seed=3)
+        plain = plain_estimate(Hand.FOUR_OF_A_KIND, 50_000, rules_hold, seed=3)
+        assert abs(weighted["rate"] - plain["rate"]) < 4 * math.hypot(weighted["stderr"], plain["stderr"])
+        assert weighted["stderr"] < plain["stderr"] / 3
+
+    def test_rejects_tiny_samples(self):
+        """Test that a rate needs at least two hands"""
+        with pytest.raises(ValueError):
+            estimate(Hand.ROYAL_FLUSH, 1)
@@ -0,0 +1,51 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import batch, simulation
+from model.records import HandRecords
+
+
+class TestRecords:
+    def test_write_and_read(self):
+        """Test that hands, scores and winner masks land in their columns"""
+        with HandRecords(3, 2) as records:
+            records.write(1, [[1, 2, 3, 4, 5], [14, 15, 16, 17, 19]], [100, 200])
+            records.write(2, [[6, 7, 8, 9, 10], [20, 21, 22, 23, 24]], [300, 300])
+            assert records.hand(1, 1) == bytes([14, 15, 16, 17, 19])
+            assert list(records.scores) == [0, 0, 100, 200, 300, 300]
+            assert list(records.winners) == [0, 0b10, 0b11]
+            assert records.win_shares() == [pytest.approx(0.5 / 3), pytest.approx(1.5 / 3)]
+
+    def test_attach_by_name(self):
+        """Test that a second mapping of the block sees the same memory"""
+        with HandRecords(2, 3) as owner:
+            worker = HandRecords(2, 3, owner.name)
+            worker.write(0, [[1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [11, 12, 13, 14, 15]], [5, 9, 2])
+            worker.close()
+            assert owner.winners[0] == 0b010
+            assert owner.hand(0, 2) == bytes([11, 12, 13, 14, 15])
+
+    def test_rejects_bad_sizes(self):
+        """Test that seat counts beyond the winner mask are refused"""
+        with pytest.raises(ValueError):
+            HandRecords(1, 33)
+        with pytest.raises(ValueError):
+            HandRecords(-1, 2)
+
+    @pytest.mark.parametrize("mode, workers", [("threads", 1), ("threads", 2), ("processes", 2)])
+    def test_simulate_records_matches_simulate(self, mode, workers):
+        """Test that recorded hands are real hands and give simulate()'s win shares"""
+        games = 2 * simulation.CHUNK
+        expected = simulation.simulate(games, 3, workers=1, seed=4)
+        with simulation.simulate_records(games, 3, workers=workers, mode=mode, seed=4) as records:
+            assert records.win_shares() == pytest.approx(expected)
+            for game in (0, games - 1):
+                hands = [records.hand(game, seat) for seat in range(3)]
+                assert len(set(b"".join(hands))) == 15
+                scores = [batch.score(hand) for hand in hands]
+                assert list(records.scores[game * 3 : game * 3 + 3]) == scores
+                best = max(scores)
+                assert records.winners[game] == sum(1 << seat for seat in range(3) if scores[seat] == best)
@@ -0,0 +1,59 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model.player import Player
+from model.registry import PlayerRegistry
+
+
+class TestPlayerRegistry:
+    def test_add_and_get(self):
+        """Test that players are found by name"""
+        registry = PlayerRegistry()
+        alice = Player("Alice")
+        registry.add(alice)
+        assert registry.get("Alice") is alice
+        assert "Alice" in registry
+        assert len(registry) == 1
+
+    def test_duplicate_name_rejected(self):
+        """Test that two players cannot share a name"""
+        registry = PlayerRegistry()
+        registry.add(Player("Alice"))
+        with pytest.raises(ValueError, match="already exists"):
+            registry.add(Player("Alice"))
+
+    def test_get_missing_raises(self):
+        """Test that looking up an unknown name raises ValueError"""
+        with pytest.raises(ValueError, match="Player 'Nobody' not found in the game"):
+            PlayerRegistry().get("Nobody")
+
+    def test_remove(self):
+        """Test that remove returns the player, or None if absent"""
+        registry = PlayerRegistry()
+        bob = Player("Bob")
+        registry.add(bob)
+        assert registry.remove("Bob") is bob
+        assert registry.remove("Bob") is None
+        assert "Bob" not in registry
+
+    def test_seat_order_is_stable(self):
+        """Test that players keep join order across removals"""
+        registry = PlayerRegistry()
+        for name in ["A", "B", "C", "D"]:
+            registry.add(Player(name))
+        registry.remove("B")
+        registry.add(Player("E"))
+        assert registry.names() == ("A", "C", "D", "E")
+        assert [player.name for player in registry] == ["A", "C", "D", "E"]
+
+    def test_names_are_cached(self):
+        """Test that names() reuses its tuple until the registry changes"""
+        registry = PlayerRegistry()
+        registry.add(Player("A"))
+        names = registry.names()
+        assert registry.names() is names
+        registry.add(Player("B"))
+        assert registry.names() == ("A", "B")
@@ -0,0 +1,71 @@
+import pytest
+import sys
+import os
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model.deck import Deck
+from model.game import PokerGame
+from model.rng import SecureRandom
+
+
+class TestSecureRandom:
+    def test_rejection_sampling(self):
+        """Test that bytes in the incomplete last multiple are redrawn"""
+        rng = SecureRandom()
+        # 52 * 4 = 208, so 208-255 are rejected and 5 is used.
+        rng._buffer = bytes([255, 208, 5, 207])
+        rng._pos = 0
+        assert rng._randbelow(52) == 5
+        assert rng._randbelow(52) == 207 % 52
+        rng._buffer = bytes([0xFF, 0xFF, 0x2C, 0x01])
+        rng._pos = 0
+        # 1000 needs two bytes: 65535 is rejected, 0x012C = 300 is kept.
+        assert rng._randbelow(1000) == 300
+
+    def test_draws_are_uniform(self):
+        """Test that every deck position comes up about equally often"""
+        rng = SecureRandom(block_size=64)
+        counts = Counter(rng._randbelow(52) for _ in range(52_000))
+        assert len(counts) == 52
+        assert 800 < min(counts.values()) and max(counts.values()) < 1200
+        assert 0.0 <= rng.random() < 1.0
+        assert rng.getrandbits(3) < 8 and len(rng.randbytes(10_000)) == 10_000
+
+    def test_cannot_be_seeded_or_saved(self):
+        """Test that seeding is ignored and state cannot be captured"""
+        first, second = SecureRandom(), SecureRandom()
+        first.seed(1)
+        second.seed(1)
+        assert first.randbytes(32) != second.randbytes(32)
+        with pytest.raises(NotImplementedError):
+            first.getstate()
+        with pytest.raises(ValueError):
+            SecureRandom(block_size=4)
+
+    def test_secure_game_deals_whole_deck(self):
+        """Test that a game can deal from the secure generator"""
+        game = PokerGame(SecureRandom())
+        cards = game._deck.random_deal(52)
+        assert len({str(card) for card in cards}) == 52
+        deck = Deck(SecureRandom())
+        deck.random_deal(50)
+        assert deck.available().bit_count() == 2
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_forked_child_discards_buffer(self):
+        """Test that a forked child does not replay its parent's buffered entropy"""
+        rng = SecureRandom()
+        rng.randbytes(1)
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            os.write(write_end, rng.randbytes(32))
+            os._exit(0)
+        os.close(write_end)
+        child = os.read(read_end, 32)
+        os.close(read_end)
+        os.waitpid(pid, 0)
+        assert child != rng.randbytes(32)
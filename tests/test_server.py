@@ -0,0 +1,236 @@
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from server import protocol
+from server.client import ServerError, TableClient
+from server.table_server import TableServer
+
+
+def run_with_server(scenario):
+    """Starts a TableServer on a free localhost port and runs scenario(server, host, port)."""
+
+    async def main():
+        server = TableServer()
+        host, port = await server.start()
+        try:
+            return await scenario(server, host, port)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(main())
+
+
+class TestProtocol:
+    def test_card_round_trip(self):
+        """Test that every card string survives encoding as a single byte"""
+        cards = [f"{rank}{suit}" for suit in protocol.SUITS for rank in protocol.RANKS]
+        encoded = protocol.encode_cards(cards)
+        assert len(encoded) == 52
+        assert protocol.decode_cards(encoded) == cards
+
+    def test_hand_round_trip(self):
+        """Test that a show_hand list is encoded as category plus card codes"""
+        hand_list = ["Two Pair", "A♠", "A♥", "K♦", "K♣", "Q♠"]
+        encoded = protocol.encode_hand(hand_list)
+        assert len(encoded) == 6
+        assert protocol.decode_hand(encoded) == hand_list
+        assert protocol.decode_hand(protocol.encode_hand([])) == []
+
+    def test_frame_round_trip(self):
+        """Test that frames carry opcode, table id and body"""
+        frame = protocol.encode(protocol.DEAL, 123456, b"xy")
+        assert protocol.decode(frame[protocol.FRAME_HEADER.size :]) == (protocol.DEAL, 123456, b"xy")
+
+    def test_unknown_card_raises(self):
+        """Test that unknown cards raise ProtocolError"""
+        with pytest.raises(protocol.ProtocolError):
+            protocol.encode_cards(["1♠"])
+
+
+class TestTableServer:
+    def test_stud_round(self):
+        """Test join, deal, show and reveal for a stud table"""
+
+        async def scenario(server, host, port):
+            client = await TableClient.connect(host, port)
+            alice = await client.join(1, "Alice")
+            bob = await client.join(1, "Bob")
+            await client.deal(1)
+            hands = [await client.show(1, alice), await client.show(1, bob)]
+            winners = await client.reveal(1)
+            await client.close()
+            return alice, bob, hands, winners
+
+        alice, bob, hands, winners = run_with_server(scenario)
+        assert (alice, bob) == (0, 1)
+        assert all(len(hand) == 6 and hand[0] in protocol.CATEGORY_CODES for hand in hands)
+        assert set(winners) <= {alice, bob} and len(winners) >= 1
+
+    def test_secure_tables(self):
+        """Test that FLAG_SECURE opens a table dealing from the secure generator"""
+
+        async def scenario(server, host, port):
+            client = await TableClient.connect(host, port)
+            seats = [await client.join(5, "Alice", secure=True), await client.join(5, "Bob")]
+            await client.join(6, "Carol")
+            await client.deal(5)
+            hand = await client.show(5, seats[0])
+            await client.close()
+            return server.tables[5].secure, server.tables[6].secure, hand
+
+        secure, plain, hand = run_with_server(scenario)
+        assert secure and not plain
+        assert len(hand) == 6
+
+    def test_draw_exchange(self):
+        """Test that draw tables exchange cards and stud tables refuse to"""
+
+        async def scenario(server, host, port):
+            client = await TableClient.connect(host, port)
+            seat = await client.join(1, "Alice", draw_game=True)
+            await client.join(1, "Bob")
+            await client.deal(1)
+            before = await client.show(1, seat)
+            after = await client.exchange(1, seat, before[1:4])
+            with pytest.raises(ServerError, match="already exchanged"):
+                await client.exchange(1, seat, after[1:2])
+
+            stud_seat = await client.join(2, "Carol")
+            await client.join(2, "Dave")
+            await client.deal(2)
+            stud_hand = await client.show(2, stud_seat)
+            with pytest.raises(ServerError, match="5-card draw"):
+                await client.exchange(2, stud_seat, stud_hand[1:2])
+            await client.close()
+            return before, after
+
+        before, after = run_with_server(scenario)
+        assert len(after) == 6
+        assert len(set(before[1:4]) & set(after[1:])) == 0
+
+    def test_seat_ownership(self):
+        """Test that a client cannot look at another client's hand"""
+
+        async def scenario(server, host, port):
+            alice = await TableClient.connect(host, port)
+            mallory = await TableClient.connect(host, port)
+            seat = await alice.join(1, "Alice")
+            await mallory.join(1, "Mallory")
+            await alice.deal(1)
+            with pytest.raises(ServerError, match="not yours"):
+                await mallory.show(1, seat)
+            await alice.close()
+            await mallory.close()
+
+        run_with_server(scenario)
+
+    def test_deal_and_reveal_need_a_seat(self):
+        """Test that a client without a seat at a table can neither deal nor reveal there"""
+
+        async def scenario(server, host, port):
+            alice = await TableClient.connect(host, port)
+            mallory = await TableClient.connect(host, port)
+            await alice.join(1, "Alice")
+            await alice.join(1, "Bob")
+            with pytest.raises(ServerError, match="no seat"):
+                await mallory.deal(1)
+            await alice.deal(1)
+            with pytest.raises(ServerError, match="no seat"):
+                await mallory.reveal(1)
+            with pytest.raises(ServerError, match="not ready"):
+                await alice.deal(1)
+            await alice.reveal(1)
+            await alice.close()
+            await mallory.close()
+
+        run_with_server(scenario)
+
+    def test_draw_reveal_waits_for_exchanges(self):
+        """Test that a draw table refuses to reveal until every seat has exchanged or stood pat"""
+
+        async def scenario(server, host, port):
+            alice = await TableClient.connect(host, port)
+            bob = await TableClient.connect(host, port)
+            alice_seat = await alice.join(1, "Alice", draw_game=True)
+            bob_seat = await bob.join(1, "Bob")
+            await alice.deal(1)
+            hand = await alice.show(1, alice_seat)
+            await alice.exchange(1, alice_seat, hand[1:3])
+            with pytest.raises(ServerError, match="Waiting for every seat"):
+                await alice.reveal(1)
+            assert await bob.exchange(1, bob_seat, []) == await bob.show(1, bob_seat)
+            winners = await alice.reveal(1)
+            await alice.close()
+            await bob.close()
+            return winners
+
+        assert run_with_server(scenario)
+
+    def test_errors_are_reported(self):
+        """Test that invalid requests produce ServerError without closing the connection"""
+
+        async def scenario(server, host, port):
+            client = await TableClient.connect(host, port)
+            with pytest.raises(ServerError, match="does not exist"):
+                await client.deal(99)
+            await client.join(1, "Alice")
+            with pytest.raises(ServerError, match="at least 2 players"):
+                await client.deal(1)
+            with pytest.raises(ServerError, match="already exists"):
+                await client.join(1, "Alice")
+            await client.close()
+
+        run_with_server(scenario)
+
+    def test_many_tables_concurrently(self):
+        """Test that unrelated tables progress concurrently over pipelined requests"""
+
+        async def play(client, table_id):
+            seats = [await client.join(table_id, name) for name in ("A", "B", "C")]
+            for _ in range(3):
+                await client.deal(table_id)
+                await asyncio.gather(*(client.show(table_id, seat) for seat in seats))
+                await client.reveal(table_id)
+
+        async def scenario(server, host, port):
+            clients = [await TableClient.connect(host, port) for _ in range(4)]
+            await asyncio.gather(*(play(clients[i % 4], i) for i in range(200)))
+            tables = len(server.tables)
+            for client in clients:
+                await client.close()
+            await asyncio.sleep(0.05)
+            return tables, len(server.tables)
+
+        open_tables, tables_after_disconnect = run_with_server(scenario)
+        assert open_tables == 200
+        # Disconnecting frees every seat and the empty tables are dropped.
+        assert tables_after_disconnect == 0
+
+
+class TestTableClient:
+    def test_unsolicited_frame_closes_connection(self):
+        """Test that a response nobody asked for fails the client instead of killing its receiver silently"""
+
+        async def handle(reader, writer):
+            _, table_id, _ = protocol.decode(await protocol.read_frame(reader))
+            writer.write(protocol.encode(protocol.OK, table_id) * 2)
+            await reader.read()
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            client = await TableClient.connect(*server.sockets[0].getsockname()[:2])
+            await client.deal(1)
+            await asyncio.wait_for(client._receiver, 1)
+            with pytest.raises(ConnectionError):
+                await client.deal(1)
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(main())
@@ -0,0 +1,55 @@
+import pytest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import profiling, simulation
+
+
+class TestSimulation:
+    def test_resolve_mode(self):
+        """Test that auto picks threads only on free-threaded interpreters"""
+        expected = "threads" if simulation.free_threaded() else "processes"
+        assert simulation.resolve_mode("auto") == expected
+        assert simulation.resolve_mode("threads") == "threads"
+        with pytest.raises(ValueError):
+            simulation.resolve_mode("fibers")
+
+    def test_play_games_is_repeatable(self):
+        """Test that a table seeded the same way wins the same pots"""
+        first = simulation.play_games(200, 3, seed=5)
+        assert first == simulation.play_games(200, 3, seed=5)
+        assert sum(first) == pytest.approx(200)
+
+    def test_modes_agree(self):
+        """Test that serial, thread and process runs give identical results for a seed"""
+        games = 3 * simulation.CHUNK
+        serial = simulation.simulate(games, 4, workers=1, seed=9)
+        assert simulation.simulate(games, 4, workers=3, mode="threads", seed=9) == serial
+        assert simulation.simulate(games, 4, workers=2, mode="processes", seed=9) == serial
+        assert sum(serial) == pytest.approx(1.0)
+        assert all(0.18 < share < 0.32 for share in serial)
+
+    def test_draw_games(self):
+        """Test that draw games run through the strategy in parallel too"""
+        shares = simulation.simulate(400, 3, workers=2, mode="threads", seed=2, draw_game=True)
+        assert sum(shares) == pytest.approx(1.0)
+        with pytest.raises(ValueError):
+            simulation.simulate(10, 1)
+
+    def test_profiling_counts_every_thread(self):
+        """Test that profiling counters lose no calls when threads deal concurrently"""
+        profiling.reset()
+        profiling.enable()
+        try:
+            threads = [threading.Thread(target=simulation.play_games, args=(100, 2, seed)) for seed in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert profiling.snapshot()["game.deal_cards"]["calls"] == 400
+        finally:
+            profiling.disable()
+            profiling.reset()
@@ -0,0 +1,124 @@
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import snapshot
+from model.deck import Deck
+from model.game import PokerGame
+
+
+def make_game(num_players: int, draw_game: bool = False) -> PokerGame:
+    game = PokerGame()
+    for i in range(num_players):
+        game.add_player(f"Player{i}")
+    game.set_game_of_draw(draw_game)
+    game.state = "ready"
+    game.deal_cards(5)
+    game.state = "playing"
+    return game
+
+
+def hands(game: PokerGame) -> list:
+    return [(player.name, game.show_hand(player)) for player in game._players_hands]
+
+
+class TestSnapshot:
+    def test_round_trip_mid_hand(self):
+        """Test that players, hands, dealt cards and state survive a round trip"""
+        game = make_game(4, draw_game=True)
+        player = game.get_player("Player1")
+        game.exchange_cards(player, game.show_hand(player)[1:3])
+
+        restored = snapshot.loads(snapshot.dumps(game))
+        assert restored.state == "playing"
+        assert restored.get_game_of_draw()
+        assert restored._deck._dealt == game._deck._dealt
+        assert hands(restored) == hands(game)
+        exchanged = [restored.has_exchanged(player) for player in restored._players_hands]
+        assert exchanged == [False, True, False, False]
+
+    def test_restored_deck_continues_without_duplicates(self):
+        """Test that a restored deck never deals a card already in play"""
+        game = make_game(6)
+        restored = snapshot.loads(snapshot.dumps(game))
+        in_play = {card for _, hand in hands(restored) for card in hand[1:]}
+        remaining = [str(card) for card in restored._deck.random_deal(52 - 30)]
+        assert not in_play & set(remaining)
+
+    def test_version_1_snapshots_load(self):
+        """Test that snapshots written before exchanges were recorded still restore"""
+        game = make_game(3, draw_game=True)
+        data = bytearray(snapshot.dumps(game))
+        data[3] = 1
+        restored = snapshot.loads(bytes(data))
+        assert hands(restored) == hands(game)
+        assert not any(restored.has_exchanged(player) for player in restored._players_hands)
+
+    def test_players_without_hands(self):
+        """Test that players who have not been dealt in restore with no hand"""
+        game = PokerGame()
+        game.add_player("Alice")
+        game.add_player("Bob")
+        restored = snapshot.loads(snapshot.dumps(game))
+        assert [player.name for player in restored._players_hands] == ["Alice", "Bob"]
+        assert all(hand is None for hand in restored._players_hands.values())
+        assert restored.state == "setup"
+
+    def test_card_ids_are_stable(self):
+        """Test that card ids follow the fixed suit and rank order"""
+        deck = Deck()
+        assert str(deck._deck[1]) == "2♣"
+        assert str(deck._deck[52]) == "A♠"
+        assert all(Deck.card_id(card) == card_id for card_id, card in deck._deck.items())
+
+    def test_snapshot_is_compact(self):
+        """Test that a 10 player table fits in a couple hundred bytes"""
+        assert len(snapshot.dumps(make_game(10))) < 256
+
+    def test_restore_is_fast(self):
+        """Test that a 10 player table restores in well under a millisecond on average"""
+        data = snapshot.dumps(make_game(10))
+        runs = 200
+        start = time.perf_counter()
+        for _ in range(runs):
+            snapshot.loads(data)
+        assert (time.perf_counter() - start) / runs < 0.001
+
+    def test_corrupt_data_raises(self):
+        """Test that garbage and truncated snapshots raise ValueError"""
+        data = snapshot.dumps(make_game(3))
+        with pytest.raises(ValueError):
+            snapshot.loads(b"nonsense")
+        with pytest.raises(ValueError):
+            snapshot.loads(data[:-4])
+
+    def test_bad_card_ids_raise(self):
+        """Test that dealt card ids outside 1-52 are rejected as corrupt"""
+        data = bytearray(snapshot.dumps(make_game(3)))
+        first_dealt = snapshot._HEADER.size + 1
+        for card_id in (0, 53, 0xFF):
+            data[first_dealt] = card_id
+            with pytest.raises(ValueError, match="Corrupt game snapshot"):
+                snapshot.loads(bytes(data))
+
+    def test_autosave_on_transitions(self, tmp_path):
+        """Test that autosave writes a loadable snapshot after each transition"""
+        path = str(tmp_path / "session.bin")
+        saves = []
+        game = PokerGame()
+        game.set_autosave(lambda g: (saves.append(g.state), snapshot.save(g, path)))
+        game.add_player("Alice")
+        game.add_player("Bob")
+        game.state = "ready"
+        game.deal_cards(5)
+        game.state = "playing"
+
+        assert saves[-1] == "playing"
+        assert len(saves) == 5
+        assert hands(snapshot.load(path)) == hands(game)
+
+        game.restart_game()
+        assert snapshot.load(path).state == "ready"
@@ -0,0 +1,91 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model.betting import Betting
+from model.strategy import (
+    ACTIONS,
+    CALL,
+    CHECK,
+    FOLD,
+    RAISE,
+    ExpectedValueStrategy,
+    RandomStrategy,
+    RuleBasedStrategy,
+    Strategy,
+    apply_action,
+    play_street,
+)
+
+PAIR = ["One Pair", "A♠", "A♥", "K♦", "Q♣", "J♠"]
+JUNK = ["High Card", "K♥", "J♣", "8♦", "5♠", "2♣"]
+FLUSH = ["Flush", "K♥", "J♥", "8♥", "5♥", "2♥"]
+
+
+class TestStrategy:
+    def test_base_strategy_is_abstract(self):
+        """Test that a strategy without a discard rule cannot be created"""
+        with pytest.raises(TypeError):
+            Strategy()
+
+        class Incomplete(Strategy):
+            def choose_actions(self, spots):
+                return [FOLD] * len(spots)
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_rule_based_discards(self):
+        """Test that the rule based bot keeps grouped cards and discards kickers"""
+        strategy = RuleBasedStrategy()
+        assert strategy.choose_discards([PAIR, JUNK, FLUSH, []]) == [["K♦", "Q♣", "J♠"], ["8♦", "5♠", "2♣"], [], []]
+
+    def test_random_discards_are_legal(self):
+        """Test that random exchanges only use cards in the hand and at most 3 of them"""
+        strategy = RandomStrategy(seed=1)
+        for discards in strategy.choose_discards([PAIR] * 200):
+            assert len(discards) <= 3
+            assert set(discards) <= set(PAIR[1:])
+        assert RandomStrategy(seed=5).choose_discards([PAIR] * 20) == RandomStrategy(seed=5).choose_discards([PAIR] * 20)
+
+    def test_expected_value_discards(self):
+        """Test that the EV bot keeps the aces with the king kicker and stands pat on a flush"""
+        strategy = ExpectedValueStrategy()
+        assert strategy.choose_discards([PAIR, FLUSH, PAIR]) == [["Q♣", "J♠"], [], ["Q♣", "J♠"]]
+
+    def test_default_actions_check_or_call(self):
+        """Test that the base strategy checks when it can and calls otherwise"""
+        betting = Betting([100] * 3, button=0)
+        betting.post_blinds(5, 10)
+        strategy = RandomStrategy()
+        assert Strategy.choose_actions(strategy, [(betting, 0, PAIR), (betting, 2, PAIR)]) == [CALL, CHECK]
+
+    def test_rule_based_actions(self):
+        """Test that the rule based bot raises strong hands and folds weak ones facing a bet"""
+        betting = Betting([100] * 3, button=0)
+        betting.post_blinds(5, 10)
+        actions = RuleBasedStrategy().choose_actions([(betting, 0, FLUSH), (betting, 0, PAIR), (betting, 0, JUNK)])
+        assert actions == [RAISE, CALL, FOLD]
+
+    def test_apply_action(self):
+        """Test that actions map onto legal betting moves"""
+        betting = Betting([100] * 3, button=0)
+        betting.post_blinds(5, 10)
+        apply_action(betting, 0, CHECK)
+        assert betting.street[0] == 10
+        apply_action(betting, 1, RAISE)
+        assert betting.current_bet == 22
+        apply_action(betting, 2, FOLD)
+        assert betting.folded[2]
+
+    def test_play_street_until_complete(self):
+        """Test that strategies drive a betting street to the end"""
+        betting = Betting([200] * 4, button=0)
+        betting.post_blinds(5, 10)
+        strategies = [RandomStrategy(seed=seat) for seat in range(4)]
+        play_street(betting, strategies, [PAIR, JUNK, FLUSH, PAIR])
+        assert betting.to_act == -1
+        assert sum(betting.stacks) + betting.pot == 800
+        assert set(RandomStrategy(seed=3).choose_actions([(betting, 0, PAIR)] * 50)) <= set(ACTIONS)
@@ -0,0 +1,97 @@
+import pytest
+import sys
+import os
+import math
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import stud_equity
+from model.deck import Deck
+from model.stud_equity import StudEquity, replay
+
+CARDS = {Deck.card_id(card): card for card in Deck()._deck.values()}
+
+
+def cards(*ids):
+    return [CARDS[card_id] for card_id in ids]
+
+
+class TestStudEquity:
+    # Heads-up, three cards shown each: seat 0 has a pair of aces, seat 1 three clubs.
+    KNOWN = [cards(13, 26, 5), cards(2, 3, 4)]
+
+    def test_exact_pruning_matches_fresh_enumeration(self):
+        """Test that pruning completions gives the same equities as enumerating from scratch"""
+        table = StudEquity(2, [cards(13, 26, 5, 7), cards(2, 3, 4, 6)])
+        assert table.exact
+        updated = table.reveal(0, CARDS[40])
+        fresh = StudEquity(2, [cards(13, 26, 5, 7, 40), cards(2, 3, 4, 6)])
+        assert updated == pytest.approx(fresh.equities())
+        assert sum(updated) == pytest.approx(1.0)
+
+    def test_sampled_updates_match_exact(self, monkeypatch):
+        """Test that swapping revealed cards into the samples keeps them an exact sample"""
+        table = StudEquity(2, self.KNOWN, samples=8_000, seed=1)
+        assert not table.exact
+        updated = table.reveal(0, CARDS[8])
+        assert not table.exact
+        monkeypatch.setattr(stud_equity, "EXACT_LIMIT", 100_000)
+        exact = StudEquity(2, [cards(13, 26, 5, 8), cards(2, 3, 4)])
+        assert exact.exact
+        for seat in range(2):
+            p = exact.equities()[seat]
+            assert abs(updated[seat] - p) < 4 * math.sqrt(p * (1 - p) / 8_000)
+
+    def test_samples_hold_revealed_cards(self):
+        """Test that every sample keeps the revealed card in the seat's slot and stays a permutation"""
+        table = StudEquity(3, samples=200, seed=2)
+        pool = set(range(1, 53))
+        first_slot = table._slots[1][0]
+        table.reveal(1, CARDS[30])
+        for order in table._completions:
+            assert order[first_slot] == 30
+            assert set(order) == pool
+        assert table._slots[1][0] == first_slot + 1
+
+    def test_switches_to_exact(self):
+        """Test that the table enumerates once the remaining deals are few enough"""
+        rng = random.Random(3)
+        deck = Deck(rng)
+        hands = [deck.random_deal(5) for _ in range(2)]
+        steps = list(replay(hands, samples=500, seed=3))
+        assert len(steps) == 8
+        seat, card, shares = steps[-1]
+        assert (seat, card) == (1, hands[1][4])
+        assert sum(shares) == pytest.approx(1.0)
+        # Only the two down cards are unknown at the end: 44 * 43 deals.
+        table = StudEquity(2, [hands[0][1:], hands[1][1:]])
+        assert table.exact and len(table._completions) == 44 * 43
+        assert shares == pytest.approx(table.equities())
+
+    def test_fold(self):
+        """Test that a folded seat's share goes to the others"""
+        table = StudEquity(3, [cards(13, 26), cards(2, 3), cards(40, 41)], samples=500, seed=4)
+        shares = table.fold(0)
+        assert shares[0] == 0.0
+        assert sum(shares) == pytest.approx(1.0)
+        with pytest.raises(ValueError):
+            table.fold(0)
+        table.fold(1)
+        assert table.equities() == pytest.approx([0.0, 0.0, 1.0])
+        with pytest.raises(ValueError):
+            table.fold(2)
+
+    def test_rejects_bad_reveals(self):
+        """Test that seen cards and full hands cannot be revealed"""
+        table = StudEquity(2, [cards(1, 2, 3, 4, 5), cards(14)], samples=100, seed=5)
+        with pytest.raises(ValueError):
+            table.reveal(0, CARDS[20])
+        with pytest.raises(ValueError):
+            table.reveal(1, CARDS[3])
+        with pytest.raises(ValueError):
+            table.reveal(2, CARDS[20])
+        with pytest.raises(ValueError):
+            StudEquity(2, [cards(1), cards(1)])
+        with pytest.raises(ValueError):
+            StudEquity(11)
@@ -0,0 +1,110 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model.tournament import Tournament, play_tables
+
+
+def names(count: int) -> list[str]:
+    return [f"Player{i}" for i in range(count)]
+
+
+class TestTournament:
+    def test_initial_seating_is_balanced(self):
+        """Test that players are spread evenly over the fewest tables"""
+        tournament = Tournament(names(95), table_size=10, seed=1)
+        sizes = [len(table) for table in tournament.tables]
+        assert len(sizes) == 10
+        assert max(sizes) - min(sizes) <= 1
+        assert sorted(name for table in tournament.tables for name in table) == sorted(names(95))
+
+    def test_play_tables_returns_winning_seats(self):
+        """Test that every table reports at least one valid winning seat"""
+        results = play_tables([2, 6, 10])
+        assert len(results) == 3
+        for size, winners in zip([2, 6, 10], results):
+            assert winners and all(0 <= seat < size for seat in winners)
+
+    def test_play_tables_seeded(self):
+        """Test that seeded tables deal the same hands every time"""
+        seeds = list(range(20))
+        assert play_tables([2, 6, 10] * 20, seeds * 3) == play_tables([2, 6, 10] * 20, seeds * 3)
+
+    def test_same_seed_same_standings(self):
+        """Test that a seeded tournament replays exactly, inline or on a process pool"""
+        first = Tournament(names(40), starting_chips=100, ante=25, seed=8)
+        second = Tournament(names(40), starting_chips=100, ante=25, seed=8)
+        pooled = Tournament(names(40), starting_chips=100, ante=25, processes=2, seed=8)
+        for _ in range(5):
+            first.play_round()
+            second.play_round()
+        assert first.leaderboard(40) == second.leaderboard(40)
+        standings = first.run()
+        assert second.run() == standings
+        assert pooled.run() == standings
+        assert Tournament(names(40), starting_chips=100, ante=25, seed=9).run() != standings
+
+    def test_chips_are_conserved(self):
+        """Test that rounds move chips between players without creating or losing any"""
+        tournament = Tournament(names(50), starting_chips=500, seed=2)
+        for _ in range(10):
+            tournament.play_round()
+            assert sum(tournament.chips(name) for name in names(50)) == 50 * 500
+
+    def test_tables_stay_balanced(self):
+        """Test that eliminations trigger table breaking and rebalancing"""
+        tournament = Tournament(names(60), table_size=6, starting_chips=100, ante=20, seed=3)
+        while tournament.remaining > 6:
+            tournament.play_round()
+            sizes = [len(table) for table in tournament.tables]
+            assert max(sizes) - min(sizes) <= 1
+            assert max(sizes) <= 6
+            assert len(sizes) == -(-tournament.remaining // 6)
+
+    def test_run_to_completion(self):
+        """Test that a tournament ends with one player holding every chip"""
+        tournament = Tournament(names(40), starting_chips=200, seed=4)
+        standings = tournament.run()
+        assert tournament.is_finished()
+        assert sorted(standings) == sorted(names(40))
+        assert tournament.chips(standings[0]) == 40 * 200
+        assert tournament.leaderboard(3) == [(standings[0], 40 * 200)]
+
+    def test_leaderboard_ordered_by_chips(self):
+        """Test that the leaderboard lists the biggest stacks first"""
+        tournament = Tournament(names(30), seed=5)
+        for _ in range(3):
+            tournament.play_round()
+        leaders = tournament.leaderboard(5)
+        assert len(leaders) == 5
+        assert [chips for _, chips in leaders] == sorted((chips for _, chips in leaders), reverse=True)
+        assert leaders[0][1] == max(tournament.chips(name) for name in names(30))
+
+    def test_ante_doubles_each_level(self):
+        """Test the ante schedule"""
+        tournament = Tournament(names(20), ante=10, rounds_per_level=2, seed=6)
+        antes = []
+        for _ in range(5):
+            antes.append(tournament.ante)
+            tournament.play_round()
+        assert antes == [10, 10, 20, 20, 40]
+
+    def test_process_pool(self):
+        """Test that rounds can be spread over worker processes"""
+        tournament = Tournament(names(40), starting_chips=100, ante=25, processes=2, seed=7)
+        standings = tournament.run()
+        assert sorted(standings) == sorted(names(40))
+        assert tournament.chips(standings[0]) == 40 * 100
+
+    def test_invalid_arguments(self):
+        """Test that too few players or bad table sizes raise ValueError"""
+        with pytest.raises(ValueError):
+            Tournament(names(1))
+        with pytest.raises(ValueError):
+            Tournament(names(20), table_size=11)
+        with pytest.raises(ValueError):
+            Tournament(["Ann", "Bob", "Ann"])
+        with pytest.raises(ValueError):
+            Tournament(names(2)).chips("Nobody")
@@ -0,0 +1,87 @@
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from model import verify
+from model.hand import Hand
+
+
+class TestVerify:
+    def test_known_counts_cover_every_hand(self):
+        """Test that the published category counts add up to C(52, 5)"""
+        assert sum(verify.KNOWN_COUNTS.values()) == 2598960
+        assert set(verify.KNOWN_COUNTS) == set(verify.CATEGORY_NAMES)
+
+    def test_rank_class_counts(self):
+        """Test that weighted rank multisets reproduce the known category counts"""
+        counts = verify.rank_class_counts()
+        assert verify.mismatches(counts) == []
+        assert counts[Hand.STRAIGHT] == 10200
+        assert counts[Hand.STRAIGHT_FLUSH] == 36
+
+    def test_mismatches_reports_differences(self):
+        """Test that a wrong count is described by category name"""
+        counts = dict(verify.KNOWN_COUNTS)
+        counts[Hand.STRAIGHT] -= 1020
+        assert verify.mismatches(counts) == ["Straight: expected 10200, got 9180"]
+
+    def test_ordering_problems(self):
+        """Test that merged or reversed Hand values are reported for an engine"""
+        assert verify.ordering_problems({((1, 2), 10), ((1, 3), 20), ((2, 0), 21)}) == []
+        merged = verify.ordering_problems({((1, 2), 10), ((1, 3), 10)})
+        assert merged == ["(1, 3) beats (1, 2) but scores 10, not above 10"]
+        split = verify.ordering_problems({((1, 2), 10), ((1, 2), 11)})
+        assert split == ["(1, 2) has engine values 10 and 11"]
+
+    def test_check_agrees_on_a_slice(self):
+        """Test that the draw engine orders one lowest-card slice of hands like Hand"""
+        categories, values, pairs = verify._check(44)
+        assert sum(categories.values()) == 35
+        assert {reference for reference, _ in pairs["draw"]} == values
+        assert verify.ordering_problems(pairs["draw"]) == []
+        assert verify.ordering_problems(pairs["reference"]) == []
+
+    def test_reference_catches_merged_hand_values(self):
+        """Test that the reference engine reports hands Hand ties but should not"""
+        cards = {(card.rankstr, card.suit): card for card in verify.Deck()._deck.values()}
+        kings = tuple(cards[key] for key in (("5", "♠"), ("5", "♥"), ("A", "♦"), ("K", "♣"), ("3", "♠")))
+        queens = tuple(cards[key] for key in (("5", "♣"), ("5", "♦"), ("A", "♠"), ("Q", "♥"), ("3", "♦")))
+        assert verify._reference_value(queens) < verify._reference_value(kings)
+        # Both hands once had the value (ONE_PAIR, 5, 5, 5, 3, -1).
+        merged = (Hand.ONE_PAIR, 5, 5, 5, 3, -1)
+        assert verify.ordering_problems({(merged, verify._reference_value(kings)), (merged, verify._reference_value(queens))})
+        assert verify.ordering_problems({(Hand(list(hand))._hand_value, verify._reference_value(hand)) for hand in (kings, queens)}) == []
+
+    def test_check_catches_a_broken_engine(self, monkeypatch):
+        """Test that an engine scoring every hand alike is reported"""
+        monkeypatch.setitem(verify.ENGINES, "flat", lambda cards: 0)
+        _, _, pairs = verify._check(44)
+        assert verify.ordering_problems(pairs["flat"])
+
+    def test_cached_run_reuses_result(self, tmp_path, monkeypatch):
+        """Test that a saved result is reused until the source hash changes"""
+        result = {"source": verify.source_hash(), "problems": []}
+        monkeypatch.setattr(verify, "run", lambda processes=1: result)
+        assert verify.cached_run(cache_dir=str(tmp_path)) == result
+        assert len(list(tmp_path.iterdir())) == 1
+
+        def fail(processes=1):
+            raise AssertionError("cached result was not used")
+
+        monkeypatch.setattr(verify, "run", fail)
+        assert verify.cached_run(cache_dir=str(tmp_path)) == result
+        monkeypatch.setitem(verify.ENGINES, "other", lambda cards: 0)
+        with pytest.raises(AssertionError):
+            verify.cached_run(cache_dir=str(tmp_path))
+
+    @pytest.mark.skipif(not os.environ.get("POKER_EXHAUSTIVE"), reason="set POKER_EXHAUSTIVE=1 to evaluate all 2,598,960 hands")
+    def test_exhaustive_category_counts(self):
+        """Test every five-card hand against the known category counts"""
+        assert verify.mismatches(verify.category_counts()) == []
+
+    @pytest.mark.skipif(not os.environ.get("POKER_EXHAUSTIVE"), reason="set POKER_EXHAUSTIVE=1 to evaluate all 2,598,960 hands")
+    def test_engines_match_hand_ordering(self):
+        """Test every engine against Hand's ordering over all hands, using the cached result if current"""
+        assert verify.cached_run(os.cpu_count() or 1)["problems"] == []
@@ -4,6 +4,9 @@ from PySide6.QtWidgets import QApplication
 from viewmodel.viewmodel import ViewModel
 import os
 
+# Where the GUI autosaves its game, restored on the next start after a crash or exit
+AUTOSAVE_PATH = os.path.join(os.path.expanduser("~"), ".poker_game_gui", "session.bin")
+
 
 class MainWindow:
 
@@ -19,7 +22,8 @@ class MainWindow:
         self.main_window.setFixedSize(self.main_window.size())
         self.ui_file.close()
 
-        self.viewmodel = ViewModel()
+        os.makedirs(os.path.dirname(AUTOSAVE_PATH), exist_ok=True)
+        self.viewmodel = ViewModel(autosave_path=AUTOSAVE_PATH)
 
         # Connect UI signals to MainWindow slots that call ViewModel methods
         self.main_window.pushButtonAddPlayer.clicked.connect(self.handle_add_player)
@@ -29,6 +33,7 @@ class MainWindow:
         self.main_window.pushButtonPlayGame.clicked.connect(self.handle_play_game)
         self.main_window.pushButtonRevealWinner.clicked.connect(self.handle_reveal_winner)
         self.main_window.actionRestart.triggered.connect(self.handle_restart)
+        self.main_window.checkBoxDrawGame.toggled.connect(self.viewmodel.set_game_of_draw)
 
         # Connect ViewModel signals to MainWindow slots that update the UI
         self.viewmodel.player_added.connect(self.on_player_added)
@@ -41,10 +46,23 @@ class MainWindow:
         self.viewmodel.error_occurred.connect(self.on_error)
 
         self.on_game_state_changed("Game setup in progress")
+        self.restore_session()
 
     def show(self):
         self.center_dialog(self.main_window)
         self.main_window.show()
+        # A restored game still owes a look at their cards to each player who has not had their draw
+        if self.viewmodel.get_game_state() == "playing" or (
+            self.viewmodel.get_game_state() in ["reveal", "drawreveal"] and self.viewmodel.get_game_of_draw()
+        ):
+            self.show_dealt_dialogs()
+
+    def restore_session(self):
+        # Restore the autosaved game; resume() re-adds its players to the list
+        if not self.viewmodel.resume():
+            return
+        self.main_window.checkBoxDrawGame.setChecked(self.viewmodel.get_game_of_draw())
+        self.update_checkbox_state()
 
     """
     Dialog Box Section
@@ -69,7 +87,7 @@ class MainWindow:
         def show_hand_dialog_chooser():
             nonlocal have_seen_cards
             have_seen_cards = True
-            if self.viewmodel.get_game_state() == "drawreveal":
+            if self.viewmodel.get_game_state() == "drawreveal" or self.viewmodel.has_exchanged(name):
                 self.viewmodel.show_hand(name)
             elif self.main_window.checkBoxDrawGame.isChecked():
                 self.viewmodel.set_game_state("drawreveal")
@@ -149,7 +167,10 @@ class MainWindow:
         dialog.checkBox_4.toggled.connect(lambda checked: update_label_color(dialog.checkBox_4, dialog.labelCard_4))
         dialog.checkBox_5.toggled.connect(lambda checked: update_label_color(dialog.checkBox_5, dialog.labelCard_5))
 
+        exchanged = False
+
         def on_exchange():
+            nonlocal exchanged
             selected_cards = []
             if dialog.checkBox_1.isChecked():
                 selected_cards.append(dialog.labelCard_1.text())
@@ -165,14 +186,22 @@ class MainWindow:
             if len(selected_cards) > 3:
                 self.viewmodel.error_occurred.emit("You can only exchange up to 3 cards total")
             else:
+                exchanged = True
                 self.viewmodel.exchange_cards(player, selected_cards)
                 dialog.close()
 
         dialog.pushButtonExchange.clicked.connect(on_exchange)
 
+        # Hint the best exchange from the precomputed draw table
+        suggested = self.viewmodel.suggest_exchange(player)
+        hint = "Suggested: " + (" ".join(suggested) if suggested else "keep all cards")
+        dialog.pushButtonExchange.setToolTip(hint)
+
         ui_file.close()
         self.center_dialog(dialog)
         dialog.exec()
+        if not exchanged:
+            self.viewmodel.stand_pat(player)
 
     def show_display_winner_dialog(self, num_of_winners, winners, losers):
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -257,14 +286,19 @@ class MainWindow:
 
             # Game state is "ready"
             self.viewmodel.deal_cards()
+            self.show_dealt_dialogs()
 
-            for i in range(self.main_window.listWidgetPlayers.count()):
-                item = self.main_window.listWidgetPlayers.item(i)
-                name = item.text()
-                # set to reveal for each player since status may be drawgame
-                self.viewmodel.set_game_state("reveal")
-                self.show_dealt_dialog(name)
-            self.viewmodel.game_state_changed.emit("Ready to reveal winner")
+    def show_dealt_dialogs(self):
+        for i in range(self.main_window.listWidgetPlayers.count()):
+            item = self.main_window.listWidgetPlayers.item(i)
+            name = item.text()
+            # A player restored after their draw has already seen their final hand
+            if self.viewmodel.get_game_of_draw() and self.viewmodel.has_exchanged(name):
+                continue
+            # set to reveal for each player since status may be drawgame
+            self.viewmodel.set_game_state("reveal")
+            self.show_dealt_dialog(name)
+        self.viewmodel.game_state_changed.emit("Ready to reveal winner")
 
     @Slot()
     def handle_reveal_winner(self):
@@ -1,5 +1,7 @@
 from PySide6.QtCore import QObject, Signal
 from model.game import PokerGame
+from model import snapshot
+import os
 
 
 class ViewModel(QObject):
@@ -13,13 +15,33 @@ class ViewModel(QObject):
     game_state_changed = Signal(str)
     error_occurred = Signal(str)
 
-    def __init__(self):
+    def __init__(self, autosave_path: str | None = None):
         super().__init__()
         self._game = PokerGame()
+        self._autosave_path = autosave_path
+        if autosave_path:
+            self._game.set_autosave(snapshot.autosave_to(autosave_path))
+
+    def resume(self) -> bool:
+        # Restore the game saved by autosave, if there is one
+        if not self._autosave_path or not os.path.exists(self._autosave_path):
+            return False
+        try:
+            game = snapshot.load(self._autosave_path)
+        except ValueError:
+            self.error_occurred.emit("Saved game could not be restored")
+            return False
+
+        game.set_autosave(snapshot.autosave_to(self._autosave_path))
+        self._game = game
+        for name in self.players:
+            self.player_added.emit(name)
+        self.game_state_changed.emit("Game restored")
+        return True
 
     @property
     def players(self):
-        return [player._name for player in self._game._players_hands.keys()]
+        return self._game.player_names()
 
     def get_game_state(self):
         return self._game.state
@@ -34,7 +56,7 @@ class ViewModel(QObject):
             self.error_occurred.emit("Player name cannot be empty")
             return False
 
-        if player_name in self.players:
+        if self._game.has_player(player_name):
             self.error_occurred.emit(f"Player '{player_name}' already exists")
             return False
 
@@ -43,26 +65,18 @@ class ViewModel(QObject):
         self.player_added.emit(player_name)
 
         # Update game state if we have enough players
-        if len(self.players) >= 2:
+        if self._game.num_players >= 2:
             self._game.state = "ready"
             self.game_state_changed.emit("Game is ready to play")
 
         return True
 
     def remove_player(self, player_name: str) -> bool:
-        # Find the Player object with this name
-        player_to_remove = None
-        for player in self._game._players_hands.keys():
-            if player._name == player_name:
-                player_to_remove = player
-                break
-
-        if player_to_remove:
-            del self._game._players_hands[player_to_remove]
+        if self._game.remove_player(player_name):
             self.player_removed.emit(player_name)
 
             # Update game state if we don't have enough players
-            if len(self.players) < 2:
+            if self._game.num_players < 2:
                 self._game.state = "setup"
             return True
         else:
@@ -70,7 +84,7 @@ class ViewModel(QObject):
         return False
 
     def deal_cards(self):
-        if len(self.players) < 2:
+        if self._game.num_players < 2:
             self.error_occurred.emit("Need at least 2 players to start")
             return
 
@@ -85,7 +99,7 @@ class ViewModel(QObject):
         return
 
     def get_game_of_draw(self):
-        self._game.get_game_of_draw()
+        return self._game.get_game_of_draw()
 
     def set_game_of_draw(self, game_of_draw: bool):
         self._game.set_game_of_draw(game_of_draw)
@@ -94,6 +108,16 @@ class ViewModel(QObject):
         hand_list = self._game.exchange_cards(player, selected_cards)
         self.cards_exchanged.emit(hand_list)
 
+    def stand_pat(self, player):
+        # Record that the player kept their hand, so a restored game does not offer the draw again
+        self._game.exchange_cards(player, [])
+
+    def has_exchanged(self, name) -> bool:
+        return self._game.has_exchanged(self._game.get_player(name))
+
+    def suggest_exchange(self, player) -> list[str]:
+        return self._game.suggest_exchange(player)
+
     def show_hand(self, name):
         # get Player object to pass to show_hand()
         player = self._game.get_player(name)